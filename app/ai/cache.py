@@ -0,0 +1,137 @@
+import asyncio
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Awaitable, Callable, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from app.core.disk_sweep import SweepSchedule, sweep_directory
+from app.core.metrics import TAILORING_CACHE_REQUESTS
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def tailoring_key(
+    part: str, model: str, prompt_version: int, *fingerprints: str
+) -> str:
+    h = hashlib.sha256(f"{part}|{model}|p{prompt_version}".encode())
+    for item in fingerprints:
+        h.update(f"|{item}".encode())
+    return h.hexdigest()
+
+
+class TailoringCache:
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int,
+        directory: Path | None = None,
+        disk_max_bytes: int | None = None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.directory = directory
+        self.disk_max_bytes = disk_max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, BaseModel]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._schedule = SweepSchedule(disk_max_bytes, ttl_seconds)
+
+        if directory is not None:
+            directory.mkdir(parents=True, exist_ok=True)
+            self.sweep()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _remember(self, key: str, value: BaseModel, expires_at: float) -> None:
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key: str, model: type[M]) -> M | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at >= time.monotonic():
+                self._entries.move_to_end(key)
+                return value
+            del self._entries[key]
+
+        # The disk tier is shared between server worker processes.
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            age = time.time() - path.stat().st_mtime
+            if age > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                return None
+            value = model.model_validate_json(path.read_bytes())
+        except (OSError, ValidationError):
+            return None
+        self._remember(key, value, time.monotonic() + self.ttl_seconds - age)
+        return value
+
+    def put(self, key: str, value: BaseModel) -> None:
+        self._remember(key, value, time.monotonic() + self.ttl_seconds)
+
+        if self.directory is None:
+            return
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        content = value.model_dump_json().encode()
+        try:
+            path.parent.mkdir(exist_ok=True)
+            tmp.write_bytes(content)
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            return
+        if self._schedule.wrote(len(content)):
+            self.sweep()
+
+    def sweep(self) -> int:
+        """Delete expired entries from disk, then the oldest over the budget.
+
+        Returns the number of bytes removed.
+        """
+        if self.directory is None:
+            return 0
+        return sweep_directory(
+            self.directory, "*/*.json", self.disk_max_bytes, self.ttl_seconds
+        )
+
+    def _settle(self, key: str, task: asyncio.Task) -> None:
+        self._inflight.pop(key, None)
+        if not task.cancelled() and task.exception() is None:
+            self.put(key, task.result())
+
+    async def get_or_create(
+        self, key: str, model: type[M], factory: Callable[[], Awaitable[M]]
+    ) -> M:
+        value = self.get(key, model)
+        if value is not None:
+            self.hits += 1
+            TAILORING_CACHE_REQUESTS.inc(result="hit")
+            return value
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            TAILORING_CACHE_REQUESTS.inc(result="miss")
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._settle(key, t))
+        else:
+            self.hits += 1
+            TAILORING_CACHE_REQUESTS.inc(result="coalesced")
+
+        # Shielded so one caller going away does not cancel the shared upstream call.
+        return await asyncio.shield(task)
@@ -10,8 +10,36 @@ class OpenAISettings(BaseSettings):
     openai_api_key: str = Field(..., validation_alias="OPENAI_API_KEY")
     openai_base_url: AnyUrl = Field(default="https://api.openai.com/v1")
 
+    openai_timeout_seconds: float = Field(default=60.0, gt=0)
+    openai_connect_timeout_seconds: float = Field(default=5.0, gt=0)
+    openai_max_connections: int = Field(default=32, ge=1)
+    openai_max_keepalive_connections: int = Field(default=16, ge=0)
+
+    openai_max_retries: int = Field(default=3, ge=0)
+    openai_retry_base_delay: float = Field(default=0.5, ge=0)
+    openai_retry_max_delay: float = Field(default=8.0, ge=0)
+    # Covers every attempt and backoff of one call, not just a single attempt.
+    openai_total_deadline_seconds: float | None = Field(default=120.0, gt=0)
+
+    openai_max_concurrency: int = Field(default=16, ge=1)
+    openai_requests_per_minute: float | None = Field(default=None, gt=0)
+
+    openai_hedge_after_seconds: float | None = Field(default=None, gt=0)
+    openai_hedge_calls: set[str] = Field(default_factory=lambda: {"exp_edu"})
+
     model_config = SettingsConfigDict(
         env_file=str(Path(__file__).with_name(".env")),
         env_file_encoding="utf-8",
         case_sensitive=False,
     )
+
+
+class TailoringCacheSettings(BaseSettings):
+    ttl_seconds: float = Field(default=24 * 60 * 60, gt=0)
+    max_entries: int = Field(default=2048, ge=1)
+    dir: Path | None = None
+    disk_max_bytes: int | None = Field(default=256 * 1024 * 1024, ge=0)
+
+    model_config = SettingsConfigDict(
+        env_prefix="TAILORING_CACHE_", case_sensitive=False
+    )
@@ -1,8 +1,14 @@
 from functools import cache
+from typing import TYPE_CHECKING, Annotated, Any
 
-from openai import AsyncOpenAI
+from fastapi import Depends
 
-from app.ai.config import OpenAISettings
+from app.ai.cache import TailoringCache
+from app.ai.config import OpenAISettings, TailoringCacheSettings
+from app.ai.resilience import ResilientCaller
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
 
 
 @cache
@@ -10,10 +16,45 @@ def get_openai_settings() -> OpenAISettings:
     return OpenAISettings()
 
 
+# The SDK (and httpx) are imported on first use so that processes which never
+# serve an AI route do not pay for them at startup.
 @cache
-def get_openai_client() -> AsyncOpenAI:
+def get_openai_client() -> "AsyncOpenAI":
+    import httpx
+    from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
     cfg = get_openai_settings()
     return AsyncOpenAI(
         api_key=cfg.openai_api_key,
         base_url=str(cfg.openai_base_url) if cfg.openai_base_url else None,
+        timeout=httpx.Timeout(
+            cfg.openai_timeout_seconds, connect=cfg.openai_connect_timeout_seconds
+        ),
+        # Retries are owned by ResilientCaller so they share its limiter.
+        max_retries=0,
+        http_client=DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=cfg.openai_max_connections,
+                max_keepalive_connections=cfg.openai_max_keepalive_connections,
+            )
+        ),
+    )
+
+
+AIClient = Annotated[Any, Depends(get_openai_client)]
+
+
+@cache
+def get_openai_caller() -> ResilientCaller:
+    return ResilientCaller(get_openai_settings())
+
+
+@cache
+def get_tailoring_cache() -> TailoringCache:
+    cfg = TailoringCacheSettings()
+    return TailoringCache(
+        ttl_seconds=cfg.ttl_seconds,
+        max_entries=cfg.max_entries,
+        directory=cfg.dir,
+        disk_max_bytes=cfg.disk_max_bytes,
     )
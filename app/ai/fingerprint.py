@@ -0,0 +1,10 @@
+import hashlib
+
+from pydantic import BaseModel
+
+
+def fingerprint(model: BaseModel, include: dict | None = None) -> str:
+    # Hashes exactly what build_message serialises, so two inputs share a
+    # fingerprint only when the upstream call would see identical data.
+    payload = model.model_dump_json(include=include, exclude_none=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
@@ -1,6 +1,12 @@
-from openai import AsyncOpenAI
+import logging
+import time
+from typing import TYPE_CHECKING
 
 from app.ai.config import MODEL
+from app.ai.dependencies import get_openai_caller
+from app.ai.prompts import PROMPT_VERSION
+from app.core.metrics import OPENAI_CALL_SECONDS, OPENAI_TOKENS
+from app.core.timing import span
 from app.ai.prompts.system import (
     SYSTEM_PROMPT_EXP_EDU,
     SYSTEM_PROMPT_SKILL_PROJ_CERT,
@@ -19,67 +25,153 @@ from app.models.tailored_profile import (
     TailoredSummary,
 )
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+logger = logging.getLogger(__name__)
+
+# The slice of USER_PROFILE each call actually reads. Identifiers, contact
+# details and timestamps are never sent.
+PROFILE_EXP_EDU = {
+    "professional_title": True,
+    "summary": True,
+    "experiences": True,
+    "education": True,
+    "skills": {"__all__": {"name"}},
+    "projects": {"__all__": {"name", "tech_stack"}},
+}
+PROFILE_SKILL_PROJ_CERT = {
+    "professional_title": True,
+    "experiences": {"__all__": {"job_title", "description"}},
+    "skills": True,
+    "projects": True,
+    "certificates": True,
+}
+PROFILE_SUMMARY = {
+    "professional_title": True,
+    "summary": True,
+    "experiences": {
+        "__all__": {"job_title", "company", "start_date", "end_date", "description"}
+    },
+    "education": {"__all__": {"degree", "school", "field_of_study"}},
+    "skills": True,
+    "projects": {"__all__": {"name", "description", "tech_stack"}},
+    "certificates": {"__all__": {"name", "issuer"}},
+}
+
 
 def build_message(
-    job: JobPosting, resume: ResumePayload, system: str, instructions: str
+    job: JobPosting,
+    resume: ResumePayload,
+    system: str,
+    instructions: str,
+    profile_fields: dict | None = None,
 ) -> list[dict]:
+    # Ordered from most to least stable so the static prompts, then the job,
+    # form a prefix the upstream prompt cache can reuse.
     return [
         {"role": "system", "content": system},
         {"role": "user", "content": instructions},
         {
             "role": "user",
-            "content": "JOB_POSTING:\n"
-            + job.model_dump_json(indent=2, exclude_none=True),
+            "content": "JOB_POSTING:\n" + job.model_dump_json(exclude_none=True),
         },
         {
             "role": "user",
             "content": "USER_PROFILE:\n"
-            + resume.model_dump_json(indent=2, exclude_none=True),
+            + resume.model_dump_json(include=profile_fields, exclude_none=True),
         },
     ]
 
 
+async def _parse(
+    ai_client: "AsyncOpenAI", call: str, messages: list[dict], text_format: type
+):
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        with span("openai." + call, model=MODEL):
+            response = await get_openai_caller().call(
+                call,
+                lambda: ai_client.responses.parse(
+                    model=MODEL,
+                    input=messages,
+                    text_format=text_format,
+                    prompt_cache_key=f"{call}-v{PROMPT_VERSION}",
+                ),
+            )
+        outcome = "ok"
+    finally:
+        OPENAI_CALL_SECONDS.observe(
+            time.perf_counter() - started, call=call, outcome=outcome
+        )
+
+    usage = getattr(response, "usage", None)
+    if usage is not None:
+        details = getattr(usage, "input_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", 0) or 0
+        OPENAI_TOKENS.observe(usage.input_tokens, call=call, kind="input")
+        OPENAI_TOKENS.observe(cached_tokens, call=call, kind="cached")
+        OPENAI_TOKENS.observe(usage.output_tokens, call=call, kind="output")
+        logger.info(
+            "tailoring call %s: input_tokens=%s cached_tokens=%s output_tokens=%s",
+            call,
+            usage.input_tokens,
+            cached_tokens,
+            usage.output_tokens,
+        )
+    return response.output_parsed
+
+
 async def generate_tailored_exp_edu(
-    job: JobPosting, resume: ResumePayload, ai_client: AsyncOpenAI
+    job: JobPosting, resume: ResumePayload, ai_client: "AsyncOpenAI"
 ):
     messages = build_message(
         job=job,
         resume=resume,
         system=SYSTEM_PROMPT_EXP_EDU,
         instructions=GUIDELINES_EXP_EDU,
+        profile_fields=PROFILE_EXP_EDU,
     )
-    response = await ai_client.responses.parse(
-        model=MODEL,
-        input=messages,
-        text_format=TailoredExperienceEducation,
-    )
-    return response.output_parsed
+    return await _parse(ai_client, "exp_edu", messages, TailoredExperienceEducation)
 
 
 async def generate_tailored_skill_proj_cert(
-    job: JobPosting, resume: ResumePayload, ai_client: AsyncOpenAI
+    job: JobPosting, resume: ResumePayload, ai_client: "AsyncOpenAI"
 ):
     messages = build_message(
         job=job,
         resume=resume,
         system=SYSTEM_PROMPT_SKILL_PROJ_CERT,
         instructions=GUIDELINES_SKL_PROJ_CERT,
+        profile_fields=PROFILE_SKILL_PROJ_CERT,
     )
-    response = await ai_client.responses.parse(
-        model=MODEL,
-        input=messages,
-        text_format=TailoredSkillProjectCertificate,
+    return await _parse(
+        ai_client, "skill_proj_cert", messages, TailoredSkillProjectCertificate
     )
-    return response.output_parsed
 
 
 async def generate_tailored_summary(
-    job: JobPosting, resume: ResumePayload, ai_client: AsyncOpenAI
+    job: JobPosting, resume: ResumePayload, ai_client: "AsyncOpenAI"
 ):
     messages = build_message(
-        job=job, resume=resume, system=SYSTEM_SUMMARY, instructions=GUIDELINES_SUMMARY
-    )
-    response = await ai_client.responses.parse(
-        model=MODEL, input=messages, text_format=TailoredSummary
+        job=job,
+        resume=resume,
+        system=SYSTEM_SUMMARY,
+        instructions=GUIDELINES_SUMMARY,
+        profile_fields=PROFILE_SUMMARY,
     )
-    return response.output_parsed
+    return await _parse(ai_client, "summary", messages, TailoredSummary)
+
+
+PROFILE_SLICES = {
+    generate_tailored_exp_edu: PROFILE_EXP_EDU,
+    generate_tailored_skill_proj_cert: PROFILE_SKILL_PROJ_CERT,
+    generate_tailored_summary: PROFILE_SUMMARY,
+}
+
+PART_MODELS = {
+    generate_tailored_exp_edu: TailoredExperienceEducation,
+    generate_tailored_skill_proj_cert: TailoredSkillProjectCertificate,
+    generate_tailored_summary: TailoredSummary,
+}
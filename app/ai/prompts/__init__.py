@@ -0,0 +1 @@
+PROMPT_VERSION = 2
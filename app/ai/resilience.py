@@ -0,0 +1,159 @@
+import asyncio
+import logging
+import random
+import time
+from functools import cache
+from typing import Any, Awaitable, Callable
+
+from app.ai.config import OpenAISettings
+from app.core.metrics import OPENAI_HEDGES, OPENAI_RETRIES
+
+logger = logging.getLogger(__name__)
+
+
+@cache
+def retryable() -> tuple[type[BaseException], ...]:
+    import openai
+
+    return (
+        openai.RateLimitError,
+        openai.APITimeoutError,
+        openai.APIConnectionError,
+        openai.InternalServerError,
+        TimeoutError,
+    )
+
+
+class TokenBucket:
+    def __init__(self, rate_per_second: float, capacity: float):
+        self.rate = rate_per_second
+        self.capacity = capacity
+        self.tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def _retry_after(err: BaseException) -> float | None:
+    response = getattr(err, "response", None)
+    if response is None:
+        return None
+    headers = response.headers
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+    except ValueError:
+        pass
+    return None
+
+
+class ResilientCaller:
+    def __init__(self, settings: OpenAISettings):
+        self.settings = settings
+        self._semaphore = asyncio.Semaphore(settings.openai_max_concurrency)
+        self._bucket = None
+        if settings.openai_requests_per_minute:
+            self._bucket = TokenBucket(
+                settings.openai_requests_per_minute / 60,
+                capacity=settings.openai_max_concurrency,
+            )
+
+    def _backoff(self, attempt: int, err: BaseException) -> float:
+        cfg = self.settings
+        # Full jitter, unless the server told us exactly how long to wait.
+        delay = _retry_after(err)
+        if delay is None:
+            ceiling = cfg.openai_retry_base_delay * 2**attempt
+            delay = random.uniform(0, min(cfg.openai_retry_max_delay, ceiling))
+        return min(delay, cfg.openai_retry_max_delay)
+
+    async def _attempt(self, factory: Callable[[], Awaitable[Any]]) -> Any:
+        async with self._semaphore:
+            if self._bucket is not None:
+                await self._bucket.acquire()
+            async with asyncio.timeout(self.settings.openai_timeout_seconds):
+                return await factory()
+
+    async def _hedged(self, call: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        # A duplicate is only sent once the first attempt has been slow for
+        # hedge_after_seconds; whichever succeeds first wins.
+        pending = {asyncio.ensure_future(self._attempt(factory))}
+        try:
+            done, pending = await asyncio.wait(
+                pending, timeout=self.settings.openai_hedge_after_seconds
+            )
+            if not done:
+                OPENAI_HEDGES.inc(call=call)
+                logger.info("hedging slow %s call", call)
+                pending.add(asyncio.ensure_future(self._attempt(factory)))
+            while True:
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                if not pending:
+                    return done.pop().result()
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def call(self, call: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        cfg = self.settings
+        deadline = None
+        if cfg.openai_total_deadline_seconds:
+            deadline = (
+                asyncio.get_running_loop().time() + cfg.openai_total_deadline_seconds
+            )
+        async with asyncio.timeout_at(deadline):
+            return await self._retrying(call, factory, deadline)
+
+    async def _retrying(
+        self,
+        call: str,
+        factory: Callable[[], Awaitable[Any]],
+        deadline: float | None,
+    ) -> Any:
+        cfg = self.settings
+        hedge = cfg.openai_hedge_after_seconds and call in cfg.openai_hedge_calls
+        attempt = 0
+        while True:
+            try:
+                if hedge:
+                    return await self._hedged(call, factory)
+                return await self._attempt(factory)
+            except retryable() as err:
+                if attempt >= cfg.openai_max_retries:
+                    raise
+                delay = self._backoff(attempt, err)
+                # No point sleeping into the deadline just to be cancelled.
+                if (
+                    deadline is not None
+                    and asyncio.get_running_loop().time() + delay >= deadline
+                ):
+                    raise
+                attempt += 1
+                OPENAI_RETRIES.inc(call=call, reason=type(err).__name__)
+                logger.warning(
+                    "tailoring call %s failed (%s), retry %d in %.2fs",
+                    call,
+                    type(err).__name__,
+                    attempt,
+                    delay,
+                )
+                await asyncio.sleep(delay)
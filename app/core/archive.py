@@ -0,0 +1,56 @@
+import io
+import re
+import zipfile
+from io import BytesIO
+from typing import AsyncIterable, AsyncIterator
+
+_UNSAFE_NAME = re.compile(r"(?:[^\w.-]|_|\.{2,})+")
+MAX_NAME_LENGTH = 100
+
+
+# Client-supplied names become one path component: separators turn into "_"
+# as do runs of dots, and leading dots are dropped, so ".." cannot appear.
+def safe_filename(name: str, default: str = "resume") -> str:
+    cleaned = _UNSAFE_NAME.sub("_", name)[:MAX_NAME_LENGTH].strip("._")
+    return cleaned or default
+
+
+def build_zip(entries: dict[str, bytes]) -> bytes:
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_STORED) as zf:
+        for name, content in entries.items():
+            zf.writestr(name, content)
+    return buf.getvalue()
+
+
+class _ChunkSink(io.RawIOBase):
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._pos = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._chunks.append(bytes(b))
+        self._pos += len(b)
+        return len(b)
+
+    def tell(self) -> int:
+        return self._pos
+
+    def drain(self) -> bytes:
+        out = b"".join(self._chunks)
+        self._chunks.clear()
+        return out
+
+
+async def stream_zip(entries: AsyncIterable[tuple[str, bytes]]) -> AsyncIterator[bytes]:
+    # The sink is not seekable, so zipfile writes data descriptors and every
+    # entry can be flushed to the client as soon as it has been added.
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_STORED) as zf:
+        async for name, content in entries:
+            zf.writestr(name, content)
+            yield sink.drain()
+    yield sink.drain()
@@ -0,0 +1,107 @@
+import math
+import os
+from pathlib import Path
+from typing import Literal
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+def available_cpus() -> int:
+    # os.cpu_count() reports the host; containers are limited by CPU affinity
+    # and the cgroup quota, whichever is smaller.
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+
+    for quota_path, period_path in (
+        ("/sys/fs/cgroup/cpu.max", None),
+        (
+            "/sys/fs/cgroup/cpu/cpu.cfs_quota_us",
+            "/sys/fs/cgroup/cpu/cpu.cfs_period_us",
+        ),
+    ):
+        try:
+            values = Path(quota_path).read_text().split()
+            if period_path is not None:
+                values.append(Path(period_path).read_text().strip())
+            quota, period = values[0], values[1]
+            if quota not in ("max", "-1"):
+                return max(1, min(cpus, math.ceil(int(quota) / int(period))))
+        except (OSError, ValueError, IndexError):
+            continue
+    return cpus
+
+
+def private_dir(path: Path) -> Path:
+    """Create path with mode 0700, or check that an existing one is private.
+
+    Caches that are unpickled or served back must not be writable by other
+    users, so a directory someone else created first is refused.
+    """
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    st = path.stat()
+    if st.st_uid != os.geteuid() or st.st_mode & 0o022:
+        raise PermissionError(
+            f"{path} must be owned by this user and not writable by others"
+        )
+    return path
+
+
+class RenderSettings(BaseSettings):
+    executor: Literal["thread", "process"] = "process"
+    workers: int = Field(default_factory=available_cpus, ge=1)
+    max_queue: int = Field(default=16, ge=0)
+    timeout_seconds: float = Field(default=30.0, gt=0)
+    cache_max_bytes: int = Field(default=64 * 1024 * 1024, ge=0)
+    cache_dir: Path | None = None
+    cache_disk_max_bytes: int | None = Field(default=1024 * 1024 * 1024, ge=0)
+    warmup: bool = True
+    warm_examples: bool = True
+    paragraph_cache_entries: int = Field(default=10_000, ge=0)
+
+    model_config = SettingsConfigDict(env_prefix="RENDER_", case_sensitive=False)
+
+
+class ProfileStoreSettings(BaseSettings):
+    ttl_seconds: float = Field(default=7 * 24 * 60 * 60, gt=0)
+    max_entries: int = Field(default=1024, ge=1)
+    dir: Path | None = None
+    disk_max_bytes: int | None = Field(default=256 * 1024 * 1024, ge=0)
+
+    model_config = SettingsConfigDict(env_prefix="PROFILE_STORE_", case_sensitive=False)
+
+
+class BatchSettings(BaseSettings):
+    concurrency: int = Field(default=4, ge=1)
+    max_items: int = Field(default=200, ge=1)
+
+    model_config = SettingsConfigDict(env_prefix="BATCH_", case_sensitive=False)
+
+
+class JobSettings(BaseSettings):
+    backend: Literal["memory", "sqlite"] = "memory"
+    sqlite_path: Path = Path("jobs.sqlite3")
+    concurrency: int = Field(default=2, ge=1)
+    max_queued: int = Field(default=1000, ge=1)
+    result_ttl_seconds: float = Field(default=60 * 60, gt=0)
+    lease_seconds: float = Field(default=15 * 60, gt=0)
+    drain_seconds: float = Field(default=30.0, ge=0)
+    webhook_timeout_seconds: float = Field(default=10.0, gt=0)
+    # Empty: any host that resolves only to public addresses.
+    webhook_allowed_hosts: set[str] = Field(default_factory=set)
+
+    model_config = SettingsConfigDict(env_prefix="JOBS_", case_sensitive=False)
+
+
+class ServerSettings(BaseSettings):
+    host: str = "0.0.0.0"
+    port: int = 8000
+    workers: int | None = Field(default=None, ge=1)
+    graceful_timeout_seconds: float = Field(default=30.0, ge=0)
+    # Shared caches, stored profiles and jobs; required with several workers.
+    data_dir: Path | None = None
+    reload: bool = False
+
+    model_config = SettingsConfigDict(env_prefix="SERVER_", case_sensitive=False)
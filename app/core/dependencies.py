@@ -0,0 +1,72 @@
+from functools import cache
+
+from app.core.config import (
+    BatchSettings,
+    JobSettings,
+    ProfileStoreSettings,
+    RenderSettings,
+)
+from app.core.fixtures import Fixtures, load_fixtures
+from app.core.jobs import JobQueue, MemoryJobBackend, SqliteJobBackend
+from app.core.pdf_cache import PdfCache
+from app.core.profile_store import ProfileStore
+from app.core.render_pool import RenderPool
+
+
+@cache
+def get_render_settings() -> RenderSettings:
+    return RenderSettings()
+
+
+@cache
+def get_render_pool() -> RenderPool:
+    return RenderPool(get_render_settings())
+
+
+@cache
+def get_fixtures() -> Fixtures:
+    return load_fixtures()
+
+
+@cache
+def get_pdf_cache() -> PdfCache:
+    cfg = get_render_settings()
+    return PdfCache(
+        max_bytes=cfg.cache_max_bytes,
+        directory=cfg.cache_dir,
+        disk_max_bytes=cfg.cache_disk_max_bytes,
+    )
+
+
+@cache
+def get_profile_store() -> ProfileStore:
+    cfg = ProfileStoreSettings()
+    return ProfileStore(
+        ttl_seconds=cfg.ttl_seconds,
+        max_entries=cfg.max_entries,
+        directory=cfg.dir,
+        disk_max_bytes=cfg.disk_max_bytes,
+    )
+
+
+@cache
+def get_batch_settings() -> BatchSettings:
+    return BatchSettings()
+
+
+@cache
+def get_job_queue() -> JobQueue:
+    cfg = JobSettings()
+    if cfg.backend == "sqlite":
+        backend = SqliteJobBackend(cfg.sqlite_path, lease_seconds=cfg.lease_seconds)
+    else:
+        backend = MemoryJobBackend()
+    return JobQueue(
+        backend,
+        concurrency=cfg.concurrency,
+        result_ttl_seconds=cfg.result_ttl_seconds,
+        max_queued=cfg.max_queued,
+        webhook_timeout_seconds=cfg.webhook_timeout_seconds,
+        drain_seconds=cfg.drain_seconds,
+        webhook_allowed_hosts=frozenset(cfg.webhook_allowed_hosts),
+    )
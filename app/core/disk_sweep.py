@@ -0,0 +1,78 @@
+import threading
+import time
+from pathlib import Path
+
+
+def sweep_directory(
+    directory: Path,
+    pattern: str,
+    max_bytes: int | None = None,
+    max_age_seconds: float | None = None,
+) -> int:
+    """Delete expired files, then the oldest ones until within the budget.
+
+    The directory may be shared by several processes, so its size is
+    measured on disk rather than tracked by the caller. Files whose mtime is
+    older than max_age_seconds go first. If the rest is still over
+    max_bytes, files are removed oldest mtime first down to 90% of it.
+    In-progress .tmp files are left alone. Returns the number of bytes
+    removed.
+    """
+    now = time.time()
+    files = []
+    total = 0
+    removed = 0
+    for path in directory.glob(pattern):
+        if path.suffix == ".tmp":
+            continue
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            continue
+        if max_age_seconds is not None and now - st.st_mtime > max_age_seconds:
+            path.unlink(missing_ok=True)
+            removed += st.st_size
+            continue
+        files.append((st.st_mtime, st.st_size, path))
+        total += st.st_size
+    if max_bytes is None or total <= max_bytes:
+        return removed
+
+    target = max_bytes * 0.9
+    for _, size, path in sorted(files):
+        if total <= target:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+        removed += size
+    return removed
+
+
+class SweepSchedule:
+    """Decides when a disk tier is due a sweep.
+
+    Sweeping lists the whole directory, so it runs once a tenth of the byte
+    budget has been written, or a tenth of the maximum age has passed,
+    rather than on every write.
+    """
+
+    def __init__(
+        self, max_bytes: int | None = None, max_age_seconds: float | None = None
+    ):
+        self.max_bytes = max_bytes
+        self.interval = max_age_seconds / 10 if max_age_seconds else None
+        self._written = 0
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wrote(self, size: int) -> bool:
+        with self._lock:
+            self._written += size
+            now = time.monotonic()
+            due = (
+                self.max_bytes is not None and self._written * 10 >= self.max_bytes
+            ) or (self.interval is not None and now - self._last >= self.interval)
+            if due:
+                self._written = 0
+                self._last = now
+        return due
@@ -0,0 +1,146 @@
+from dataclasses import dataclass, field
+
+from reportlab.platypus import HRFlowable, Paragraph, Spacer, Table
+
+from app.core.pdf_generator import TemplateNotFound, list_templates
+from app.fonts import ensure_fonts
+from app.models import ResumePayload
+from app.models.tailored_profile import TailoredProfile
+from app.templates import TEMPLATES
+from app.templates.helpers.flowables import TwoColumnRow, section_of
+
+
+@dataclass(frozen=True)
+class TextRun:
+    text: str
+    bold: bool = False
+    italic: bool = False
+    color: str | None = None
+    link: str | None = None
+
+
+@dataclass(frozen=True)
+class TextBlock:
+    role: str
+    runs: tuple[TextRun, ...]
+    font: str
+    font_size: float
+    leading: float
+    color: str
+    space_before: float = 0
+    space_after: float = 0
+
+
+@dataclass(frozen=True)
+class Rule:
+    color: str
+    thickness: float
+    space_before: float = 0
+    space_after: float = 0
+
+
+@dataclass(frozen=True)
+class Gap:
+    height: float
+
+
+Block = TextBlock | Rule | Gap
+
+
+@dataclass
+class Section:
+    key: str
+    blocks: list[Block] = field(default_factory=list)
+
+
+@dataclass
+class Document:
+    template: str
+    title: str
+    sections: list[Section] = field(default_factory=list)
+
+
+def _hex(color) -> str | None:
+    return None if color is None else "#" + color.hexval()[2:].upper()
+
+
+def _font_family(font_name: str) -> str:
+    return font_name.split("-", 1)[0]
+
+
+def _text_block(para: Paragraph) -> TextBlock:
+    # The parsed fragments rather than the markup: they carry resolved bold,
+    # italic, colour and link state, and text that is already unescaped.
+    style = para.style
+    runs = tuple(
+        TextRun(
+            text=frag.text,
+            bold=bool(getattr(frag, "bold", 0)),
+            italic=bool(getattr(frag, "italic", 0)),
+            color=_hex(getattr(frag, "textColor", None)),
+            link=next((href for _, href in getattr(frag, "link", None) or []), None),
+        )
+        for frag in para.frags
+        if getattr(frag, "text", "")
+    )
+    return TextBlock(
+        role=style.name,
+        runs=runs,
+        font=_font_family(style.fontName),
+        font_size=style.fontSize,
+        leading=style.leading,
+        color=_hex(style.textColor),
+        space_before=style.spaceBefore,
+        space_after=style.spaceAfter,
+    )
+
+
+def _blocks(flowable):
+    if isinstance(flowable, Paragraph):
+        yield _text_block(flowable)
+    elif isinstance(flowable, HRFlowable):
+        yield Rule(
+            color=_hex(flowable.color),
+            thickness=flowable.lineWidth,
+            space_before=flowable.spaceBefore,
+            space_after=flowable.spaceAfter,
+        )
+    elif isinstance(flowable, Spacer):
+        yield Gap(flowable.height)
+    elif isinstance(flowable, TwoColumnRow):
+        for cell in flowable.cells:
+            if cell is not None:
+                yield from _blocks(cell)
+    elif isinstance(flowable, Table):
+        for row in flowable._cellvalues:
+            for cell in row:
+                for item in cell if isinstance(cell, (list, tuple)) else [cell]:
+                    yield from _blocks(item)
+    # Page and frame actions have no content of their own.
+
+
+def build_document(
+    data: TailoredProfile | ResumePayload, template_key: str = "simple"
+) -> Document:
+    """The template's story as plain sections of text, rules and gaps.
+
+    Built from the same section builders as the PDF, so other outputs share
+    its content, order and styles without holding any ReportLab objects.
+    """
+    if template_key not in TEMPLATES:
+        raise TemplateNotFound(
+            f"Unknown template '{template_key}'. Available: {list_templates()}"
+        )
+
+    ensure_fonts()
+    document = Document(
+        template=template_key, title=getattr(data, "fullname", None) or "Resume"
+    )
+    section = Section("header")
+    document.sections.append(section)
+    for flowable in TEMPLATES[template_key].build_story(data):
+        if (key := section_of(flowable)) and key != section.key:
+            section = Section(key)
+            document.sections.append(section)
+        section.blocks.extend(_blocks(flowable))
+    return document
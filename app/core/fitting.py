@@ -0,0 +1,119 @@
+from dataclasses import dataclass
+
+from pydantic import BaseModel
+
+from app.core.layout import measure_layout
+from app.core.pdf_generator import (
+    DEFAULT_MARGINS,
+    DEFAULT_PAGESIZE,
+    RenderStats,
+    generate_pdf,
+)
+from app.templates.helpers.paragraphs import track_paragraph_cache
+
+SCALE_STEPS = (1.0, 0.95, 0.9, 0.85)
+DESCRIPTION_LIMITS = (480, 320, 200, 120)
+
+
+@dataclass
+class FitResult:
+    data: BaseModel
+    scale: float
+    pages: int
+    passes: int
+
+
+def _truncate(text: str | None, limit: int) -> str | None:
+    if text is None or len(text) <= limit:
+        return text
+    return text[:limit].rsplit(" ", 1)[0].rstrip(" ,;:.—-") + "…"
+
+
+def _compactions(data: BaseModel) -> list[dict]:
+    # Updates from least to most aggressive, each including the previous one.
+    # Tailoring orders projects and certificates by relevance, so the trailing
+    # ones go first.
+    projects = list(getattr(data, "projects", None) or [])
+    certificates = list(getattr(data, "certificates", None) or [])
+    steps = [{"projects": projects[:-k]} for k in range(1, len(projects) + 1)]
+    steps += [
+        {"projects": [], "certificates": certificates[:-k]}
+        for k in range(1, len(certificates) + 1)
+    ]
+
+    fields = [
+        name
+        for name in ("experience", "experiences", "education")
+        if name in type(data).model_fields
+    ]
+    for limit in DESCRIPTION_LIMITS:
+        update = {"projects": [], "certificates": []}
+        for name in fields:
+            update[name] = [
+                item.model_copy(
+                    update={"description": _truncate(item.description, limit)}
+                )
+                for item in getattr(data, name)
+            ]
+        steps.append(update)
+    return steps
+
+
+def fit_to_pages(
+    data: BaseModel,
+    template_key: str,
+    max_pages: int,
+    pagesize=DEFAULT_PAGESIZE,
+    margins: tuple[float, float, float, float] = DEFAULT_MARGINS,
+) -> FitResult:
+    """Find the least invasive scale/content combination within max_pages.
+
+    Every candidate is checked with a layout dry run. When nothing fits, the
+    most compact candidate is returned so the caller still gets a document.
+    """
+    # Smaller type first, then less content at the smallest type. Each step
+    # only ever shortens the document, so the first one that fits is found by
+    # binary search after checking the two ends.
+    ladder = [(None, scale) for scale in SCALE_STEPS]
+    ladder += [(update, SCALE_STEPS[-1]) for update in _compactions(data)]
+    passes = 0
+
+    def attempt(i: int) -> FitResult:
+        nonlocal passes
+        passes += 1
+        update, scale = ladder[i]
+        candidate = data.model_copy(update=update) if update else data
+        report = measure_layout(candidate, template_key, pagesize, margins, scale=scale)
+        return FitResult(candidate, scale, report.pages, passes)
+
+    if (first := attempt(0)).pages <= max_pages:
+        return first
+    if (best := attempt(len(ladder) - 1)).pages > max_pages:
+        return best
+    lo, hi = 1, len(ladder) - 1
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if (fit := attempt(mid)).pages <= max_pages:
+            best, hi = fit, mid
+        else:
+            lo = mid + 1
+    best.passes = passes
+    return best
+
+
+def generate_fitted_pdf(
+    data: BaseModel,
+    template_key: str = "simple",
+    max_pages: int = 1,
+    pagesize=DEFAULT_PAGESIZE,
+    margins: tuple[float, float, float, float] = DEFAULT_MARGINS,
+) -> tuple[bytes, RenderStats]:
+    with track_paragraph_cache() as paragraphs:
+        fit = fit_to_pages(data, template_key, max_pages, pagesize, margins)
+    pdf_bytes, stats = generate_pdf(
+        fit.data, template_key, pagesize, margins, scale=fit.scale
+    )
+    stats.layout_passes = fit.passes
+    for key, count in paragraphs.items():
+        stats.paragraph_cache[key] = stats.paragraph_cache.get(key, 0) + count
+    return pdf_bytes, stats
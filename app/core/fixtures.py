@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
+
+from app.models import ResumePayload
+from app.models.job_posting import JobPosting
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures"
+
+
+@dataclass(frozen=True)
+class Fixtures:
+    resumes: Mapping[str, ResumePayload]
+    jobs: Mapping[str, JobPosting]
+
+
+def load_fixtures(directory: Path = FIXTURES_DIR) -> Fixtures:
+    resumes = {
+        path.stem.removeprefix("resume_"): ResumePayload.model_validate_json(
+            path.read_bytes()
+        )
+        for path in sorted(directory.glob("resume_*.json"))
+    }
+    jobs = {
+        path.stem.removeprefix("job_posting_"): JobPosting.model_validate_json(
+            path.read_bytes()
+        )
+        for path in sorted(directory.glob("job_posting_*.json"))
+    }
+    return Fixtures(resumes=MappingProxyType(resumes), jobs=MappingProxyType(jobs))
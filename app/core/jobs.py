@@ -0,0 +1,435 @@
+import asyncio
+import ipaddress
+import itertools
+import logging
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from enum import Enum
+from pathlib import Path
+from typing import Awaitable, Callable, Protocol
+
+from pydantic import AnyHttpUrl, BaseModel, Field
+
+from app.core.metrics import JOB_QUEUE_SECONDS, JOBS_FINISHED
+from app.models.tailoring_request import TailoringRequest
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatus(str, Enum):
+    queued = "queued"
+    running = "running"
+    succeeded = "succeeded"
+    failed = "failed"
+
+
+class RenderJob(BaseModel):
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
+    status: JobStatus = JobStatus.queued
+    priority: int = 0
+    style: str
+    webhook_url: AnyHttpUrl | None = None
+    result_url: str | None = None
+    created_at: float = Field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    expires_at: float | None = None
+    error: str | None = None
+    profile_id: str | None = None
+    etag: str | None = None
+
+
+class JobQueueFull(RuntimeError):
+    pass
+
+
+class UnsafeWebhook(ValueError):
+    pass
+
+
+def _is_public(address: str) -> bool:
+    ip = ipaddress.ip_address(address.split("%", 1)[0])
+    if ip.version == 6 and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    return ip.is_global and not ip.is_multicast
+
+
+async def resolve_webhook(
+    url: AnyHttpUrl, allowed_hosts: frozenset[str] = frozenset()
+) -> str:
+    """The address a webhook is delivered to.
+
+    Webhook URLs come from clients but are called from inside the network.
+    With an allowlist configured only those hosts are called; otherwise every
+    address the host resolves to must be public, which rules out loopback,
+    private, link-local (cloud metadata) and reserved addresses.
+    """
+    host = url.host.strip("[]").lower()
+    if allowed_hosts and host not in allowed_hosts:
+        raise UnsafeWebhook(f"Webhook host {host} is not allowed")
+    try:
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            host, url.port, type=socket.SOCK_STREAM
+        )
+    except OSError as err:
+        raise UnsafeWebhook(f"Webhook host {host} does not resolve") from err
+    addresses = [info[4][0] for info in infos]
+    if not allowed_hosts and not all(map(_is_public, addresses)):
+        raise UnsafeWebhook(f"Webhook host {host} resolves to a non-public address")
+    return addresses[0]
+
+
+class JobBackend(Protocol):
+    # Called at startup and periodically to requeue abandoned jobs.
+    async def recover(self) -> None: ...
+
+    # Raises JobQueueFull instead of queueing beyond max_queued; the check and
+    # the insert are one atomic step.
+    async def put(
+        self, job: RenderJob, payload: TailoringRequest, max_queued: int
+    ) -> None: ...
+
+    # Returns the next queued job, already marked running.
+    async def take(self) -> tuple[RenderJob, TailoringRequest]: ...
+
+    async def get(self, job_id: str) -> RenderJob | None: ...
+
+    async def update(self, job: RenderJob) -> None: ...
+
+    async def queued(self) -> int: ...
+
+    async def purge(self, now: float) -> int: ...
+
+
+class MemoryJobBackend:
+    def __init__(self):
+        self._jobs: dict[str, RenderJob] = {}
+        self._payloads: dict[str, TailoringRequest] = {}
+        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._seq = itertools.count()
+
+    async def recover(self) -> None:
+        pass
+
+    async def put(
+        self, job: RenderJob, payload: TailoringRequest, max_queued: int
+    ) -> None:
+        if len(self._payloads) >= max_queued:
+            raise JobQueueFull(f"Job queue full ({max_queued} queued)")
+        self._jobs[job.id] = job
+        self._payloads[job.id] = payload
+        self._queue.put_nowait((-job.priority, next(self._seq), job.id))
+
+    async def take(self) -> tuple[RenderJob, TailoringRequest]:
+        while True:
+            _, _, job_id = await self._queue.get()
+            payload = self._payloads.pop(job_id, None)
+            if payload is None:
+                continue
+            job = self._jobs[job_id].model_copy(
+                update={"status": JobStatus.running, "started_at": time.time()}
+            )
+            self._jobs[job_id] = job
+            return job, payload
+
+    async def get(self, job_id: str) -> RenderJob | None:
+        return self._jobs.get(job_id)
+
+    async def update(self, job: RenderJob) -> None:
+        self._jobs[job.id] = job
+
+    async def queued(self) -> int:
+        return len(self._payloads)
+
+    async def purge(self, now: float) -> int:
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.expires_at is not None and job.expires_at < now
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+        return len(expired)
+
+
+class SqliteJobBackend:
+    # Shared by every worker process pointed at the same file; claiming a job
+    # happens inside an IMMEDIATE transaction so only one process gets it.
+    # While running, expires_at holds the claim's lease instead of the result
+    # TTL, so a job whose process died is requeued once the lease runs out.
+    def __init__(
+        self, path: Path, lease_seconds: float = 900.0, poll_interval: float = 0.5
+    ):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._wakeup = asyncio.Event()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA busy_timeout=5000")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS render_jobs ("
+            " id TEXT PRIMARY KEY, status TEXT NOT NULL, priority INTEGER NOT NULL,"
+            " created_at REAL NOT NULL, expires_at REAL, job TEXT NOT NULL,"
+            " payload TEXT)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS render_jobs_queue"
+            " ON render_jobs (status, priority DESC, created_at)"
+        )
+
+    def _execute(self, sql: str, params=()) -> list[tuple]:
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    async def recover(self) -> None:
+        await asyncio.to_thread(
+            self._execute,
+            "UPDATE render_jobs SET status = 'queued', expires_at = NULL"
+            " WHERE status = 'running' AND expires_at < ?",
+            (time.time(),),
+        )
+
+    def _insert(self, job: RenderJob, payload: TailoringRequest, max_queued: int):
+        # IMMEDIATE takes the write lock before counting, so concurrent
+        # submits from any process cannot all pass the check.
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                inserted = self._db.execute(
+                    "INSERT INTO render_jobs SELECT ?, ?, ?, ?, ?, ?, ?"
+                    " WHERE (SELECT count(*) FROM render_jobs"
+                    " WHERE status = 'queued') < ?",
+                    (
+                        job.id,
+                        job.status.value,
+                        job.priority,
+                        job.created_at,
+                        job.expires_at,
+                        job.model_dump_json(),
+                        payload.model_dump_json(),
+                        max_queued,
+                    ),
+                ).rowcount
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        if not inserted:
+            raise JobQueueFull(f"Job queue full ({max_queued} queued)")
+
+    async def put(
+        self, job: RenderJob, payload: TailoringRequest, max_queued: int
+    ) -> None:
+        await asyncio.to_thread(self._insert, job, payload, max_queued)
+        self._wakeup.set()
+
+    def _claim(self) -> tuple[RenderJob, TailoringRequest] | None:
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._db.execute(
+                    "SELECT id, job, payload FROM render_jobs WHERE status = 'queued'"
+                    " ORDER BY priority DESC, created_at LIMIT 1"
+                ).fetchone()
+                if row is None:
+                    self._db.execute("COMMIT")
+                    return None
+                job_id, job_json, payload_json = row
+                now = time.time()
+                job = RenderJob.model_validate_json(job_json).model_copy(
+                    update={"status": JobStatus.running, "started_at": now}
+                )
+                self._db.execute(
+                    "UPDATE render_jobs SET status = ?, expires_at = ?, job = ?"
+                    " WHERE id = ?",
+                    (
+                        job.status.value,
+                        now + self.lease_seconds,
+                        job.model_dump_json(),
+                        job_id,
+                    ),
+                )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return job, TailoringRequest.model_validate_json(payload_json)
+
+    async def take(self) -> tuple[RenderJob, TailoringRequest]:
+        while True:
+            self._wakeup.clear()
+            claimed = await asyncio.to_thread(self._claim)
+            if claimed is not None:
+                return claimed
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+            except TimeoutError:
+                pass
+
+    async def get(self, job_id: str) -> RenderJob | None:
+        rows = await asyncio.to_thread(
+            self._execute, "SELECT job FROM render_jobs WHERE id = ?", (job_id,)
+        )
+        return RenderJob.model_validate_json(rows[0][0]) if rows else None
+
+    async def update(self, job: RenderJob) -> None:
+        finished = job.status in (JobStatus.succeeded, JobStatus.failed)
+        await asyncio.to_thread(
+            self._execute,
+            "UPDATE render_jobs SET status = ?, expires_at = ?, job = ?,"
+            " payload = CASE WHEN ? THEN NULL ELSE payload END WHERE id = ?",
+            (job.status.value, job.expires_at, job.model_dump_json(), finished, job.id),
+        )
+
+    async def queued(self) -> int:
+        rows = await asyncio.to_thread(
+            self._execute, "SELECT count(*) FROM render_jobs WHERE status = 'queued'"
+        )
+        return rows[0][0]
+
+    async def purge(self, now: float) -> int:
+        rows = await asyncio.to_thread(
+            self._execute,
+            "DELETE FROM render_jobs WHERE status IN ('succeeded', 'failed')"
+            " AND expires_at < ? RETURNING id",
+            (now,),
+        )
+        return len(rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+JobHandler = Callable[[RenderJob, TailoringRequest], Awaitable[dict]]
+
+
+class JobQueue:
+    def __init__(
+        self,
+        backend: JobBackend,
+        concurrency: int,
+        result_ttl_seconds: float,
+        max_queued: int,
+        webhook_timeout_seconds: float = 10.0,
+        drain_seconds: float = 0.0,
+        webhook_allowed_hosts: frozenset[str] = frozenset(),
+    ):
+        self.backend = backend
+        self.concurrency = concurrency
+        self.result_ttl_seconds = result_ttl_seconds
+        self.max_queued = max_queued
+        self.webhook_timeout_seconds = webhook_timeout_seconds
+        self.drain_seconds = drain_seconds
+        self.webhook_allowed_hosts = frozenset(h.lower() for h in webhook_allowed_hosts)
+        self._tasks: list[asyncio.Task] = []
+        self._active: set[asyncio.Task] = set()
+
+    async def start(self, handler: JobHandler) -> None:
+        await self.backend.recover()
+        self._tasks = [
+            asyncio.create_task(self._work(handler), name=f"render-job-{i}")
+            for i in range(self.concurrency)
+        ]
+        self._tasks.append(asyncio.create_task(self._purge(), name="render-job-purge"))
+
+    async def stop(self) -> None:
+        # Stop taking jobs, give the ones already running a chance to finish,
+        # then cancel whatever is left; a shared backend requeues those.
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._active and self.drain_seconds:
+            await asyncio.wait(self._active, timeout=self.drain_seconds)
+        for task in self._active:
+            task.cancel()
+        await asyncio.gather(*self._active, return_exceptions=True)
+
+    async def submit(self, job: RenderJob, payload: TailoringRequest) -> RenderJob:
+        await self.backend.put(job, payload, self.max_queued)
+        return job
+
+    async def check_webhook(self, url: AnyHttpUrl) -> None:
+        await resolve_webhook(url, self.webhook_allowed_hosts)
+
+    async def get(self, job_id: str) -> RenderJob | None:
+        job = await self.backend.get(job_id)
+        if job is None or (job.expires_at is not None and job.expires_at < time.time()):
+            return None
+        return job
+
+    # A failing backend call or webhook must not end the loop: nothing would
+    # restart it and the queue would silently stop.
+    async def _work(self, handler: JobHandler) -> None:
+        while True:
+            try:
+                job, payload = await self.backend.take()
+                task = asyncio.create_task(self._run(handler, job, payload))
+                self._active.add(task)
+                task.add_done_callback(self._active.discard)
+                await asyncio.shield(task)
+            except Exception:
+                logger.exception("render job worker failed; continuing")
+                await asyncio.sleep(1.0)
+
+    async def _run(
+        self, handler: JobHandler, job: RenderJob, payload: TailoringRequest
+    ) -> None:
+        JOB_QUEUE_SECONDS.observe(job.started_at - job.created_at)
+        try:
+            update = {"status": JobStatus.succeeded, **await handler(job, payload)}
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            logger.exception("render job %s failed", job.id)
+            detail = getattr(err, "detail", None) or str(err) or type(err).__name__
+            update = {"status": JobStatus.failed, "error": str(detail)}
+
+        now = time.time()
+        job = job.model_copy(
+            update={
+                **update,
+                "finished_at": now,
+                "expires_at": now + self.result_ttl_seconds,
+            }
+        )
+        await self.backend.update(job)
+        JOBS_FINISHED.inc(status=job.status.value)
+        if job.webhook_url is not None:
+            await self._notify(job)
+
+    async def _notify(self, job: RenderJob) -> None:
+        import httpx
+
+        timeout = self.webhook_timeout_seconds
+        try:
+            # Checked again at delivery and connected to by address, so a DNS
+            # change after submission cannot redirect the request.
+            address = await resolve_webhook(job.webhook_url, self.webhook_allowed_hosts)
+            url = httpx.URL(str(job.webhook_url))
+            async with httpx.AsyncClient(timeout=timeout) as client:
+                response = await client.post(
+                    url.copy_with(host=address),
+                    headers={"Host": url.netloc.decode("ascii")},
+                    extensions={"sni_hostname": url.host},
+                    json=job.model_dump(mode="json"),
+                )
+                response.raise_for_status()
+        except Exception as err:
+            logger.warning("webhook for render job %s failed: %s", job.id, err)
+
+    async def _purge(self) -> None:
+        while True:
+            await asyncio.sleep(min(60.0, self.result_ttl_seconds))
+            try:
+                await self.backend.purge(time.time())
+                await self.backend.recover()
+            except Exception:
+                logger.exception("render job purge failed; retrying later")
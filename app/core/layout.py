@@ -0,0 +1,157 @@
+from dataclasses import dataclass, field
+
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import ActionFlowable, BaseDocTemplate, Frame
+
+from app.core.pdf_generator import (
+    DEFAULT_MARGINS,
+    DEFAULT_PAGESIZE,
+    PdfSink,
+    TemplateNotFound,
+    list_templates,
+)
+from app.fonts import ensure_fonts
+from app.models import ResumePayload
+from app.models.tailored_profile import TailoredProfile
+from app.templates import TEMPLATES
+from app.templates.helpers.flowables import section_of
+from app.templates.helpers.page_specs import FrameSpec, PageSpec
+from app.templates.helpers.scaling import scaled_template
+
+
+@dataclass
+class FrameUsage:
+    page: int
+    frame: str
+    used: float
+    available: float
+    # Content did not fit and spilled into the next frame of the same page
+    # (e.g. Elegant's left column running into the right one). Running off the
+    # last frame of a page is ordinary pagination and is not counted.
+    overflowed: bool = False
+
+
+@dataclass
+class LayoutReport:
+    template: str
+    pages: int
+    frames: list[FrameUsage] = field(default_factory=list)
+    sections: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def overflows(self) -> list[FrameUsage]:
+        return [f for f in self.frames if f.overflowed]
+
+
+def _skip_draw(*args, **kwargs) -> None:
+    pass
+
+
+class _MeasuringFrame(Frame):
+    # Frames are reused from page to page and reset at each page start.
+    def _reset(self):
+        super()._reset()
+        self._content_y = self._y
+
+    def _add(self, flowable, canv, trySplit=0):
+        # Placement runs as usual; only the drawing is skipped.
+        flowable.drawOn = _skip_draw
+        top = self._y
+        try:
+            placed = super()._add(flowable, canv, trySplit)
+        finally:
+            del flowable.drawOn
+        if placed:
+            if self._y != top:
+                # ReportLab lets the space after the last flowable hang below
+                # the frame, so usage is measured to the content's bottom.
+                self._content_y = self._y + flowable.getSpaceAfter()
+            canv._doctemplate.placed(flowable, top - self._y)
+        return placed
+
+    add = _add
+
+
+class _DryRunDoc(BaseDocTemplate):
+    _doSave = 0
+
+    def __init__(self, pagesize, report: LayoutReport):
+        super().__init__(PdfSink(), pagesize=pagesize)
+        self.report = report
+        self.section = "header"
+        self._in_action = False
+        self._recorded: set[tuple[int, int]] = set()
+
+    def placed(self, flowable, height: float) -> None:
+        self.section = section_of(flowable) or self.section
+        sections = self.report.sections
+        sections[self.section] = sections.get(self.section, 0.0) + height
+
+    def _record_frame(self, overflowed: bool) -> None:
+        frame = self.frame
+        if frame is None or (self.page, id(frame)) in self._recorded:
+            return
+        self._recorded.add((self.page, id(frame)))
+        top = frame._y2 - frame._topPadding
+        self.report.frames.append(
+            FrameUsage(
+                page=self.page,
+                frame=frame.id,
+                used=top - frame._content_y,
+                available=top - frame._y1p,
+                overflowed=overflowed,
+            )
+        )
+
+    def handle_flowable(self, flowables):
+        self._in_action = isinstance(flowables[0], ActionFlowable)
+        super().handle_flowable(flowables)
+
+    def handle_frameEnd(self, resume=0):
+        frame = getattr(self, "frame", None)
+        if frame is not None:
+            last = frame is self.pageTemplate.frames[-1]
+            self._record_frame(overflowed=not self._in_action and not last)
+        super().handle_frameEnd(resume)
+
+    def handle_pageEnd(self):
+        if getattr(self, "frame", None) is not None:
+            self._record_frame(overflowed=False)
+        super().handle_pageEnd()
+
+
+def measure_layout(
+    data: TailoredProfile | ResumePayload,
+    template_key: str = "simple",
+    pagesize=DEFAULT_PAGESIZE,
+    margins: tuple[float, float, float, float] = DEFAULT_MARGINS,
+    scale: float = 1.0,
+) -> LayoutReport:
+    """Lay the story out over the template's frames without producing a PDF."""
+    if template_key not in TEMPLATES:
+        raise TemplateNotFound(
+            f"Unknown template '{template_key}'. Available: {list_templates()}"
+        )
+
+    ensure_fonts()
+    tpl = scaled_template(TEMPLATES[template_key], scale)
+    # Templates build CachedParagraphs, so repeated dry runs (and renders) of
+    # the same text reuse the parsed markup and line breaks.
+    story = tpl.build_story(data)
+
+    if hasattr(tpl, "page_specs"):
+        specs = tpl.page_specs(tuple(pagesize))
+    else:
+        left, top, right, bottom = margins
+        page_w, page_h = pagesize
+        frame = FrameSpec(
+            "normal", left, bottom, page_w - left - right, page_h - top - bottom
+        )
+        specs = (PageSpec("Normal", (frame,)),)
+
+    report = LayoutReport(template=template_key, pages=0)
+    doc = _DryRunDoc(pagesize, report)
+    doc.addPageTemplates([spec.build(_MeasuringFrame) for spec in specs])
+    doc.build(story, canvasmaker=Canvas)
+    report.pages = doc.page
+    return report
@@ -0,0 +1,209 @@
+import bisect
+import math
+import threading
+from typing import Iterable
+
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+SIZE_BUCKETS = tuple(2**n * 1024 for n in range(4, 14))
+PAGE_BUCKETS = (1, 2, 3, 4, 5, 6, 8, 10, 15, 20)
+TOKEN_BUCKETS = (250, 500, 1000, 2000, 4000, 8000, 16000, 32000)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = tuple(str(labels[n]) for n in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(tuple(str(labels[n]) for n in self.labelnames), 0)
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}_total{_labels(self.labelnames, key)} {_number(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.buckets = tuple(buckets) + (math.inf,)
+        self._values: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = tuple(str(labels[n]) for n in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.setdefault(
+                key, ([0] * len(self.buckets), [0.0])
+            )
+            counts[index] += 1
+            total[0] += value
+
+    def count(self, **labels) -> int:
+        entry = self._values.get(tuple(str(labels[n]) for n in self.labelnames))
+        return sum(entry[0]) if entry else 0
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            items = sorted((k, (list(c), t[0])) for k, (c, t) in self._values.items())
+        lines = []
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                le = _labels(self.labelnames, key, f'le="{_number(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            labels = _labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_number(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: list[Counter | Histogram] = []
+
+    def counter(self, name: str, help: str, labelnames=()) -> Counter:
+        metric = Counter(name, help, tuple(labelnames))
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, help: str, labelnames=(), **kwargs) -> Histogram:
+        metric = Histogram(name, help, tuple(labelnames), **kwargs)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route.",
+    ("method", "route", "status"),
+)
+STARTUP_SECONDS = REGISTRY.histogram(
+    "startup_phase_seconds", "Time spent per application startup phase.", ("phase",)
+)
+STAGE_SECONDS = REGISTRY.histogram(
+    "pipeline_stage_seconds", "Time spent per pipeline stage.", ("stage",)
+)
+
+OPENAI_CALL_SECONDS = REGISTRY.histogram(
+    "openai_call_seconds",
+    "Latency of a tailoring call including retries.",
+    ("call", "outcome"),
+)
+OPENAI_TOKENS = REGISTRY.histogram(
+    "openai_call_tokens",
+    "Tokens per tailoring call.",
+    ("call", "kind"),
+    buckets=TOKEN_BUCKETS,
+)
+OPENAI_RETRIES = REGISTRY.counter(
+    "openai_retries", "Retried tailoring call attempts.", ("call", "reason")
+)
+OPENAI_HEDGES = REGISTRY.counter(
+    "openai_hedges", "Hedged duplicate tailoring calls.", ("call",)
+)
+TAILORING_CACHE_REQUESTS = REGISTRY.counter(
+    "tailoring_cache_requests", "Tailoring cache lookups.", ("result",)
+)
+
+RENDER_STORY_SECONDS = REGISTRY.histogram(
+    "render_story_seconds", "Time spent in build_story.", ("template",)
+)
+RENDER_BUILD_SECONDS = REGISTRY.histogram(
+    "render_build_seconds", "Time spent in doc.build.", ("template",)
+)
+PDF_SIZE_BYTES = REGISTRY.histogram(
+    "pdf_size_bytes", "Rendered PDF size.", ("template",), buckets=SIZE_BUCKETS
+)
+PDF_PAGES = REGISTRY.histogram(
+    "pdf_pages", "Rendered PDF page count.", ("template",), buckets=PAGE_BUCKETS
+)
+PDF_FONT_BYTES = REGISTRY.histogram(
+    "pdf_embedded_font_bytes",
+    "Embedded font subset bytes per rendered PDF.",
+    ("template",),
+    buckets=SIZE_BUCKETS,
+)
+FONT_SUBSET_REQUESTS = REGISTRY.counter(
+    "font_subset_requests", "Font subset cache lookups.", ("result",)
+)
+FONT_LOAD_SECONDS = REGISTRY.histogram(
+    "font_load_seconds",
+    "Time to load a font in a rendering process, from the TTF or the cache.",
+    ("font", "source"),
+)
+PDF_FIT_PASSES = REGISTRY.histogram(
+    "pdf_fit_passes",
+    "Layout dry runs needed to fit a PDF into max_pages.",
+    ("template",),
+    buckets=PAGE_BUCKETS,
+)
+PARAGRAPH_CACHE_REQUESTS = REGISTRY.counter(
+    "paragraph_cache_requests",
+    "Paragraph markup (parse) and line-break (wrap) cache lookups.",
+    ("kind", "result"),
+)
+PDF_CACHE_REQUESTS = REGISTRY.counter(
+    "pdf_cache_requests", "Rendered PDF cache lookups.", ("result",)
+)
+
+JOB_QUEUE_SECONDS = REGISTRY.histogram(
+    "render_job_queue_seconds", "Time render jobs spend queued before a worker."
+)
+JOBS_FINISHED = REGISTRY.counter(
+    "render_jobs_finished", "Finished render jobs.", ("status",)
+)
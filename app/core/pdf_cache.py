@@ -0,0 +1,110 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from app.core.disk_sweep import SweepSchedule, sweep_directory
+
+CACHE_VERSION = 1
+
+
+def pdf_cache_key(
+    data: BaseModel,
+    template_key: str,
+    pagesize: tuple[float, float],
+    margins: tuple[float, float, float, float],
+    max_pages: int | None = None,
+) -> str:
+    h = hashlib.sha256()
+    h.update(f"v{CACHE_VERSION}|{type(data).__name__}|{template_key}|".encode())
+    h.update(repr((tuple(pagesize), tuple(margins))).encode())
+    if max_pages:
+        # Fitting is deterministic, so the limit stands in for the scale and
+        # content it ends up choosing.
+        h.update(f"|max_pages={max_pages}".encode())
+    h.update(b"|")
+    h.update(data.model_dump_json().encode())
+    return h.hexdigest()
+
+
+class PdfCache:
+    def __init__(
+        self,
+        max_bytes: int,
+        directory: Path | None = None,
+        disk_max_bytes: int | None = None,
+    ):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.disk_max_bytes = disk_max_bytes
+        self.size = 0
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+        self._schedule = SweepSchedule(disk_max_bytes)
+
+        if directory is not None:
+            directory.mkdir(parents=True, exist_ok=True)
+            self.sweep()
+
+    # Derived files (thumbnails) live next to the PDF under the same key.
+    def _path(self, key: str, suffix: str) -> Path:
+        return self.directory / key[:2] / f"{key}{suffix}"
+
+    def _remember(self, key: str, content: bytes) -> None:
+        if len(content) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self._entries[key] = content
+            self.size += len(content)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def get(self, key: str, suffix: str = ".pdf") -> bytes | None:
+        with self._lock:
+            content = self._entries.get(key + suffix)
+            if content is not None:
+                self._entries.move_to_end(key + suffix)
+                return content
+
+        if self.directory is None:
+            return None
+        path = self._path(key, suffix)
+        try:
+            content = path.read_bytes()
+            # Reads count as use, so the sweep evicts least recently used.
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        self._remember(key + suffix, content)
+        return content
+
+    def put(self, key: str, content: bytes, suffix: str = ".pdf") -> None:
+        self._remember(key + suffix, content)
+
+        if self.directory is None:
+            return
+        path = self._path(key, suffix)
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(content)
+        os.replace(tmp, path)
+
+        if self._schedule.wrote(len(content)):
+            self.sweep()
+
+    def sweep(self) -> int:
+        """Delete the oldest files until the disk tier is within its budget.
+
+        Disk hits refresh a file's mtime, so this evicts least recently used.
+        Returns the number of bytes removed.
+        """
+        if self.directory is None or self.disk_max_bytes is None:
+            return 0
+        return sweep_directory(self.directory, "*/*", self.disk_max_bytes)
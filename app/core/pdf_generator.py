@@ -1,4 +1,6 @@
-from io import BytesIO
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator
 
 from reportlab.platypus import SimpleDocTemplate, BaseDocTemplate
 from reportlab.lib.pagesizes import A4
@@ -7,34 +9,82 @@ from reportlab.lib.units import mm
 from app.models import ResumePayload
 from app.models.tailored_profile import TailoredProfile
 from app.templates import TEMPLATES
-from app.fonts import register_fonts
+from app.templates.helpers.paragraphs import track_paragraph_cache
+from app.templates.helpers.scaling import scaled_template
+from app.fonts import FontLoad, ensure_fonts, take_font_loads, track_font_usage
 
-register_fonts()
+CHUNK_SIZE = 64 * 1024
+DEFAULT_PAGESIZE = A4
+DEFAULT_MARGINS = (14 * mm, 16 * mm, 14 * mm, 14 * mm)
 
 
 class TemplateNotFound(ValueError):
     pass
 
 
+@dataclass
+class RenderStats:
+    story_seconds: float = 0.0
+    build_seconds: float = 0.0
+    embedded_font_bytes: int = 0
+    pages: int = 0
+    layout_passes: int = 0
+    # (parse|wrap, hit|miss) -> count
+    paragraph_cache: dict[tuple[str, str], int] = field(default_factory=dict)
+    # hit|miss -> count
+    font_subsets: dict[str, int] = field(default_factory=dict)
+    # Fonts this process parsed since the last render that reported them.
+    font_loads: list[FontLoad] = field(default_factory=list)
+
+
+class PdfSink:
+    # ReportLab hands the finished document to write() in one piece; keeping
+    # references instead of copying into a BytesIO avoids a full-size copy.
+    def __init__(self):
+        self.chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self.chunks.append(data)
+        return len(data)
+
+    def getvalue(self) -> bytes:
+        if len(self.chunks) == 1:
+            return self.chunks[0]
+        return b"".join(self.chunks)
+
+
+async def iter_chunks(
+    content: bytes, chunk_size: int = CHUNK_SIZE
+) -> AsyncIterator[memoryview]:
+    view = memoryview(content)
+    for start in range(0, len(view), chunk_size):
+        yield view[start : start + chunk_size]
+
+
 def list_templates() -> list[str]:
     return list(TEMPLATES.keys())
 
 
-def generate_pdf_bytes(
+def generate_pdf_to(
+    sink,
     data: TailoredProfile | ResumePayload,
     template_key: str = "simple",
-    pagesize=A4,
-    margins: tuple[float, float, float, float] = (14 * mm, 16 * mm, 14 * mm, 14 * mm),
-) -> bytes:
+    pagesize=DEFAULT_PAGESIZE,
+    margins: tuple[float, float, float, float] = DEFAULT_MARGINS,
+    scale: float = 1.0,
+) -> RenderStats:
     if template_key not in TEMPLATES:
         raise TemplateNotFound(
             f"Unknown template '{template_key}'. Available: {list_templates()}"
         )
 
-    tpl = TEMPLATES[template_key]
-    story = tpl.build_story(data)
-
-    buf = BytesIO()
+    ensure_fonts()
+    tpl = scaled_template(TEMPLATES[template_key], scale)
+    paragraphs: dict[tuple[str, str], int] = {}
+    started = time.perf_counter()
+    with track_paragraph_cache(paragraphs):
+        story = tpl.build_story(data)
+    story_seconds = time.perf_counter() - started
 
     has_custom_pages = hasattr(tpl, "get_page_templates") and callable(
         getattr(tpl, "get_page_templates")
@@ -42,7 +92,7 @@ def generate_pdf_bytes(
 
     if has_custom_pages:
         doc = BaseDocTemplate(
-            buf,
+            sink,
             pagesize=pagesize,
             leftMargin=0,
             rightMargin=0,
@@ -51,13 +101,14 @@ def generate_pdf_bytes(
             title=getattr(data, "fullname", None) or "Resume",
             author=getattr(data, "fullname", None),
         )
-        for pt in tpl.get_page_templates():
+        for pt in tpl.get_page_templates(pagesize):
             doc.addPageTemplates(pt)
-        doc.build(story)
+        with track_font_usage() as fonts, track_paragraph_cache(paragraphs):
+            doc.build(story)
     else:
         left, top, right, bottom = margins
         doc = SimpleDocTemplate(
-            buf,
+            sink,
             pagesize=pagesize,
             leftMargin=left,
             rightMargin=right,
@@ -66,7 +117,47 @@ def generate_pdf_bytes(
             title=getattr(data, "fullname", None) or "Resume",
             author=getattr(data, "fullname", None),
         )
-        doc.build(story)
+        with track_font_usage() as fonts, track_paragraph_cache(paragraphs):
+            doc.build(story)
+
+    return RenderStats(
+        story_seconds=story_seconds,
+        build_seconds=time.perf_counter() - started - story_seconds,
+        embedded_font_bytes=fonts.embedded_bytes,
+        pages=doc.page,
+        paragraph_cache=paragraphs,
+        font_subsets={"hit": fonts.subset_hits, "miss": fonts.subset_misses},
+        font_loads=take_font_loads(),
+    )
+
+
+def warm_up(data: TailoredProfile | ResumePayload) -> list[RenderStats]:
+    # The first render of each template pays for font parsing, subsetting and
+    # ReportLab's lazy imports; doing it here keeps that off user requests.
+    # The stats go back to the caller, which may be in another process.
+    return [
+        generate_pdf_to(PdfSink(), data, template_key) for template_key in TEMPLATES
+    ]
+
+
+def generate_pdf(
+    data: TailoredProfile | ResumePayload,
+    template_key: str = "simple",
+    pagesize=DEFAULT_PAGESIZE,
+    margins: tuple[float, float, float, float] = DEFAULT_MARGINS,
+    scale: float = 1.0,
+) -> tuple[bytes, RenderStats]:
+    sink = PdfSink()
+    stats = generate_pdf_to(sink, data, template_key, pagesize, margins, scale)
+    return sink.getvalue(), stats
+
 
-    buf.seek(0)
-    return buf.read()
+def generate_pdf_bytes(
+    data: TailoredProfile | ResumePayload,
+    template_key: str = "simple",
+    pagesize=DEFAULT_PAGESIZE,
+    margins: tuple[float, float, float, float] = DEFAULT_MARGINS,
+    scale: float = 1.0,
+) -> bytes:
+    pdf_bytes, _ = generate_pdf(data, template_key, pagesize, margins, scale)
+    return pdf_bytes
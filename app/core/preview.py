@@ -0,0 +1,108 @@
+import io
+from html import escape
+
+from app.core.document import Document, Gap, Rule, TextBlock, TextRun, build_document
+from app.models import ResumePayload
+from app.models.tailored_profile import TailoredProfile
+
+SAFE_LINK_SCHEMES = ("http://", "https://", "mailto:")
+FONT_STACKS = {
+    "Merriweather": "Merriweather, Georgia, serif",
+    "Roboto": "Roboto, Arial, sans-serif",
+    "SourceSans": "'Source Sans 3', 'Source Sans Pro', Arial, sans-serif",
+}
+
+
+class ThumbnailsUnavailable(RuntimeError):
+    pass
+
+
+def _run_html(run: TextRun, block_color: str) -> str:
+    html = escape(run.text)
+    if run.bold:
+        html = f"<b>{html}</b>"
+    if run.italic:
+        html = f"<i>{html}</i>"
+    if run.color and run.color != block_color:
+        html = f'<span style="color:{run.color}">{html}</span>'
+    if run.link and run.link.lower().startswith(SAFE_LINK_SCHEMES):
+        html = f'<a href="{escape(run.link)}">{html}</a>'
+    return html
+
+
+def _block_html(block, tag: str) -> str:
+    if isinstance(block, Gap):
+        return f'<div style="height:{block.height:g}pt"></div>'
+    if isinstance(block, Rule):
+        return (
+            f'<hr style="border:0;border-top:{block.thickness:g}pt solid {block.color};'
+            f'margin:{block.space_before:g}pt 0 {block.space_after:g}pt">'
+        )
+    style = (
+        f"font-family:{FONT_STACKS.get(block.font, 'sans-serif')};"
+        f"font-size:{block.font_size:g}pt;line-height:{block.leading:g}pt;"
+        f"color:{block.color};margin:{block.space_before:g}pt 0 {block.space_after:g}pt"
+    )
+    body = "".join(_run_html(run, block.color) for run in block.runs)
+    return f'<{tag} class="{escape(block.role)}" style="{style}">{body}</{tag}>'
+
+
+def render_html(document: Document) -> str:
+    """A standalone HTML page with the document's sections, for live previews.
+
+    Elegant's sidebar comes out as ordinary sections after the header; the
+    preview follows reading order rather than the page geometry.
+    """
+    parts = [
+        "<!DOCTYPE html>",
+        '<html><head><meta charset="utf-8">',
+        f"<title>{escape(document.title)}</title>",
+        "<style>body{max-width:595pt;margin:24pt auto;padding:0 36pt}"
+        "section{margin-bottom:8pt}</style>",
+        f'</head><body class="{escape(document.template)}">',
+    ]
+    for section in document.sections:
+        parts.append(f'<section data-section="{escape(section.key)}">')
+        # Every section opens with its title (the name, in the header).
+        heading = "h1" if section.key == "header" else "h2"
+        for block in section.blocks:
+            if heading and isinstance(block, TextBlock):
+                parts.append(_block_html(block, heading))
+                heading = None
+            else:
+                parts.append(_block_html(block, "p"))
+        parts.append("</section>")
+    parts.append("</body></html>")
+    return "\n".join(parts)
+
+
+def preview_html(
+    data: TailoredProfile | ResumePayload, template_key: str = "simple"
+) -> str:
+    return render_html(build_document(data, template_key))
+
+
+def render_thumbnail(pdf_bytes: bytes, width: int) -> bytes:
+    """The first page of a rendered PDF as a PNG `width` pixels wide."""
+    # ReportLab's own rasteriser needs rlPyCairo; pdfium is a single wheel.
+    try:
+        import PIL.Image  # noqa: F401 (used by PdfBitmap.to_pil)
+        import pypdfium2
+    except ImportError as err:
+        raise ThumbnailsUnavailable(
+            "Thumbnails need the 'thumbnails' extra (pypdfium2 and Pillow)"
+        ) from err
+
+    pdf = pypdfium2.PdfDocument(pdf_bytes)
+    try:
+        page = pdf[0]
+        try:
+            image = page.render(scale=width / page.get_width()).to_pil()
+        finally:
+            page.close()
+    finally:
+        pdf.close()
+
+    out = io.BytesIO()
+    image.save(out, format="PNG", optimize=True)
+    return out.getvalue()
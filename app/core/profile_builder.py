@@ -1,40 +1,125 @@
 import asyncio
+from typing import TYPE_CHECKING, AsyncIterator
 
-from openai import AsyncOpenAI
+from pydantic import BaseModel
 
+from app.ai.cache import TailoringCache, tailoring_key
+from app.ai.config import MODEL
+from app.ai.fingerprint import fingerprint
 from app.ai.messaging import (
+    PART_MODELS,
+    PROFILE_SLICES,
     generate_tailored_exp_edu,
     generate_tailored_skill_proj_cert,
     generate_tailored_summary,
 )
+from app.ai.prompts import PROMPT_VERSION
+from app.core.timing import stage
 from app.models import ResumePayload
 from app.models.job_posting import JobPosting
-from app.models.tailored_profile import TailoredProfile
+from app.models.tailored_profile import (
+    TailoredExperienceEducation,
+    TailoredProfile,
+    TailoredSkillProjectCertificate,
+    TailoredSummary,
+)
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+
+async def _tailor(
+    generate,
+    job: JobPosting,
+    resume: ResumePayload,
+    ai_client: "AsyncOpenAI",
+    cache: TailoringCache | None,
+):
+    if cache is None:
+        return await generate(job=job, resume=resume, ai_client=ai_client)
+
+    # Keyed on the profile slice this call reads, so editing one section only
+    # re-issues the calls whose input actually changed.
+    key = tailoring_key(
+        generate.__name__,
+        MODEL,
+        PROMPT_VERSION,
+        fingerprint(job),
+        fingerprint(resume, PROFILE_SLICES[generate]),
+    )
+    return await cache.get_or_create(
+        key,
+        PART_MODELS[generate],
+        lambda: generate(job=job, resume=resume, ai_client=ai_client),
+    )
 
 
-async def build_profile(job: JobPosting, resume: ResumePayload, ai_client: AsyncOpenAI) -> TailoredProfile:
+PARTS = {
+    "experience_education": generate_tailored_exp_edu,
+    "skills_projects_certificates": generate_tailored_skill_proj_cert,
+    "summary": generate_tailored_summary,
+}
+
+
+def assemble_profile(
+    resume: ResumePayload,
+    exp_edu: TailoredExperienceEducation,
+    skill_proj_cert: TailoredSkillProjectCertificate,
+    summary: TailoredSummary,
+) -> TailoredProfile:
+    # Every part is already a validated model, so the profile is assembled
+    # without validating the same lists a second time.
+    with stage("assemble"):
+        return TailoredProfile.model_construct(
+            fullname=resume.fullname,
+            professional_title=resume.professional_title,
+            location=resume.location,
+            phone=resume.phone,
+            summary=summary.summary,
+            experience=exp_edu.experience,
+            education=exp_edu.education,
+            skills=skill_proj_cert.skills,
+            projects=skill_proj_cert.projects,
+            certificates=skill_proj_cert.certificates,
+            social_links=resume.social_links,
+            languages=resume.languages,
+        )
+
+
+async def iter_profile_parts(
+    job: JobPosting,
+    resume: ResumePayload,
+    ai_client: "AsyncOpenAI",
+    cache: TailoringCache | None = None,
+) -> AsyncIterator[tuple[str, BaseModel]]:
+    tasks = {
+        asyncio.create_task(_tailor(generate, job, resume, ai_client, cache)): name
+        for name, generate in PARTS.items()
+    }
+    try:
+        async for task in asyncio.as_completed(tasks):
+            yield tasks[task], task.result()
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def build_profile(
+    job: JobPosting,
+    resume: ResumePayload,
+    ai_client: "AsyncOpenAI",
+    cache: TailoringCache | None = None,
+) -> TailoredProfile:
     part_one = asyncio.create_task(
-        generate_tailored_exp_edu(job=job, resume=resume, ai_client=ai_client)
+        _tailor(generate_tailored_exp_edu, job, resume, ai_client, cache)
     )
     part_two = asyncio.create_task(
-        generate_tailored_skill_proj_cert(job=job, resume=resume, ai_client=ai_client)
+        _tailor(generate_tailored_skill_proj_cert, job, resume, ai_client, cache)
     )
     summary = asyncio.create_task(
-        generate_tailored_summary(job=job, resume=resume, ai_client=ai_client)
+        _tailor(generate_tailored_summary, job, resume, ai_client, cache)
     )
-    a, b, c = await asyncio.gather(part_one, part_two, summary)
-
-    return TailoredProfile(
-        fullname=resume.fullname,
-        professional_title=resume.professional_title,
-        location=resume.location,
-        phone=resume.phone,
-        summary=c.summary,
-        experience=a.experience,
-        education=a.education,
-        skills=b.skills,
-        projects=b.projects,
-        certificates=b.certificates,
-        social_links=resume.social_links,
-        languages=resume.languages,
-    )
\ No newline at end of file
+    with stage("llm"):
+        a, b, c = await asyncio.gather(part_one, part_two, summary)
+
+    return assemble_profile(resume, a, b, c)
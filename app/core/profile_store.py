@@ -0,0 +1,94 @@
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from app.core.disk_sweep import SweepSchedule, sweep_directory
+from app.models.tailored_profile import TailoredProfile
+
+
+class ProfileStore:
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int,
+        directory: Path | None = None,
+        disk_max_bytes: int | None = None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.directory = directory
+        self.disk_max_bytes = disk_max_bytes
+        self._entries: OrderedDict[str, tuple[float, TailoredProfile]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._schedule = SweepSchedule(disk_max_bytes, ttl_seconds)
+
+        if directory is not None:
+            directory.mkdir(parents=True, exist_ok=True)
+            self.sweep()
+
+    def _path(self, profile_id: str) -> Path:
+        return self.directory / f"{profile_id}.json"
+
+    def _remember(
+        self, profile_id: str, profile: TailoredProfile, expires_at: float
+    ) -> None:
+        with self._lock:
+            self._entries[profile_id] = (expires_at, profile)
+            self._entries.move_to_end(profile_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def save(self, profile: TailoredProfile) -> str:
+        profile_id = uuid.uuid4().hex
+        self._remember(profile_id, profile, time.monotonic() + self.ttl_seconds)
+        if self.directory is None:
+            return profile_id
+        path = self._path(profile_id)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        content = profile.model_dump_json().encode()
+        tmp.write_bytes(content)
+        os.replace(tmp, path)
+        if self._schedule.wrote(len(content)):
+            self.sweep()
+        return profile_id
+
+    def sweep(self) -> int:
+        """Delete expired profiles from disk, then the oldest over the budget.
+
+        Returns the number of bytes removed.
+        """
+        if self.directory is None:
+            return 0
+        return sweep_directory(
+            self.directory, "*.json", self.disk_max_bytes, self.ttl_seconds
+        )
+
+    def get(self, profile_id: str) -> TailoredProfile | None:
+        with self._lock:
+            entry = self._entries.get(profile_id)
+        if entry is not None:
+            expires_at, profile = entry
+            if expires_at >= time.monotonic():
+                return profile
+            with self._lock:
+                self._entries.pop(profile_id, None)
+
+        if self.directory is None or not profile_id.isalnum():
+            return None
+        path = self._path(profile_id)
+        try:
+            age = time.time() - path.stat().st_mtime
+            if age > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                return None
+            profile = TailoredProfile.model_validate_json(path.read_bytes())
+        except (OSError, ValidationError):
+            # Missing, or left unreadable by an older non-atomic write.
+            return None
+        self._remember(profile_id, profile, time.monotonic() + self.ttl_seconds - age)
+        return profile
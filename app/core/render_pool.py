@@ -0,0 +1,143 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+from app.core.config import RenderSettings
+from app.core.fitting import generate_fitted_pdf
+from app.core.metrics import (
+    FONT_LOAD_SECONDS,
+    FONT_SUBSET_REQUESTS,
+    PDF_FIT_PASSES,
+    PDF_FONT_BYTES,
+    PDF_PAGES,
+    PARAGRAPH_CACHE_REQUESTS,
+    PDF_SIZE_BYTES,
+    RENDER_BUILD_SECONDS,
+    RENDER_STORY_SECONDS,
+)
+from app.core.pdf_generator import RenderStats, generate_pdf, warm_up
+from app.fonts import ensure_fonts
+from app.models import ResumePayload
+from app.models.tailored_profile import TailoredProfile
+
+
+class RenderPoolSaturated(RuntimeError):
+    pass
+
+
+class RenderTimeout(TimeoutError):
+    pass
+
+
+def _record_fonts(stats: RenderStats) -> None:
+    for result, count in stats.font_subsets.items():
+        FONT_SUBSET_REQUESTS.inc(count, result=result)
+    for load in stats.font_loads:
+        source = "cache" if load.from_cache else "ttf"
+        FONT_LOAD_SECONDS.observe(load.seconds, font=load.name, source=source)
+
+
+class RenderPool:
+    def __init__(self, settings: RenderSettings):
+        self.settings = settings
+        self.capacity = settings.workers + settings.max_queue
+        self.in_flight = 0
+        self._executor = self._make_executor(settings)
+
+    @staticmethod
+    def _make_executor(settings: RenderSettings) -> Executor:
+        if settings.executor == "thread":
+            return ThreadPoolExecutor(
+                max_workers=settings.workers, thread_name_prefix="render"
+            )
+        return ProcessPoolExecutor(
+            max_workers=settings.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=ensure_fonts,
+        )
+
+    # Slots are released when the worker actually finishes, not when the caller
+    # stops waiting, so timed-out renders keep counting against capacity.
+    def _release(self, _: Future) -> None:
+        self.in_flight -= 1
+
+    async def run(self, fn, /, *args, **kwargs):
+        if self.in_flight >= self.capacity:
+            raise RenderPoolSaturated(
+                f"Render pool saturated ({self.in_flight}/{self.capacity} in flight)"
+            )
+
+        self.in_flight += 1
+        loop = asyncio.get_running_loop()
+        try:
+            fut = self._executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            self.in_flight -= 1
+            raise
+        fut.add_done_callback(
+            lambda f: loop.is_closed() or loop.call_soon_threadsafe(self._release, f)
+        )
+
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(fut), timeout=self.settings.timeout_seconds
+            )
+        except TimeoutError as err:
+            fut.cancel()
+            raise RenderTimeout(
+                f"Render exceeded {self.settings.timeout_seconds:g}s"
+            ) from err
+
+    async def render(
+        self,
+        data: TailoredProfile | ResumePayload,
+        template_key: str = "simple",
+        max_pages: int | None = None,
+        **layout,
+    ) -> bytes:
+        # Stats come back with the bytes so they are recorded in this process,
+        # whichever executor did the work.
+        if max_pages:
+            pdf_bytes, stats = await self.run(
+                generate_fitted_pdf,
+                data=data,
+                template_key=template_key,
+                max_pages=max_pages,
+                **layout,
+            )
+            PDF_FIT_PASSES.observe(stats.layout_passes, template=template_key)
+        else:
+            pdf_bytes, stats = await self.run(
+                generate_pdf, data=data, template_key=template_key, **layout
+            )
+        RENDER_STORY_SECONDS.observe(stats.story_seconds, template=template_key)
+        RENDER_BUILD_SECONDS.observe(stats.build_seconds, template=template_key)
+        PDF_SIZE_BYTES.observe(len(pdf_bytes), template=template_key)
+        PDF_PAGES.observe(stats.pages, template=template_key)
+        PDF_FONT_BYTES.observe(stats.embedded_font_bytes, template=template_key)
+        for (kind, result), count in stats.paragraph_cache.items():
+            PARAGRAPH_CACHE_REQUESTS.inc(count, kind=kind, result=result)
+        _record_fonts(stats)
+        return pdf_bytes
+
+    async def warm(self, data: TailoredProfile | ResumePayload) -> float:
+        """Start and warm every worker process (or thread).
+
+        Returns the longest time one worker spent loading fonts.
+        """
+        warmed = await asyncio.gather(
+            *(self.run(warm_up, data) for _ in range(self.settings.workers))
+        )
+        # Only the font figures: warm-up renders are not served PDFs.
+        font_seconds = 0.0
+        for renders in warmed:
+            for stats in renders:
+                _record_fonts(stats)
+            font_seconds = max(
+                font_seconds,
+                sum(load.seconds for stats in renders for load in stats.font_loads),
+            )
+        return font_seconds
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,33 @@
+import logging
+import time
+from contextlib import contextmanager
+
+from app.core.metrics import STARTUP_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+class StartupReport:
+    def __init__(self):
+        self.phases: dict[str, float] = {}
+
+    def record(self, name: str, seconds: float) -> None:
+        self.phases[name] = seconds
+        STARTUP_SECONDS.observe(seconds, phase=name)
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def log(self) -> None:
+        phases = ", ".join(
+            f"{name}={sec * 1000:.0f}ms" for name, sec in self.phases.items()
+        )
+        logger.info("startup: %s", phases)
+
+
+STARTUP = StartupReport()
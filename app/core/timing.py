@@ -0,0 +1,48 @@
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+
+from app.core.metrics import STAGE_SECONDS
+
+try:
+    from opentelemetry import trace
+except ImportError:
+    tracer = None
+else:
+    tracer = trace.get_tracer("resume_pdf_generator")
+
+_timings: ContextVar[dict[str, float] | None] = ContextVar("timings", default=None)
+
+
+# A route dependency, declared ahead of the request body so that validating
+# it ("ingest") lands in the same breakdown. It has to be async: sync
+# dependencies run in a thread and their context is not the handler's. Each
+# request runs in its own context, so nothing needs resetting.
+async def request_timings() -> dict[str, float]:
+    timings: dict[str, float] = {}
+    _timings.set(timings)
+    return timings
+
+
+def span(name: str, **attributes):
+    if tracer is None:
+        return nullcontext()
+    return tracer.start_as_current_span(name, attributes=attributes)
+
+
+@contextmanager
+def stage(name: str):
+    started = time.perf_counter()
+    try:
+        with span(name):
+            yield
+    finally:
+        elapsed = time.perf_counter() - started
+        STAGE_SECONDS.observe(elapsed, stage=name)
+        timings = _timings.get()
+        if timings is not None:
+            timings[name] = timings.get(name, 0.0) + elapsed
+
+
+def server_timing_header(timings: dict[str, float]) -> str:
+    return ", ".join(f"{name};dur={sec * 1000:.1f}" for name, sec in timings.items())
@@ -1,7 +1,25 @@
+import hashlib
+import logging
+import operator
 import os
-from reportlab import rl_config
+import pickle
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import cache, partial
+from pathlib import Path
+from weakref import WeakKeyDictionary
+
+from reportlab import Version as RL_VERSION, rl_config
 from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfbase.ttfonts import TTFont, TTFontFace
+
+from app.core.config import private_dir
+
+logger = logging.getLogger(__name__)
 
 
 def _fonts_root() -> str:
@@ -10,6 +28,20 @@ def _fonts_root() -> str:
     return os.environ.get("APP_FONTS_DIR", default_path)
 
 
+# Parsed fonts are cached as pickles, so the cache is off unless a directory
+# is configured, and that directory must be private to this user.
+@cache
+def _font_cache_dir() -> str | None:
+    path = os.environ.get("APP_FONT_CACHE_DIR")
+    if not path:
+        return None
+    try:
+        return str(private_dir(Path(path)))
+    except OSError as err:
+        logger.warning("Font cache disabled: %s", err)
+        return None
+
+
 FONTS = {
     "Merriweather": {
         "normal": "Merriweather/Merriweather-Regular.ttf",
@@ -26,11 +58,162 @@ FONTS = {
     "SourceSans": {
         "normal": "SourceSans/SourceSans3-Regular.ttf",
         "bold": "SourceSans/SourceSans3-Bold.ttf",
-        "italic": "SourceSans/SourceSans3-It.ttf",
-        "boldItalic": "SourceSans/SourceSans3-BoldIt.ttf",
+        "italic": "SourceSans/SourceSans3-Italic.ttf",
+        "boldItalic": "SourceSans/SourceSans3-BoldItalic.ttf",
     },
 }
 
+SUBSET_CACHE_SIZE = 32
+
+
+@dataclass
+class FontLoad:
+    name: str
+    seconds: float
+    from_cache: bool
+
+
+@dataclass
+class FontMetrics:
+    parse_seconds: dict[str, float] = field(default_factory=dict)
+    loaded_from_cache: dict[str, bool] = field(default_factory=dict)
+    subset_hits: int = 0
+    subset_misses: int = 0
+    # Loads not yet handed to a render's stats; see take_font_loads().
+    pending_loads: list[FontLoad] = field(default_factory=list)
+
+
+FONT_METRICS = FontMetrics()
+
+_usage = threading.local()
+_loads_lock = threading.Lock()
+
+
+@dataclass
+class FontUsage:
+    embedded_bytes: int = 0
+    subset_hits: int = 0
+    subset_misses: int = 0
+
+
+@contextmanager
+def track_font_usage():
+    usage = FontUsage()
+    previous = getattr(_usage, "current", None)
+    _usage.current = usage
+    try:
+        yield usage
+    finally:
+        _usage.current = previous
+
+
+def take_font_loads() -> list[FontLoad]:
+    """Return the font loads of this process not returned before.
+
+    Fonts are parsed wherever renders run, often a pool worker, so the loads
+    travel back with a render's stats to be recorded by the API process.
+    """
+    with _loads_lock:
+        loads, FONT_METRICS.pending_loads = FONT_METRICS.pending_loads, []
+    return loads
+
+
+def _pdf_scale(units_per_em: int):
+    if units_per_em == 1000:
+        return lambda x: x
+    return partial(operator.mul, 1000 / units_per_em)
+
+
+class CachedTTFont(TTFont):
+    # TTFont keeps a lambda and a per-document WeakKeyDictionary, neither of
+    # which pickles; both are dropped here and rebuilt on load.
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("state", None)
+        face = state["face"].__dict__.copy()
+        face.pop("_pdfScale", None)
+        face.pop("makeSubset", None)
+        state["face"] = face
+        return state
+
+    def __setstate__(self, state):
+        face = TTFontFace.__new__(TTFontFace)
+        face.__dict__.update(state.pop("face"))
+        face._pdfScale = _pdf_scale(face.unitsPerEm)
+        self.__dict__.update(state, face=face, state=WeakKeyDictionary())
+
+
+def _memoize_subsets(face: TTFontFace) -> None:
+    # The parser reads through shared file offsets, so subsetting is also
+    # serialised here for renders running on a thread pool.
+    make_subset = face.makeSubset
+    subsets: OrderedDict[tuple[int, ...], bytes] = OrderedDict()
+    lock = threading.Lock()
+
+    def cached_make_subset(subset):
+        key = tuple(subset)
+        with lock:
+            content = subsets.get(key)
+            hit = content is not None
+            if hit:
+                FONT_METRICS.subset_hits += 1
+                subsets.move_to_end(key)
+            else:
+                FONT_METRICS.subset_misses += 1
+                content = subsets[key] = make_subset(subset)
+                if len(subsets) > SUBSET_CACHE_SIZE:
+                    subsets.popitem(last=False)
+        usage = getattr(_usage, "current", None)
+        if usage is not None:
+            usage.embedded_bytes += len(content)
+            if hit:
+                usage.subset_hits += 1
+            else:
+                usage.subset_misses += 1
+        return content
+
+    face.makeSubset = cached_make_subset
+
+
+def _load_font(name: str, path: str) -> TTFont:
+    started = time.perf_counter()
+    cache_dir = _font_cache_dir()
+    cache_path = None
+    font = None
+
+    if cache_dir:
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        py = f"{sys.version_info.major}{sys.version_info.minor}"
+        cache_path = os.path.join(cache_dir, f"{digest}-rl{RL_VERSION}-py{py}.pickle")
+        try:
+            with open(cache_path, "rb") as f:
+                font = pickle.load(f)
+            font.fontName = name
+        except Exception:
+            font = None
+
+    FONT_METRICS.loaded_from_cache[name] = font is not None
+    if font is None:
+        font = CachedTTFont(name, path)
+        if cache_path:
+            try:
+                tmp = f"{cache_path}.{os.getpid()}.tmp"
+                with open(tmp, "wb") as f:
+                    pickle.dump(font, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, cache_path)
+            except OSError:
+                pass
+
+    _memoize_subsets(font.face)
+    seconds = time.perf_counter() - started
+    FONT_METRICS.parse_seconds[name] = seconds
+    with _loads_lock:
+        FONT_METRICS.pending_loads.append(
+            FontLoad(name, seconds, FONT_METRICS.loaded_from_cache[name])
+        )
+    return font
+
 
 def _font_name(family: str, style: str) -> str:
     suffix = {
@@ -58,7 +241,7 @@ def register_fonts() -> None:
                 names[style] = name
                 continue
             try:
-                pdfmetrics.registerFont(TTFont(name, rel_path))
+                pdfmetrics.registerFont(_load_font(name, os.path.join(root, rel_path)))
                 registered.add(name)
                 names[style] = name
             except Exception as e:
@@ -71,3 +254,10 @@ def register_fonts() -> None:
             italic=names.get("italic"),
             boldItalic=names.get("boldItalic"),
         )
+
+
+# Registration is deferred to the first render so that a process which only
+# hands renders to a worker pool never parses the TTFs itself.
+@cache
+def ensure_fonts() -> None:
+    register_fonts()
@@ -1,29 +1,91 @@
-from typing import Annotated
+import time
 
-from fastapi import FastAPI, Depends
-from openai import AsyncOpenAI
+_imports_started = time.perf_counter()
+
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse
+
+from app.ai.dependencies import AIClient
+from app.core.dependencies import (
+    get_fixtures,
+    get_job_queue,
+    get_pdf_cache,
+    get_render_pool,
+    get_render_settings,
+)
+from app.core.metrics import HTTP_REQUEST_SECONDS, REGISTRY
+from app.core.startup import STARTUP
+from app.router import router, run_render_job, warm_examples
+
+STARTUP.record("imports", time.perf_counter() - _imports_started)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    settings = get_render_settings()
+    with STARTUP.phase("fixtures"):
+        fixtures = get_fixtures()
+    if settings.warmup:
+        with STARTUP.phase("warmup"):
+            font_seconds = await get_render_pool().warm(fixtures.resumes["senior"])
+        if font_seconds:
+            # Part of warmup, spent in the render workers.
+            STARTUP.record("fonts", font_seconds)
+    if settings.warm_examples:
+        with STARTUP.phase("warm_examples"):
+            await warm_examples(get_render_pool(), get_pdf_cache())
+    with STARTUP.phase("job_queue"):
+        await get_job_queue().start(run_render_job)
+    STARTUP.log()
+    yield
+    await get_job_queue().stop()
+    get_render_pool().shutdown()
 
-from app.ai.dependencies import get_openai_client
-from app.fonts import register_fonts
-from app.router import router
 
 app = FastAPI(
     title="Resume PDF Generator",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
-register_fonts()
-
 app.include_router(router)
 
 
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # Labelled by route template, not raw path, to keep cardinality bounded.
+        route = request.scope.get("route")
+        HTTP_REQUEST_SECONDS.observe(
+            time.perf_counter() - started,
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status=status,
+        )
+
+
 @app.get("/health")
 async def healthcheck() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    return PlainTextResponse(
+        REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 @app.post("/ai/ping")
-async def ai_ping(ai_client: Annotated[AsyncOpenAI, Depends(get_openai_client)]):
+async def ai_ping(ai_client: AIClient):
     resp = await ai_client.responses.create(
         model="gpt-4.1-mini",
         input="This is health check. Reply with 'pong'",
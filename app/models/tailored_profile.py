@@ -38,3 +38,8 @@ class TailoredProfile(
     image_url: str | None = None
     social_links: list[SocialLink] | None = None
     languages: list[Language]
+
+
+class StoredTailoredProfile(BaseModel):
+    id: str
+    profile: TailoredProfile
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+from .job_posting import JobPosting
+from .resume import ResumePayload
+
+
+class TailoringRequest(BaseModel):
+    job: JobPosting
+    resume: ResumePayload
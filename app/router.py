@@ -1,18 +1,52 @@
-import io
+import asyncio
 import json
 from enum import Enum
-from io import BytesIO
-from pathlib import Path
+from functools import cache
 from typing import Annotated
-from fastapi import APIRouter, Body, HTTPException, Query, Depends
-from fastapi.responses import StreamingResponse
-from openai import AsyncOpenAI
+from fastapi import (
+    APIRouter,
+    HTTPException,
+    Query,
+    Depends,
+    Header,
+    Request,
+    Response,
+)
+from fastapi.responses import HTMLResponse, StreamingResponse
+from pydantic import AnyHttpUrl, BaseModel
 
-from app.ai.dependencies import get_openai_client
-from app.core.profile_builder import build_profile
+from app.ai.cache import TailoringCache
+from app.ai.dependencies import AIClient, get_openai_client, get_tailoring_cache
+from app.core.archive import build_zip, safe_filename, stream_zip
+from app.core.config import BatchSettings
+from app.core.dependencies import (
+    get_batch_settings,
+    get_fixtures,
+    get_job_queue,
+    get_pdf_cache,
+    get_profile_store,
+    get_render_pool,
+)
+from app.core.ingest import json_body, json_body_openapi
+from app.core.jobs import JobQueue, JobQueueFull, JobStatus, RenderJob, UnsafeWebhook
+from app.core.layout import LayoutReport, measure_layout
+from app.core.metrics import PDF_CACHE_REQUESTS
+from app.core.pdf_cache import PdfCache, pdf_cache_key
+from app.core.pdf_generator import DEFAULT_MARGINS, DEFAULT_PAGESIZE, iter_chunks
+from app.core.preview import ThumbnailsUnavailable, preview_html, render_thumbnail
+from app.core.profile_builder import (
+    PARTS,
+    assemble_profile,
+    build_profile,
+    iter_profile_parts,
+)
+from app.core.profile_store import ProfileStore
+from app.core.render_pool import RenderPool, RenderPoolSaturated, RenderTimeout
+from app.core.timing import request_timings, server_timing_header, stage
 from app.models import ResumePayload
 from app.models.job_posting import JobPosting
-from app.core.pdf_generator import generate_pdf_bytes
+from app.models.tailored_profile import StoredTailoredProfile, TailoredProfile
+from app.models.tailoring_request import TailoringRequest
 
 router = APIRouter(prefix="", tags=["Resume PDF Generator"])
 
@@ -29,69 +63,662 @@ class Style(str, Enum):
     elegant = "elegant"
 
 
+def pdf_etag(
+    data: TailoredProfile | ResumePayload, style: Style, max_pages: int | None = None
+) -> str:
+    return pdf_cache_key(
+        data, style.value, DEFAULT_PAGESIZE, DEFAULT_MARGINS, max_pages
+    )
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [t.strip().removeprefix("W/").strip('"') for t in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": f'"{etag}"'})
+
+
+class BatchItem(BaseModel):
+    job: JobPosting
+    resume: ResumePayload
+    style: Style = Style.simple
+    filename: str | None = None
+
+
+class BatchRequest(BaseModel):
+    items: list[BatchItem]
+
+
+async def render_pdf(
+    pool: RenderPool,
+    cache: PdfCache,
+    data: TailoredProfile | ResumePayload,
+    style: Style,
+    etag: str,
+    max_pages: int | None = None,
+) -> bytes:
+    if (cached := cache.get(etag)) is not None:
+        PDF_CACHE_REQUESTS.inc(result="hit")
+        return cached
+    PDF_CACHE_REQUESTS.inc(result="miss")
+
+    try:
+        with stage("render"):
+            pdf_bytes = await pool.render(
+                data=data,
+                template_key=style.value,
+                max_pages=max_pages,
+                pagesize=DEFAULT_PAGESIZE,
+                margins=DEFAULT_MARGINS,
+            )
+    except RenderPoolSaturated as err:
+        raise HTTPException(
+            status_code=503, detail=str(err), headers={"Retry-After": "1"}
+        ) from err
+    except RenderTimeout as err:
+        raise HTTPException(status_code=504, detail=str(err)) from err
+    except Exception as err:
+        raise HTTPException(status_code=500, detail=f"Failed to render PDF. Reason: {err}") from err
+
+    cache.put(etag, pdf_bytes)
+    return pdf_bytes
+
+
+async def run_in_pool(pool: RenderPool, fn, /, *args, **kwargs):
+    try:
+        return await pool.run(fn, *args, **kwargs)
+    except RenderPoolSaturated as err:
+        raise HTTPException(
+            status_code=503, detail=str(err), headers={"Retry-After": "1"}
+        ) from err
+    except RenderTimeout as err:
+        raise HTTPException(status_code=504, detail=str(err)) from err
+
+
+ThumbnailWidth = Annotated[
+    int, Query(ge=64, le=1240, description="Thumbnail width in pixels")
+]
+
+
+def thumbnail_response(png: bytes, etag: str) -> Response:
+    return Response(png, media_type="image/png", headers={"ETag": f'"{etag}"'})
+
+
+async def render_thumbnail_png(
+    pool: RenderPool,
+    cache: PdfCache,
+    data: TailoredProfile | ResumePayload,
+    style: Style,
+    etag: str,
+    width: int,
+) -> bytes:
+    # Stored next to the PDF, so gallery pages only pay for a render once per
+    # document and width, and reuse the PDF when it was already downloaded.
+    suffix = f".{width}.png"
+    if (cached := cache.get(etag, suffix)) is not None:
+        return cached
+
+    pdf_bytes = await render_pdf(pool, cache, data, style, etag)
+    try:
+        png = await run_in_pool(pool, render_thumbnail, pdf_bytes, width)
+    except ThumbnailsUnavailable as err:
+        raise HTTPException(status_code=501, detail=str(err)) from err
+    cache.put(etag, png, suffix)
+    return png
+
+
+# Fixtures are loaded once and never change, so their ETags are fixed too.
+@cache
+def example_etag(level: Level, style: Style, max_pages: int | None = None) -> str:
+    return pdf_etag(get_fixtures().resumes[level.value], style, max_pages)
+
+
+async def warm_examples(pool: RenderPool, cache: PdfCache) -> None:
+    await asyncio.gather(
+        *(
+            render_pdf(
+                pool,
+                cache,
+                get_fixtures().resumes[level.value],
+                style,
+                example_etag(level, style),
+            )
+            for level in Level
+            for style in Style
+        )
+    )
+
+
 @router.get(
     "/example-resume",
     response_class=StreamingResponse,
     summary="Render example resume PDF",
 )
 async def generate_example_resume(
+    pool: Annotated[RenderPool, Depends(get_render_pool)],
+    cache: Annotated[PdfCache, Depends(get_pdf_cache)],
+    if_none_match: Annotated[str | None, Header()] = None,
     style: Annotated[Style, Query(description="Choose style")] = Style.simple,
     level: Annotated[Level, Query(description="Choose level")] = Level.junior,
+    max_pages: Annotated[
+        int | None,
+        Query(ge=1, description="Shrink type and trim content to fit this many pages"),
+    ] = None,
 ) -> StreamingResponse:
-    package_dir = Path(__file__).resolve().parent
-    fixtures_dir = package_dir / "fixtures"
-    json_path = fixtures_dir / f"resume_{level.value}.json"
-
-    if not json_path.exists():
-        raise HTTPException(status_code=500, detail=f"Fixture not found: {json_path}")
+    etag = example_etag(level, style, max_pages)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
 
-    try:
-        with json_path.open("r", encoding="utf-8") as f:
-            raw = json.load(f)
-    except Exception:
-        raise HTTPException(status_code=500, detail="Failed to load fixture JSON")
+    payload = get_fixtures().resumes[level.value]
+    pdf_bytes = await render_pdf(pool, cache, payload, style, etag, max_pages)
 
-    payload = ResumePayload(**raw)
-
-    pdf_bytes = generate_pdf_bytes(
-        data=payload,
-        template_key=style,
-    )
-
-    buffer = BytesIO(pdf_bytes)
     headers = {
         "Content-Disposition": f'attachment; filename="resume_{level.value}_{style.value}.pdf"',
         "Content-Length": str(len(pdf_bytes)),
+        "ETag": f'"{etag}"',
     }
-    return StreamingResponse(buffer, media_type="application/pdf", headers=headers)
+    return StreamingResponse(
+        iter_chunks(pdf_bytes), media_type="application/pdf", headers=headers
+    )
+
+
+@router.get(
+    "/example-resume/preview",
+    response_class=HTMLResponse,
+    summary="Preview example resume as HTML",
+)
+async def preview_example_resume(
+    pool: Annotated[RenderPool, Depends(get_render_pool)],
+    style: Annotated[Style, Query(description="Choose style")] = Style.simple,
+    level: Annotated[Level, Query(description="Choose level")] = Level.junior,
+) -> HTMLResponse:
+    payload = get_fixtures().resumes[level.value]
+    return HTMLResponse(await run_in_pool(pool, preview_html, payload, style.value))
+
+
+@router.get(
+    "/example-resume/thumbnail",
+    response_class=Response,
+    responses={
+        200: {"content": {"image/png": {}}},
+        501: {"description": "The 'thumbnails' extra is not installed"},
+    },
+    summary="Render the first page of an example resume as a PNG",
+)
+async def thumbnail_example_resume(
+    pool: Annotated[RenderPool, Depends(get_render_pool)],
+    cache: Annotated[PdfCache, Depends(get_pdf_cache)],
+    style: Annotated[Style, Query(description="Choose style")] = Style.simple,
+    level: Annotated[Level, Query(description="Choose level")] = Level.junior,
+    width: ThumbnailWidth = 240,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    etag = example_etag(level, style)
+    if etag_matches(if_none_match, f"{etag}.{width}"):
+        return not_modified(f"{etag}.{width}")
+    payload = get_fixtures().resumes[level.value]
+    png = await render_thumbnail_png(pool, cache, payload, style, etag, width)
+    return thumbnail_response(png, f"{etag}.{width}")
 
 
 @router.post(
     "/tailored_profile",
     response_class=StreamingResponse,
     summary="Generate ai-tailored resume",
+    openapi_extra=json_body_openapi(TailoringRequest),
 )
 async def render_resume(
-    ai_client: Annotated[AsyncOpenAI, Depends(get_openai_client)],
-    job: Annotated[JobPosting, Body()],
-    resume: Annotated[ResumePayload, Body()],
+    timings: Annotated[dict[str, float], Depends(request_timings)],
+    ai_client: AIClient,
+    tailoring_cache: Annotated[TailoringCache, Depends(get_tailoring_cache)],
+    pool: Annotated[RenderPool, Depends(get_render_pool)],
+    cache: Annotated[PdfCache, Depends(get_pdf_cache)],
+    body: Annotated[TailoringRequest, Depends(json_body(TailoringRequest))],
     style: Annotated[Style | None, Query(description="Choose style")] = Style.simple,
     filename: Annotated[
         str | None, Query(description="Optional output filename")
     ] = None,
+    max_pages: Annotated[
+        int | None,
+        Query(ge=1, description="Shrink type and trim content to fit this many pages"),
+    ] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
 ) -> StreamingResponse:
-    data = await build_profile(job=job, resume=resume, ai_client=ai_client)
+    data = await build_profile(
+        job=body.job,
+        resume=body.resume,
+        ai_client=ai_client,
+        cache=tailoring_cache,
+    )
 
-    try:
-        pdf_bytes = generate_pdf_bytes(data=data, template_key=style)
-    except Exception as err:
-        raise HTTPException(status_code=500, detail=f"Failed to render PDF. Reason: {err}") from err
+    style = style or Style.simple
+    etag = pdf_etag(data, style, max_pages)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    pdf_bytes = await render_pdf(pool, cache, data, style, etag, max_pages)
 
     return StreamingResponse(
-        io.BytesIO(pdf_bytes),
+        iter_chunks(pdf_bytes),
         media_type="application/pdf",
         headers={
-            "Content-Disposition": f'attachment; filename="{filename or "_".join(resume.fullname.split() + ["resume"])}.pdf"',
+            "Content-Disposition": f'attachment; filename="{filename or "_".join(body.resume.fullname.split() + ["resume"])}.pdf"',
+            "Content-Length": str(len(pdf_bytes)),
+            "Cache-Control": "no-store",
+            "ETag": f'"{etag}"',
+            "Server-Timing": server_timing_header(timings),
+        },
+    )
+
+
+@router.post(
+    "/tailored_profiles",
+    response_model=StoredTailoredProfile,
+    summary="Tailor a resume and store the result for later rendering",
+    openapi_extra=json_body_openapi(TailoringRequest),
+)
+async def create_tailored_profile(
+    ai_client: AIClient,
+    tailoring_cache: Annotated[TailoringCache, Depends(get_tailoring_cache)],
+    store: Annotated[ProfileStore, Depends(get_profile_store)],
+    body: Annotated[TailoringRequest, Depends(json_body(TailoringRequest))],
+) -> StoredTailoredProfile:
+    data = await build_profile(
+        job=body.job, resume=body.resume, ai_client=ai_client, cache=tailoring_cache
+    )
+    return StoredTailoredProfile(id=store.save(data), profile=data)
+
+
+def get_stored_profile(
+    profile_id: str, store: Annotated[ProfileStore, Depends(get_profile_store)]
+) -> TailoredProfile:
+    data = store.get(profile_id)
+    if data is None:
+        raise HTTPException(status_code=404, detail=f"Profile not found: {profile_id}")
+    return data
+
+
+@router.get(
+    "/tailored_profiles/{profile_id}",
+    response_model=StoredTailoredProfile,
+    summary="Get a stored tailored profile",
+)
+async def read_tailored_profile(
+    profile_id: str,
+    data: Annotated[TailoredProfile, Depends(get_stored_profile)],
+) -> StoredTailoredProfile:
+    return StoredTailoredProfile(id=profile_id, profile=data)
+
+
+@router.get(
+    "/tailored_profiles/{profile_id}/pdf",
+    response_class=StreamingResponse,
+    summary="Render a stored tailored profile in one or more styles",
+)
+async def render_tailored_profile(
+    profile_id: str,
+    data: Annotated[TailoredProfile, Depends(get_stored_profile)],
+    pool: Annotated[RenderPool, Depends(get_render_pool)],
+    cache: Annotated[PdfCache, Depends(get_pdf_cache)],
+    style: Annotated[
+        list[Style], Query(description="One style renders a PDF, several a ZIP")
+    ] = [Style.simple],
+    max_pages: Annotated[
+        int | None,
+        Query(ge=1, description="Shrink type and trim content to fit this many pages"),
+    ] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+):
+    styles = list(dict.fromkeys(style))
+    basename = safe_filename("_".join(data.fullname.split() + ["resume"]))
+
+    if len(styles) == 1:
+        etag = pdf_etag(data, styles[0], max_pages)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        pdf_bytes = await render_pdf(pool, cache, data, styles[0], etag, max_pages)
+        return StreamingResponse(
+            iter_chunks(pdf_bytes),
+            media_type="application/pdf",
+            headers={
+                "Content-Disposition": f'attachment; filename="{basename}.pdf"',
+                "Content-Length": str(len(pdf_bytes)),
+                "ETag": f'"{etag}"',
+            },
+        )
+
+    rendered = await asyncio.gather(
+        *(
+            render_pdf(pool, cache, data, s, pdf_etag(data, s, max_pages), max_pages)
+            for s in styles
+        )
+    )
+    archive = build_zip(
+        {f"{basename}_{s.value}.pdf": pdf for s, pdf in zip(styles, rendered)}
+    )
+    return StreamingResponse(
+        iter_chunks(archive),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": f'attachment; filename="{basename}.zip"',
+            "Content-Length": str(len(archive)),
+        },
+    )
+
+
+@router.get(
+    "/tailored_profiles/{profile_id}/layout",
+    response_model=LayoutReport,
+    summary="Measure page count and frame usage without rendering a PDF",
+)
+async def measure_tailored_profile(
+    profile_id: str,
+    data: Annotated[TailoredProfile, Depends(get_stored_profile)],
+    pool: Annotated[RenderPool, Depends(get_render_pool)],
+    style: Annotated[Style, Query(description="Choose style")] = Style.simple,
+) -> LayoutReport:
+    return await run_in_pool(
+        pool,
+        measure_layout,
+        data,
+        style.value,
+        pagesize=DEFAULT_PAGESIZE,
+        margins=DEFAULT_MARGINS,
+    )
+
+
+@router.get(
+    "/tailored_profiles/{profile_id}/preview",
+    response_class=HTMLResponse,
+    summary="Preview a stored tailored profile as HTML",
+)
+async def preview_tailored_profile(
+    profile_id: str,
+    data: Annotated[TailoredProfile, Depends(get_stored_profile)],
+    pool: Annotated[RenderPool, Depends(get_render_pool)],
+    style: Annotated[Style, Query(description="Choose style")] = Style.simple,
+) -> HTMLResponse:
+    return HTMLResponse(await run_in_pool(pool, preview_html, data, style.value))
+
+
+@router.get(
+    "/tailored_profiles/{profile_id}/thumbnail",
+    response_class=Response,
+    responses={
+        200: {"content": {"image/png": {}}},
+        501: {"description": "The 'thumbnails' extra is not installed"},
+    },
+    summary="Render the first page of a stored tailored profile as a PNG",
+)
+async def thumbnail_tailored_profile(
+    profile_id: str,
+    data: Annotated[TailoredProfile, Depends(get_stored_profile)],
+    pool: Annotated[RenderPool, Depends(get_render_pool)],
+    cache: Annotated[PdfCache, Depends(get_pdf_cache)],
+    style: Annotated[Style, Query(description="Choose style")] = Style.simple,
+    width: ThumbnailWidth = 240,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    etag = pdf_etag(data, style)
+    if etag_matches(if_none_match, f"{etag}.{width}"):
+        return not_modified(f"{etag}.{width}")
+    png = await render_thumbnail_png(pool, cache, data, style, etag, width)
+    return thumbnail_response(png, f"{etag}.{width}")
+
+
+@router.post(
+    "/tailored_profile/batch",
+    response_class=StreamingResponse,
+    summary="Generate ai-tailored resumes for many candidates as a ZIP",
+    openapi_extra=json_body_openapi(BatchRequest),
+)
+async def render_resume_batch(
+    ai_client: AIClient,
+    tailoring_cache: Annotated[TailoringCache, Depends(get_tailoring_cache)],
+    pool: Annotated[RenderPool, Depends(get_render_pool)],
+    cache: Annotated[PdfCache, Depends(get_pdf_cache)],
+    settings: Annotated[BatchSettings, Depends(get_batch_settings)],
+    body: Annotated[BatchRequest, Depends(json_body(BatchRequest))],
+) -> StreamingResponse:
+    items = body.items
+    if not items:
+        raise HTTPException(status_code=422, detail="Batch is empty")
+    if len(items) > settings.max_items:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch too large: {len(items)} items (max {settings.max_items})",
+        )
+
+    limit = asyncio.Semaphore(settings.concurrency)
+
+    async def process(index: int, item: BatchItem) -> tuple[int, str, bytes]:
+        basename = safe_filename(
+            item.filename or "_".join(item.resume.fullname.split() + ["resume"])
+        )
+        name = f"{index:04d}_{basename}_{item.style.value}.pdf"
+        async with limit:
+            data = await build_profile(
+                job=item.job,
+                resume=item.resume,
+                ai_client=ai_client,
+                cache=tailoring_cache,
+            )
+            pdf_bytes = await render_pdf(
+                pool, cache, data, item.style, pdf_etag(data, item.style)
+            )
+        return index, name, pdf_bytes
+
+    async def entries():
+        tasks = [asyncio.create_task(process(i, item)) for i, item in enumerate(items)]
+        manifest = [
+            {"index": i, "fullname": item.resume.fullname, "style": item.style.value}
+            for i, item in enumerate(items)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    index, name, pdf_bytes = await next_done
+                except Exception:
+                    continue
+                manifest[index].update(status="ok", file=name)
+                yield name, pdf_bytes
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        for entry, task in zip(manifest, tasks):
+            if "status" in entry:
+                continue
+            err = task.exception()
+            detail = err.detail if isinstance(err, HTTPException) else str(err)
+            entry.update(status="error", error=detail or type(err).__name__)
+        yield "manifest.json", json.dumps({"items": manifest}, indent=2).encode()
+
+    return StreamingResponse(
+        stream_zip(entries()),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": 'attachment; filename="resumes.zip"',
             "Cache-Control": "no-store",
         },
     )
+
+
+def sse_event(event: str, data: str) -> bytes:
+    lines = "".join(f"data: {line}\n" for line in data.splitlines() or [""])
+    return f"event: {event}\n{lines}\n".encode()
+
+
+@router.post(
+    "/tailored_profile/stream",
+    response_class=StreamingResponse,
+    summary="Tailor a resume, streaming each part as Server-Sent Events",
+    openapi_extra=json_body_openapi(TailoringRequest),
+)
+async def stream_tailored_profile(
+    request: Request,
+    ai_client: AIClient,
+    tailoring_cache: Annotated[TailoringCache, Depends(get_tailoring_cache)],
+    store: Annotated[ProfileStore, Depends(get_profile_store)],
+    pool: Annotated[RenderPool, Depends(get_render_pool)],
+    cache: Annotated[PdfCache, Depends(get_pdf_cache)],
+    body: Annotated[TailoringRequest, Depends(json_body(TailoringRequest))],
+    style: Annotated[Style, Query(description="Style to pre-render")] = Style.simple,
+) -> StreamingResponse:
+    async def events():
+        parts = {}
+        try:
+            async for name, part in iter_profile_parts(
+                job=body.job,
+                resume=body.resume,
+                ai_client=ai_client,
+                cache=tailoring_cache,
+            ):
+                parts[name] = part
+                yield sse_event(name, part.model_dump_json())
+
+            data = assemble_profile(body.resume, *(parts[name] for name in PARTS))
+            profile_id = store.save(data)
+            await render_pdf(pool, cache, data, style, pdf_etag(data, style))
+        except Exception as err:
+            detail = err.detail if isinstance(err, HTTPException) else str(err)
+            yield sse_event("error", json.dumps({"detail": detail}))
+            return
+
+        pdf_url = request.url_for("render_tailored_profile", profile_id=profile_id)
+        yield sse_event(
+            "done",
+            json.dumps(
+                {"id": profile_id, "pdf_url": f"{pdf_url}?style={style.value}"}
+            ),
+        )
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
+    )
+
+
+async def run_render_job(job: RenderJob, payload: TailoringRequest) -> dict:
+    data = await build_profile(
+        job=payload.job,
+        resume=payload.resume,
+        ai_client=get_openai_client(),
+        cache=get_tailoring_cache(),
+    )
+    style = Style(job.style)
+    etag = pdf_etag(data, style)
+    await render_pdf(get_render_pool(), get_pdf_cache(), data, style, etag)
+    return {"profile_id": get_profile_store().save(data), "etag": etag}
+
+
+async def get_render_job(
+    job_id: str, queue: Annotated[JobQueue, Depends(get_job_queue)]
+) -> RenderJob:
+    job = await queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job
+
+
+@router.post(
+    "/jobs",
+    response_model=RenderJob,
+    status_code=202,
+    summary="Queue an ai-tailored resume render and return a job to poll",
+    openapi_extra=json_body_openapi(TailoringRequest),
+)
+async def submit_render_job(
+    request: Request,
+    response: Response,
+    queue: Annotated[JobQueue, Depends(get_job_queue)],
+    body: Annotated[TailoringRequest, Depends(json_body(TailoringRequest))],
+    style: Annotated[Style, Query(description="Choose style")] = Style.simple,
+    priority: Annotated[int, Query(description="Higher runs first")] = 0,
+    webhook_url: Annotated[
+        AnyHttpUrl | None, Query(description="POSTed the job when it finishes")
+    ] = None,
+) -> RenderJob:
+    if webhook_url is not None:
+        try:
+            await queue.check_webhook(webhook_url)
+        except UnsafeWebhook as err:
+            raise HTTPException(status_code=422, detail=str(err)) from err
+
+    render_job = RenderJob(
+        style=style.value, priority=priority, webhook_url=webhook_url
+    )
+    render_job.result_url = str(
+        request.url_for("download_render_job", job_id=render_job.id)
+    )
+    try:
+        await queue.submit(render_job, body)
+    except JobQueueFull as err:
+        raise HTTPException(
+            status_code=503, detail=str(err), headers={"Retry-After": "5"}
+        ) from err
+
+    response.headers["Location"] = str(
+        request.url_for("read_render_job", job_id=render_job.id)
+    )
+    return render_job
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=RenderJob,
+    summary="Get the status of a render job",
+)
+async def read_render_job(
+    job_id: str,
+    job: Annotated[RenderJob, Depends(get_render_job)],
+) -> RenderJob:
+    return job
+
+
+@router.get(
+    "/jobs/{job_id}/pdf",
+    response_class=StreamingResponse,
+    summary="Download the PDF of a finished render job",
+)
+async def download_render_job(
+    job_id: str,
+    job: Annotated[RenderJob, Depends(get_render_job)],
+    pool: Annotated[RenderPool, Depends(get_render_pool)],
+    cache: Annotated[PdfCache, Depends(get_pdf_cache)],
+    store: Annotated[ProfileStore, Depends(get_profile_store)],
+    if_none_match: Annotated[str | None, Header()] = None,
+):
+    if job.status == JobStatus.failed:
+        raise HTTPException(status_code=409, detail=f"Job failed: {job.error}")
+    if job.status != JobStatus.succeeded:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Job is {job.status.value}",
+            headers={"Retry-After": "2"},
+        )
+    if etag_matches(if_none_match, job.etag):
+        return not_modified(job.etag)
+
+    pdf_bytes = cache.get(job.etag)
+    if pdf_bytes is None:
+        # Evicted from the PDF cache; the stored profile is enough to re-render.
+        data = store.get(job.profile_id)
+        if data is None:
+            raise HTTPException(status_code=410, detail="Job result has expired")
+        pdf_bytes = await render_pdf(pool, cache, data, Style(job.style), job.etag)
+
+    return StreamingResponse(
+        iter_chunks(pdf_bytes),
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f'attachment; filename="resume_{job_id}.pdf"',
+            "Content-Length": str(len(pdf_bytes)),
+            "ETag": f'"{job.etag}"',
+        },
+    )
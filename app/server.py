@@ -0,0 +1,62 @@
+"""Production entry point: python -m app.server"""
+
+import copy
+import os
+
+import uvicorn
+from uvicorn.config import LOGGING_CONFIG
+
+from app.core.config import ServerSettings, available_cpus, private_dir
+
+
+def configure_environment(settings: ServerSettings, workers: int) -> None:
+    # Each worker is its own process with its own in-memory caches, so
+    # anything a later request may read from a different worker (cached PDFs,
+    # tailored parts, stored profiles, jobs) lives in the data directory.
+    defaults = {
+        "RENDER_WORKERS": str(max(1, available_cpus() // workers)),
+        "JOBS_DRAIN_SECONDS": str(settings.graceful_timeout_seconds),
+    }
+    if settings.data_dir is None:
+        if workers > 1:
+            raise SystemExit(
+                "SERVER_DATA_DIR must be set when running more than one worker"
+            )
+    else:
+        data_dir = private_dir(settings.data_dir)
+        defaults |= {
+            "RENDER_CACHE_DIR": str(data_dir / "pdf-cache"),
+            "TAILORING_CACHE_DIR": str(data_dir / "tailoring-cache"),
+            "PROFILE_STORE_DIR": str(data_dir / "profiles"),
+            "JOBS_BACKEND": "sqlite",
+            "JOBS_SQLITE_PATH": str(data_dir / "jobs.sqlite3"),
+            "APP_FONT_CACHE_DIR": str(data_dir / "fonts"),
+        }
+    for name, value in defaults.items():
+        os.environ.setdefault(name, value)
+
+
+def main() -> None:
+    settings = ServerSettings()
+    workers = 1 if settings.reload else settings.workers or available_cpus()
+    configure_environment(settings, workers)
+
+    # Worker processes only get uvicorn's logging setup; route the app's own
+    # loggers (startup report, job and retry warnings) through it as well.
+    log_config = copy.deepcopy(LOGGING_CONFIG)
+    log_config["loggers"]["app"] = {"handlers": ["default"], "level": "INFO"}
+
+    uvicorn.run(
+        "app.main:app",
+        host=settings.host,
+        port=settings.port,
+        workers=workers,
+        reload=settings.reload,
+        timeout_graceful_shutdown=settings.graceful_timeout_seconds,
+        proxy_headers=True,
+        log_config=log_config,
+    )
+
+
+if __name__ == "__main__":
+    main()
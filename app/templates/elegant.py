@@ -1,9 +1,8 @@
+from functools import cache
+
 from reportlab.platypus import (
-    Paragraph,
     Spacer,
     HRFlowable,
-    Frame,
-    PageTemplate,
     FrameBreak,
     NextPageTemplate,
 )
@@ -13,6 +12,9 @@ from reportlab.lib.units import mm
 from reportlab.lib import colors
 
 from app.templates.helpers.date_helpers import fmt_mmyyyy, fmt_range
+from app.templates.helpers.flowables import LeaveFrame, mark_section
+from app.templates.helpers.page_specs import FrameSpec, PageSpec
+from app.templates.helpers.paragraphs import CachedParagraph
 
 
 class ElegantTemplate:
@@ -90,18 +92,19 @@ class ElegantTemplate:
         )
 
     def _section_title(self, text: str) -> list:
-        return [Paragraph(text.upper(), self.h_sec), self._rule(0.5)]
+        title = CachedParagraph(text.upper(), self.h_sec)
+        return [mark_section(title, text.lower()), self._rule(0.5)]
 
     def _header_story(self, data) -> list:
         s: list = []
         fullname = getattr(data, "fullname", None)
-        s.append(Paragraph(fullname or "RESUME", self.h_name))
+        s.append(CachedParagraph(fullname or "RESUME", self.h_name))
         if getattr(data, "professional_title", None):
-            s.append(Paragraph(data.professional_title, self.h_title))
+            s.append(CachedParagraph(data.professional_title, self.h_title))
         meta_bits = [getattr(data, "location", None), getattr(data, "phone", None)]
         meta_line = " · ".join([b for b in meta_bits if b])
         if meta_line:
-            s.append(Paragraph(meta_line, self.meta))
+            s.append(CachedParagraph(meta_line, self.meta))
         s.append(self._rule(0.8))
         return s
 
@@ -110,7 +113,7 @@ class ElegantTemplate:
         if getattr(data, "skills", None):
             s += self._section_title("Skills")
             s.append(
-                Paragraph(
+                CachedParagraph(
                     ", ".join(
                         [
                             f"{x.name}{f' ({x.level})' if x.level else ''}"
@@ -124,7 +127,7 @@ class ElegantTemplate:
         if getattr(data, "languages", None):
             s += self._section_title("Languages")
             s.append(
-                Paragraph(
+                CachedParagraph(
                     ", ".join(
                         [
                             f"{l.name}{f' ({l.level})' if l.level else ''}"
@@ -157,7 +160,7 @@ class ElegantTemplate:
                     bits = [x for x in [name, issuer_link, date_txt] if x]
                     line = " — ".join(bits)
 
-                    s.append(Paragraph(line, self.body))
+                    s.append(CachedParagraph(line, self.body))
             s.append(Spacer(1, 6))
         if getattr(data, "social_links", None):
             s += self._section_title("Social")
@@ -166,7 +169,7 @@ class ElegantTemplate:
                 text = f"<link href='{sl.url}' color='darkblue'>{text}</link>"
                 if sl.description:
                     text += f" — {sl.description}"
-                s.append(Paragraph(text, self.body))
+                s.append(CachedParagraph(text, self.body))
             s.append(Spacer(1, 6))
         return s
 
@@ -174,34 +177,36 @@ class ElegantTemplate:
         s: list = []
         if getattr(data, "summary", None):
             s += self._section_title("Profile")
-            s.append(Paragraph(data.summary, self.body))
+            s.append(CachedParagraph(data.summary, self.body))
             s.append(Spacer(1, 8))
         if getattr(data, "experience", None):
             s += self._section_title("Experience")
             for exp in data.experience:
                 left = f"{exp.company}" + (f", {exp.location}" if exp.location else "")
-                s.append(Paragraph(f"{left} — <b>{exp.job_title}</b>", self.body))
+                s.append(CachedParagraph(f"{left} — <b>{exp.job_title}</b>", self.body))
                 rng = fmt_range(exp.start_date, exp.end_date)
                 if rng:
-                    s.append(Paragraph(rng.upper(), self.meta))
+                    s.append(CachedParagraph(rng.upper(), self.meta))
                 if exp.description:
-                    s.append(Paragraph(exp.description, self.body))
+                    s.append(CachedParagraph(exp.description, self.body))
                 if exp.challenge:
-                    s.append(Paragraph(f"<i>Challenge:</i> {exp.challenge}", self.body))
+                    s.append(
+                        CachedParagraph(f"<i>Challenge:</i> {exp.challenge}", self.body)
+                    )
                 s.append(Spacer(1, 6))
         if getattr(data, "education", None):
             s += self._section_title("Education")
             for ed in data.education:
                 left = f"{ed.school}" + (f", {ed.location}" if ed.location else "")
                 title = f"{left} — <b>{ed.degree}</b>" if ed.degree else left
-                s.append(Paragraph(title, self.body))
+                s.append(CachedParagraph(title, self.body))
                 rng = fmt_range(ed.start_date, ed.end_date)
                 if rng:
-                    s.append(Paragraph(rng.upper(), self.meta))
+                    s.append(CachedParagraph(rng.upper(), self.meta))
                 if ed.field_of_study:
-                    s.append(Paragraph(ed.field_of_study, self.meta))
+                    s.append(CachedParagraph(ed.field_of_study, self.meta))
                 if ed.description:
-                    s.append(Paragraph(ed.description, self.body))
+                    s.append(CachedParagraph(ed.description, self.body))
                 s.append(Spacer(1, 6))
         if getattr(data, "projects", None):
             s += self._section_title("Projects")
@@ -209,18 +214,22 @@ class ElegantTemplate:
                 title = p.name
                 if p.link:
                     title = f"<link href='{p.link}' color='darkblue'>{p.name}</link>"
-                s.append(Paragraph(title, self.body))
+                s.append(CachedParagraph(title, self.body))
                 if p.tech_stack:
-                    s.append(Paragraph(", ".join(p.tech_stack), self.meta))
+                    s.append(CachedParagraph(", ".join(p.tech_stack), self.meta))
                 if p.description:
-                    s.append(Paragraph(p.description, self.body))
+                    s.append(CachedParagraph(p.description, self.body))
                 s.append(Spacer(1, 6))
         return s
 
     def build_story(self, data) -> list:
         story: list = []
 
+        # The header frame is closed explicitly; otherwise the first section
+        # only leaves it by not fitting, which reads as an overflow. A header
+        # taller than HEADER_H has already left it, so nothing is skipped.
         story += self._header_story(data)
+        story.append(LeaveFrame("header"))
 
         story += self._left_story(data)
         story.append(FrameBreak())
@@ -230,43 +239,38 @@ class ElegantTemplate:
         story += self._right_story(data)
         return story
 
-    def get_page_templates(self):
-        header_frame = Frame(
+    @cache
+    def page_specs(self, pagesize=A4) -> tuple[PageSpec, ...]:
+        page_w, page_h = pagesize
+        body_h = page_h - self.MT - self.MB - self.HEADER_H
+        header_frame = FrameSpec(
+            "header",
             self.ML,
-            self.PAGE_H - self.MT - self.HEADER_H,
-            self.PAGE_W - self.ML - self.MR,
+            page_h - self.MT - self.HEADER_H,
+            page_w - self.ML - self.MR,
             self.HEADER_H,
-            id="header",
-            showBoundary=0,
         )
-        left_frame = Frame(
-            self.ML,
-            self.MB,
-            self.LEFT_W,
-            self.BODY_H,
-            id="left",
-            showBoundary=0,
-        )
-        right_frame = Frame(
+        left_frame = FrameSpec("left", self.ML, self.MB, self.LEFT_W, body_h)
+        right_frame = FrameSpec(
+            "right",
             self.ML + self.LEFT_W + self.GAP,
             self.MB,
-            self.RIGHT_W,
-            self.BODY_H,
-            id="right",
-            showBoundary=0,
+            page_w - self.ML - self.MR - self.LEFT_W - self.GAP,
+            body_h,
         )
 
-        first = PageTemplate(
-            id="TwoColFirst", frames=[header_frame, left_frame, right_frame]
-        )
+        first = PageSpec("TwoColFirst", (header_frame, left_frame, right_frame))
 
-        full_frame = Frame(
+        full_frame = FrameSpec(
+            "full",
             self.ML,
             self.MB,
-            self.PAGE_W - self.ML - self.MR,
-            self.PAGE_H - self.MT - self.MB,
-            id="full",
+            page_w - self.ML - self.MR,
+            page_h - self.MT - self.MB,
         )
-        right_only = PageTemplate(id="RightOnly", frames=[full_frame])
+        right_only = PageSpec("RightOnly", (full_frame,))
+
+        return (first, right_only)
 
-        return [first, right_only]
+    def get_page_templates(self, pagesize=A4):
+        return [spec.build() for spec in self.page_specs(tuple(pagesize))]
@@ -0,0 +1,78 @@
+from reportlab.platypus import Flowable
+from reportlab.platypus.doctemplate import LCActionFlowable
+
+
+def mark_section(flowable, name: str):
+    # Flowables that follow belong to the same section until the next marked
+    # one; layout measurements use this to report per-section heights.
+    flowable._section = name
+    return flowable
+
+
+def section_of(flowable) -> str | None:
+    return getattr(flowable, "_section", None)
+
+
+class LeaveFrame(LCActionFlowable):
+    """A ``FrameBreak`` that only fires while the named frame is current.
+
+    Closes a fixed-height frame such as a page header. Content that already
+    spilled out of it has moved on by itself, and breaking again would skip
+    the whole frame it spilled into.
+    """
+
+    def __init__(self, frame_id: str):
+        super().__init__(("frameEnd",))
+        self.frame_id = frame_id
+
+    def apply(self, doc):
+        if doc.frame.id == self.frame_id:
+            super().apply(doc)
+
+
+class TwoColumnRow(Flowable):
+    """One row of a two column table with top-aligned, single-flowable cells.
+
+    Lays out exactly like a ``Table`` row with the same widths and padding, but
+    each cell is wrapped once and the wrapped result is what gets drawn, where a
+    table wraps every cell again at draw time.
+    """
+
+    def __init__(
+        self,
+        cells,
+        col_widths,
+        padding=(0, 6, 0, 6),
+        empty_height=12,
+    ):
+        super().__init__()
+        self.cells = [cell or None for cell in cells]
+        self.col_widths = list(col_widths)
+        self.padding = padding
+        # A blank table cell still takes one line of the default cell font.
+        self.empty_height = empty_height
+        self._heights = [0.0] * len(self.cells)
+        for cell in self.cells:
+            if section_of(cell):
+                mark_section(self, section_of(cell))
+
+    def wrap(self, availWidth, availHeight):
+        left, right, top, bottom = self.padding
+        content = self.empty_height if None in self.cells else 0
+        for i, (cell, col_w) in enumerate(zip(self.cells, self.col_widths)):
+            if cell is None:
+                continue
+            _, h = cell.wrapOn(self.canv, col_w - left - right, availHeight)
+            self._heights[i] = h
+            content = max(content, h)
+        self.width = sum(self.col_widths)
+        self.height = content + top + bottom
+        return self.width, self.height
+
+    def draw(self):
+        left, _, top, _ = self.padding
+        x = 0
+        for cell, col_w, h in zip(self.cells, self.col_widths, self._heights):
+            if cell is not None:
+                cell.drawOn(self.canv, x + left, self.height - top - h)
+            x += col_w
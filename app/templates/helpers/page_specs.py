@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+
+from reportlab.platypus import Frame, PageTemplate
+
+
+@dataclass(frozen=True)
+class FrameSpec:
+    id: str
+    x1: float
+    y1: float
+    width: float
+    height: float
+
+    def build(self, frame_cls: type[Frame] = Frame) -> Frame:
+        return frame_cls(
+            self.x1, self.y1, self.width, self.height, id=self.id, showBoundary=0
+        )
+
+
+@dataclass(frozen=True)
+class PageSpec:
+    id: str
+    frames: tuple[FrameSpec, ...]
+
+    def build(self, frame_cls: type[Frame] = Frame) -> PageTemplate:
+        # Frames carry layout state during a build, so every render gets fresh
+        # instances from the precomputed geometry.
+        return PageTemplate(
+            id=self.id, frames=[f.build(frame_cls) for f in self.frames]
+        )
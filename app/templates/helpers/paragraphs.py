@@ -0,0 +1,117 @@
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import cache
+
+from reportlab.platypus import Paragraph
+
+from app.core.config import RenderSettings
+
+# Everything Paragraph.wrap leaves on the instance; drawing and splitting read
+# these back.
+_WRAP_STATE = (
+    "width",
+    "height",
+    "blPara",
+    "_wrapWidths",
+    "_width_max",
+    "_hyphenations",
+    "_splitLongWordCount",
+)
+
+
+def style_key(style) -> tuple:
+    # Resolved values rather than identity: templates build equal styles under
+    # different objects, and scaled copies differ only in a few sizes.
+    return tuple(getattr(style, name) for name in style.defaults)
+
+
+class ParagraphCache:
+    """Parsed markup and wrapped lines of paragraphs, shared by all templates.
+
+    Entries are never mutated after they are stored, so paragraphs with the
+    same text, style and width share the same fragments and line breaks.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, object] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, key: tuple):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+        counter = getattr(_usage, "counter", None)
+        if counter is not None:
+            result = (kind, "miss" if value is None else "hit")
+            counter[result] = counter.get(result, 0) + 1
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def put(self, key: tuple, value) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+_usage = threading.local()
+
+
+@contextmanager
+def track_paragraph_cache(counter: dict[tuple[str, str], int] | None = None):
+    counter = {} if counter is None else counter
+    previous = getattr(_usage, "counter", None)
+    _usage.counter = counter
+    try:
+        yield counter
+    finally:
+        _usage.counter = previous
+
+
+@cache
+def get_paragraph_cache() -> ParagraphCache:
+    return ParagraphCache(RenderSettings().paragraph_cache_entries)
+
+
+class CachedParagraph(Paragraph):
+    _cache_key = None
+
+    def _setup(self, text, style, bulletText, frags, cleaner):
+        # Split halves arrive as pre-broken fragments and are not cached.
+        if frags is not None or not isinstance(bulletText, (str, type(None))):
+            return super()._setup(text, style, bulletText, frags, cleaner)
+
+        paragraphs = get_paragraph_cache()
+        key = ("parse", text, style_key(style), bulletText, self.caseSensitive)
+        parsed = paragraphs.get("parse", key)
+        if parsed is None:
+            super()._setup(text, style, bulletText, frags, cleaner)
+            parsed = (self.text, self.style, self.frags, self.bulletText)
+            paragraphs.put(key, parsed)
+        else:
+            self.text, self.style, self.frags, self.bulletText = parsed
+            self.debug = 0
+        self._cache_key = key[1:]
+
+    def wrap(self, availWidth, availHeight):
+        if self._cache_key is None:
+            return super().wrap(availWidth, availHeight)
+
+        paragraphs = get_paragraph_cache()
+        key = ("wrap", *self._cache_key, availWidth)
+        state = paragraphs.get("wrap", key)
+        if state is None:
+            super().wrap(availWidth, availHeight)
+            state = {k: self.__dict__[k] for k in _WRAP_STATE if k in self.__dict__}
+            paragraphs.put(key, state)
+        else:
+            self.__dict__.update(state)
+        return self.width, self.height
@@ -0,0 +1,29 @@
+import copy
+from functools import cache
+
+from reportlab.lib.styles import ParagraphStyle
+
+
+@cache
+def scaled_template(template, scale: float):
+    # A copy of the template whose paragraph styles have font size, leading
+    # and paragraph spacing multiplied by scale; frames and rules are left as
+    # they are.
+    if scale == 1:
+        return template
+    scaled = copy.copy(template)
+    for name, style in vars(template).items():
+        if isinstance(style, ParagraphStyle):
+            setattr(
+                scaled,
+                name,
+                ParagraphStyle(
+                    style.name,
+                    parent=style,
+                    fontSize=style.fontSize * scale,
+                    leading=style.leading * scale,
+                    spaceBefore=style.spaceBefore * scale,
+                    spaceAfter=style.spaceAfter * scale,
+                ),
+            )
+    return scaled
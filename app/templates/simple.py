@@ -1,10 +1,15 @@
-from reportlab.platypus import Paragraph, Spacer, HRFlowable, Frame, PageTemplate
+from functools import cache
+
+from reportlab.platypus import Spacer, HRFlowable, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm
 from reportlab.lib import colors
 
 from app.templates.helpers.date_helpers import fmt_range, fmt_mmyyyy
+from app.templates.helpers.flowables import mark_section
+from app.templates.helpers.page_specs import FrameSpec, PageSpec
+from app.templates.helpers.paragraphs import CachedParagraph
 
 
 class SimpleTemplate:
@@ -79,6 +84,16 @@ class SimpleTemplate:
             leftIndent=4 * mm,
             backColor=colors.HexColor("#F9FAFB"),
         )
+        self.section_table_style = TableStyle(
+            [
+                ("LINEBEFORE", (0, 0), (0, 0), 1.5, self.colors["accent"]),
+                ("LEFTPADDING", (0, 0), (-1, -1), 3),
+                ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+                ("TOPPADDING", (0, 0), (-1, -1), 2),
+                ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
+                ("BACKGROUND", (0, 0), (-1, -1), colors.HexColor("#F9FAFB")),
+            ]
+        )
 
     def _rule(self, thickness=0.6, space_before=2, space_after=6):
         return HRFlowable(
@@ -90,40 +105,21 @@ class SimpleTemplate:
         )
 
     def _section_title(self, text: str) -> list:
-        from reportlab.platypus import Table, TableStyle
-
-        cell = Paragraph(text.upper(), self.h_sec)
+        cell = CachedParagraph(text.upper(), self.h_sec)
         table = Table([[cell]], colWidths=[None])
-        table.setStyle(
-            TableStyle(
-                [
-                    (
-                        "LINEBEFORE",
-                        (0, 0),
-                        (0, 0),
-                        1.5,
-                        self.colors["accent"],
-                    ),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 3),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-                    ("TOPPADDING", (0, 0), (-1, -1), 2),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
-                    ("BACKGROUND", (0, 0), (-1, -1), colors.HexColor("#F9FAFB")),
-                ]
-            )
-        )
-        return [table]
+        table.setStyle(self.section_table_style)
+        return [mark_section(table, text.lower())]
 
     def _header(self, data) -> list:
         s: list = []
         fullname = getattr(data, "fullname", None)
-        s.append(Paragraph(fullname or "RESUME", self.h_name))
+        s.append(CachedParagraph(fullname or "RESUME", self.h_name))
         if getattr(data, "professional_title", None):
-            s.append(Paragraph(data.professional_title, self.h_title))
+            s.append(CachedParagraph(data.professional_title, self.h_title))
         meta_bits = [getattr(data, "location", None), getattr(data, "phone", None)]
         meta_line = " · ".join([b for b in meta_bits if b])
         if meta_line:
-            s.append(Paragraph(meta_line, self.h_meta))
+            s.append(CachedParagraph(meta_line, self.h_meta))
         s.append(
             HRFlowable(
                 width="100%",
@@ -138,7 +134,7 @@ class SimpleTemplate:
     def _profile(self, data) -> list:
         s: list = []
         s += self._section_title("Profile")
-        s.append(Paragraph(getattr(data, "summary", ""), self.body))
+        s.append(CachedParagraph(getattr(data, "summary", ""), self.body))
         s.append(Spacer(1, self.GAP_Y))
         return s
 
@@ -147,14 +143,16 @@ class SimpleTemplate:
         s += self._section_title("Experience")
         for exp in getattr(data, "experience", []):
             left = f"{exp.company}" + (f", {exp.location}" if exp.location else "")
-            s.append(Paragraph(f"{left} — <b>{exp.job_title}</b>", self.body))
+            s.append(CachedParagraph(f"{left} — <b>{exp.job_title}</b>", self.body))
             rng = fmt_range(exp.start_date, exp.end_date)
             if rng:
-                s.append(Paragraph(rng.upper(), self.meta))
+                s.append(CachedParagraph(rng.upper(), self.meta))
             if exp.description:
-                s.append(Paragraph(exp.description, self.body))
+                s.append(CachedParagraph(exp.description, self.body))
             if exp.challenge:
-                s.append(Paragraph(f"<i>Challenge:</i> {exp.challenge}", self.meta))
+                s.append(
+                    CachedParagraph(f"<i>Challenge:</i> {exp.challenge}", self.meta)
+                )
             s.append(Spacer(1, self.GAP_Y))
         return s
 
@@ -164,14 +162,14 @@ class SimpleTemplate:
         for ed in getattr(data, "education", []):
             left = f"{ed.school}" + (f", {ed.location}" if ed.location else "")
             title = f"{left} — <b>{ed.degree}</b>" if ed.degree else left
-            s.append(Paragraph(title, self.body))
+            s.append(CachedParagraph(title, self.body))
             rng = fmt_range(ed.start_date, ed.end_date)
             if rng:
-                s.append(Paragraph(rng.upper(), self.meta))
+                s.append(CachedParagraph(rng.upper(), self.meta))
             if ed.field_of_study:
-                s.append(Paragraph(ed.field_of_study, self.meta))
+                s.append(CachedParagraph(ed.field_of_study, self.meta))
             if ed.description:
-                s.append(Paragraph(ed.description, self.body))
+                s.append(CachedParagraph(ed.description, self.body))
             s.append(Spacer(1, self.GAP_Y))
         return s
 
@@ -184,11 +182,11 @@ class SimpleTemplate:
                 title = (
                     f"<link href='{p.link}'><font color='#6B7280'>{title}</font></link>"
                 )
-            s.append(Paragraph(title, self.body))
+            s.append(CachedParagraph(title, self.body))
             if getattr(p, "tech_stack", None):
-                s.append(Paragraph(", ".join(p.tech_stack), self.meta))
+                s.append(CachedParagraph(", ".join(p.tech_stack), self.meta))
             if getattr(p, "description", None):
-                s.append(Paragraph(p.description, self.body))
+                s.append(CachedParagraph(p.description, self.body))
             s.append(Spacer(1, self.GAP_Y))
         return s
 
@@ -201,7 +199,7 @@ class SimpleTemplate:
                 for x in getattr(data, "skills", [])
             ]
         )
-        s.append(Paragraph(skills, self.body))
+        s.append(CachedParagraph(skills, self.body))
         s.append(Spacer(1, self.GAP_Y))
         return s
 
@@ -220,7 +218,7 @@ class SimpleTemplate:
             else:
                 issuer_html = issuer
             bits = [x for x in [name, issuer_html, date_txt] if x]
-            s.append(Paragraph(" — ".join(bits), self.body))
+            s.append(CachedParagraph(" — ".join(bits), self.body))
             s.append(Spacer(1, self.GAP_Y - 2))
         return s
 
@@ -233,7 +231,7 @@ class SimpleTemplate:
                 for l in getattr(data, "languages", [])
             ]
         )
-        s.append(Paragraph(langs, self.body))
+        s.append(CachedParagraph(langs, self.body))
         s.append(Spacer(1, self.GAP_Y))
         return s
 
@@ -249,7 +247,7 @@ class SimpleTemplate:
             text = label
             if getattr(sl, "description", None):
                 text += f" — {sl.description}"
-            s.append(Paragraph(text, self.body))
+            s.append(CachedParagraph(text, self.body))
         s.append(Spacer(1, self.GAP_Y))
         return s
 
@@ -276,13 +274,17 @@ class SimpleTemplate:
 
         return story
 
-    def get_page_templates(self):
-        full = Frame(
+    @cache
+    def page_specs(self, pagesize=A4) -> tuple[PageSpec, ...]:
+        page_w, page_h = pagesize
+        full = FrameSpec(
+            "full",
             self.ML,
             self.MB,
-            self.PAGE_W - self.ML - self.MR,
-            self.PAGE_H - self.MT - self.MB,
-            id="full",
-            showBoundary=0,
+            page_w - self.ML - self.MR,
+            page_h - self.MT - self.MB,
         )
-        return [PageTemplate(id="Simple", frames=[full])]
+        return (PageSpec("Simple", (full,)),)
+
+    def get_page_templates(self, pagesize=A4):
+        return [spec.build() for spec in self.page_specs(tuple(pagesize))]
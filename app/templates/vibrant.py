@@ -1,9 +1,9 @@
+from functools import cache
+from typing import Literal
+
 from reportlab.platypus import (
-    Paragraph,
     Spacer,
     HRFlowable,
-    Frame,
-    PageTemplate,
     NextPageTemplate,
     Table,
     TableStyle,
@@ -14,6 +14,9 @@ from reportlab.lib.units import mm
 from reportlab.lib import colors
 
 from app.templates.helpers.date_helpers import fmt_range, fmt_mmyyyy
+from app.templates.helpers.flowables import LeaveFrame, TwoColumnRow, mark_section
+from app.templates.helpers.page_specs import FrameSpec, PageSpec
+from app.templates.helpers.paragraphs import CachedParagraph
 
 
 class VibrantTemplate:
@@ -27,7 +30,8 @@ class VibrantTemplate:
 
     LEFT_W = 58 * mm
 
-    def __init__(self):
+    def __init__(self, layout: Literal["rows", "table"] = "rows"):
+        self.layout = layout
         base = getSampleStyleSheet()
         self.colors = {
             "ink": colors.HexColor("#111827"),
@@ -82,28 +86,37 @@ class VibrantTemplate:
             spaceBefore=0,
             spaceAfter=0,
         )
+        self.table_style = TableStyle(
+            [
+                ("LEFTPADDING", (0, 0), (-1, -1), 0),
+                ("RIGHTPADDING", (0, 0), (-1, -1), 6),
+                ("TOPPADDING", (0, 0), (-1, -1), 0),
+                ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+                ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ]
+        )
 
         self.SECTION_ORDER = [
-            ("Profile", self._profile, "summary"),
-            ("Experience", self._experience, "experience"),
-            ("Education", self._education, "education"),
-            ("Projects", self._projects, "projects"),
-            ("Skills", self._skills, "skills"),
-            ("Certificates", self._certificates, "certificates"),
-            ("Languages", self._languages, "languages"),
-            ("Social", self._social, "social_links"),
+            ("Profile", "_profile", "summary"),
+            ("Experience", "_experience", "experience"),
+            ("Education", "_education", "education"),
+            ("Projects", "_projects", "projects"),
+            ("Skills", "_skills", "skills"),
+            ("Certificates", "_certificates", "certificates"),
+            ("Languages", "_languages", "languages"),
+            ("Social", "_social", "social_links"),
         ]
 
     def _header_story(self, data) -> list:
         s: list = []
         fullname = getattr(data, "fullname", None)
-        s.append(Paragraph(fullname or "RESUME", self.h_name))
+        s.append(CachedParagraph(fullname or "RESUME", self.h_name))
         if getattr(data, "professional_title", None):
-            s.append(Paragraph(data.professional_title, self.h_title))
+            s.append(CachedParagraph(data.professional_title, self.h_title))
         meta_bits = [getattr(data, "location", None), getattr(data, "phone", None)]
         meta_line = " · ".join([b for b in meta_bits if b])
         if meta_line:
-            s.append(Paragraph(meta_line, self.meta))
+            s.append(CachedParagraph(meta_line, self.meta))
         s.append(
             HRFlowable(
                 width="100%",
@@ -127,20 +140,22 @@ class VibrantTemplate:
         return out
 
     def _profile(self, data):
-        return [Paragraph(data.summary, self.body)]
+        return [CachedParagraph(data.summary, self.body)]
 
     def _experience(self, data):
         rows = []
         for exp in getattr(data, "experience", []):
             left = f"{exp.company}" + (f", {exp.location}" if exp.location else "")
-            rows.append(Paragraph(f"{left} — <b>{exp.job_title}</b>", self.body))
+            rows.append(CachedParagraph(f"{left} — <b>{exp.job_title}</b>", self.body))
             rng = fmt_range(exp.start_date, exp.end_date)
             if rng:
-                rows.append(Paragraph(rng.upper(), self.meta))
+                rows.append(CachedParagraph(rng.upper(), self.meta))
             if exp.description:
-                rows.append(Paragraph(exp.description, self.body))
+                rows.append(CachedParagraph(exp.description, self.body))
             if exp.challenge:
-                rows.append(Paragraph(f"<i>Challenge:</i> {exp.challenge}", self.meta))
+                rows.append(
+                    CachedParagraph(f"<i>Challenge:</i> {exp.challenge}", self.meta)
+                )
         return self._clean_items(rows)
 
     def _education(self, data):
@@ -148,14 +163,14 @@ class VibrantTemplate:
         for ed in getattr(data, "education", []):
             left = f"{ed.school}" + (f", {ed.location}" if ed.location else "")
             title = f"{left} — <b>{ed.degree}</b>" if ed.degree else left
-            rows.append(Paragraph(title, self.body))
+            rows.append(CachedParagraph(title, self.body))
             rng = fmt_range(ed.start_date, ed.end_date)
             if rng:
-                rows.append(Paragraph(rng.upper(), self.meta))
+                rows.append(CachedParagraph(rng.upper(), self.meta))
             if ed.field_of_study:
-                rows.append(Paragraph(ed.field_of_study, self.meta))
+                rows.append(CachedParagraph(ed.field_of_study, self.meta))
             if ed.description:
-                rows.append(Paragraph(ed.description, self.body))
+                rows.append(CachedParagraph(ed.description, self.body))
         return self._clean_items(rows)
 
     def _projects(self, data):
@@ -168,16 +183,16 @@ class VibrantTemplate:
                 )
             else:
                 name_html = name
-            rows.append(Paragraph(name_html, self.body))
+            rows.append(CachedParagraph(name_html, self.body))
             if getattr(p, "tech_stack", None):
-                rows.append(Paragraph(", ".join(p.tech_stack), self.meta))
+                rows.append(CachedParagraph(", ".join(p.tech_stack), self.meta))
             if getattr(p, "description", None):
-                rows.append(Paragraph(p.description, self.body))
+                rows.append(CachedParagraph(p.description, self.body))
         return self._clean_items(rows)
 
     def _skills(self, data):
         return [
-            Paragraph(
+            CachedParagraph(
                 ", ".join(
                     [
                         f"{x.name}{f' ({x.level})' if getattr(x, 'level', None) else ''}"
@@ -202,12 +217,12 @@ class VibrantTemplate:
             else:
                 issuer_html = issuer
             bits = [x for x in [name, issuer_html, date_txt] if x]
-            rows.append(Paragraph(" — ".join(bits), self.body))
+            rows.append(CachedParagraph(" — ".join(bits), self.body))
         return self._clean_items(rows)
 
     def _languages(self, data):
         return [
-            Paragraph(
+            CachedParagraph(
                 ", ".join(
                     [
                         f"{l.name}{f' ({l.level})' if getattr(l, 'level', None) else ''}"
@@ -230,7 +245,7 @@ class VibrantTemplate:
                 txt = label
             if getattr(sl, "description", None):
                 txt += f" — {sl.description}"
-            rows.append(Paragraph(txt, self.body))
+            rows.append(CachedParagraph(txt, self.body))
         return self._clean_items(rows)
 
     def _rows(self, data):
@@ -239,7 +254,10 @@ class VibrantTemplate:
         def add_sec(label: str, right_items: list):
             if not right_items:
                 return
-            rows.append([Paragraph(label.upper(), self.h_left), right_items[0]])
+            title = mark_section(
+                CachedParagraph(label.upper(), self.h_left), label.lower()
+            )
+            rows.append([title, right_items[0]])
 
             for item in right_items[1:]:
                 rows.append(["", item])
@@ -255,64 +273,71 @@ class VibrantTemplate:
 
         for label, builder, attr in self.SECTION_ORDER:
             if getattr(data, attr, None):
-                add_sec(label, builder(data))
+                add_sec(label, getattr(self, builder)(data))
 
         return rows
 
     def build_story(self, data) -> list:
         story: list = []
+        # The header frame is closed explicitly; otherwise the first section
+        # only leaves it by not fitting, which reads as an overflow. A header
+        # taller than HEADER_H has already left it, so nothing is skipped.
         story += self._header_story(data)
+        story.append(LeaveFrame("header"))
         story.append(NextPageTemplate("Next"))
 
-        table = Table(
-            self._rows(data),
-            colWidths=[self.LEFT_W, (self.PAGE_W - self.ML - self.MR) - self.LEFT_W],
-            hAlign="LEFT",
-            splitByRow=1,
-            spaceBefore=0,
-            spaceAfter=0,
-        )
-        table.setStyle(
-            TableStyle(
-                [
-                    ("LEFTPADDING", (0, 0), (-1, -1), 0),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 6),
-                    ("TOPPADDING", (0, 0), (-1, -1), 0),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ]
+        rows = self._rows(data)
+        col_widths = [self.LEFT_W, (self.PAGE_W - self.ML - self.MR) - self.LEFT_W]
+
+        if self.layout == "table":
+            table = Table(
+                rows,
+                colWidths=col_widths,
+                hAlign="LEFT",
+                splitByRow=1,
+                spaceBefore=0,
+                spaceAfter=0,
             )
-        )
+            table.setStyle(self.table_style)
+            story.append(table)
+            return story
 
-        story.append(table)
+        # Same geometry and between-row page breaks as the single table split
+        # by row, but rows are laid out independently: splitting a long table
+        # re-measures the remainder on every page and re-wraps every cell when
+        # it is drawn.
+        story += [TwoColumnRow(row, col_widths) for row in rows]
         return story
 
-    def get_page_templates(self):
-        header_frame = Frame(
+    @cache
+    def page_specs(self, pagesize=A4) -> tuple[PageSpec, ...]:
+        page_w, page_h = pagesize
+        content_w = page_w - self.ML - self.MR
+        header_frame = FrameSpec(
+            "header",
             self.ML,
-            self.PAGE_H - self.MT - self.HEADER_H,
-            self.PAGE_W - self.ML - self.MR,
+            page_h - self.MT - self.HEADER_H,
+            content_w,
             self.HEADER_H,
-            id="header",
-            showBoundary=0,
         )
-        content_frame = Frame(
+        content_frame = FrameSpec(
+            "content",
             self.ML,
             self.MB,
-            self.PAGE_W - self.ML - self.MR,
-            self.PAGE_H - self.MT - self.MB - self.HEADER_H,
-            id="content",
-            showBoundary=0,
+            content_w,
+            page_h - self.MT - self.MB - self.HEADER_H,
         )
-        full_content_frame = Frame(
+        full_content_frame = FrameSpec(
+            "full_content",
             self.ML,
             self.MB,
-            self.PAGE_W - self.ML - self.MR,
-            self.PAGE_H - self.MT - self.MB,
-            id="full_content",
-            showBoundary=0,
+            content_w,
+            page_h - self.MT - self.MB,
         )
 
-        first = PageTemplate(id="First", frames=[header_frame, content_frame])
-        next_ = PageTemplate(id="Next", frames=[full_content_frame])
-        return [first, next_]
+        first = PageSpec("First", (header_frame, content_frame))
+        next_ = PageSpec("Next", (full_content_frame,))
+        return (first, next_)
+
+    def get_page_templates(self, pagesize=A4):
+        return [spec.build() for spec in self.page_specs(tuple(pagesize))]
@@ -0,0 +1,69 @@
+import json
+import re
+from pathlib import Path
+
+from app.models import ResumePayload
+from app.models.job_posting import JobPosting
+from app.models.tailored_profile import TailoredProfile
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "app" / "fixtures"
+
+_PAGE_RE = re.compile(rb"/Type\s*/Page(?![a-zA-Z])")
+
+
+def load_resume(level: str) -> ResumePayload:
+    raw = json.loads((FIXTURES_DIR / f"resume_{level}.json").read_text("utf-8"))
+    return ResumePayload(**raw)
+
+
+def load_job(name: str) -> JobPosting:
+    raw = json.loads((FIXTURES_DIR / f"job_posting_{name}.json").read_text("utf-8"))
+    return JobPosting(**raw)
+
+
+def as_profile(resume: ResumePayload) -> TailoredProfile:
+    # Templates read the tailored field names, so fixtures are passed through
+    # the same shape build_profile produces, minus the LLM.
+    return TailoredProfile(
+        fullname=resume.fullname,
+        professional_title=resume.professional_title,
+        location=resume.location,
+        phone=resume.phone,
+        summary=resume.summary or "",
+        experience=resume.experiences,
+        education=resume.education,
+        skills=resume.skills,
+        projects=resume.projects,
+        certificates=resume.certificates,
+        social_links=resume.social_links,
+        languages=resume.languages,
+    )
+
+
+def scaled_profile(
+    base: TailoredProfile, experiences: int, description_repeat: int = 1
+) -> TailoredProfile:
+    source = base.experience
+    experience = []
+    for i in range(experiences):
+        exp = source[i % len(source)]
+        description = " ".join([exp.description] * description_repeat)
+        experience.append(exp.model_copy(update={"description": description}))
+    return base.model_copy(update={"experience": experience})
+
+
+def payloads() -> dict[str, TailoredProfile]:
+    senior = as_profile(load_resume("senior"))
+    return {
+        "junior": as_profile(load_resume("junior")),
+        "mid": as_profile(load_resume("mid")),
+        "senior": senior,
+        "exp10": scaled_profile(senior, 10),
+        "exp50": scaled_profile(senior, 50),
+        "exp200": scaled_profile(senior, 200),
+        "long_descriptions": scaled_profile(senior, 10, description_repeat=8),
+    }
+
+
+def page_count(pdf_bytes: bytes) -> int:
+    return len(_PAGE_RE.findall(pdf_bytes))
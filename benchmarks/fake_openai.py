@@ -0,0 +1,149 @@
+"""Local stand-in for the OpenAI Responses API used by the tailoring path.
+
+    python -m benchmarks.fake_openai --port 9000 --latency-median 1.5 --error-rate 0.02
+    OPENAI_API_KEY=fake OPENAI_BASE_URL=http://127.0.0.1:9000/v1 uvicorn app.main:app
+
+Structured-output calls are answered by echoing the relevant sections of
+USER_PROFILE back in the requested schema, so responses validate against the
+app's models without spending tokens.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+def _profile_from_input(messages) -> dict:
+    if isinstance(messages, str):
+        messages = [{"content": messages}]
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, list):
+            content = "".join(part.get("text", "") for part in content)
+        if isinstance(content, str) and "USER_PROFILE:" in content:
+            body = content.split("USER_PROFILE:", 1)[1]
+            return json.loads(body)
+    return {}
+
+
+def _answer(format_name: str, profile: dict) -> dict | None:
+    if format_name == "TailoredExperienceEducation":
+        return {
+            "experience": profile.get("experiences", []),
+            "education": profile.get("education", []),
+        }
+    if format_name == "TailoredSkillProjectCertificate":
+        return {
+            "skills": profile.get("skills", []),
+            "projects": profile.get("projects", []),
+            "certificates": profile.get("certificates", []),
+        }
+    if format_name == "TailoredSummary":
+        return {"summary": profile.get("summary") or "Experienced engineer."}
+    return None
+
+
+def _error(status_code: int, kind: str, message: str, **headers) -> JSONResponse:
+    return JSONResponse(
+        status_code=status_code,
+        headers=headers,
+        content={"error": {"type": kind, "message": message}},
+    )
+
+
+def _response(model: str, text: str, input_chars: int) -> dict:
+    input_tokens = input_chars // 4
+    output_tokens = len(text) // 4
+    return {
+        "id": f"resp_{uuid.uuid4().hex}",
+        "object": "response",
+        "created_at": int(time.time()),
+        "status": "completed",
+        "model": model,
+        "output": [
+            {
+                "type": "message",
+                "id": f"msg_{uuid.uuid4().hex}",
+                "status": "completed",
+                "role": "assistant",
+                "content": [{"type": "output_text", "text": text, "annotations": []}],
+            }
+        ],
+        "parallel_tool_calls": True,
+        "tool_choice": "auto",
+        "tools": [],
+        "usage": {
+            "input_tokens": input_tokens,
+            "input_tokens_details": {"cached_tokens": 0},
+            "output_tokens": output_tokens,
+            "output_tokens_details": {"reasoning_tokens": 0},
+            "total_tokens": input_tokens + output_tokens,
+        },
+    }
+
+
+def create_app(
+    latency_median: float,
+    latency_sigma: float,
+    error_rate: float,
+    rate_limit_rate: float,
+    seed: int | None = None,
+) -> FastAPI:
+    app = FastAPI(title="Fake OpenAI")
+    rng = random.Random(seed)
+
+    @app.post("/v1/responses")
+    async def responses(request: Request):
+        raw = await request.body()
+        body = json.loads(raw)
+
+        if latency_median > 0:
+            await asyncio.sleep(rng.lognormvariate(0, latency_sigma) * latency_median)
+
+        roll = rng.random()
+        if roll < rate_limit_rate:
+            headers = {"retry-after-ms": "200"}
+            return _error(429, "rate_limit_exceeded", "Slow down", **headers)
+        if roll < rate_limit_rate + error_rate:
+            return _error(500, "server_error", "Injected failure")
+
+        fmt = (body.get("text") or {}).get("format") or {}
+        answer = _answer(fmt.get("name", ""), _profile_from_input(body.get("input")))
+        if answer is None:
+            return _error(400, "invalid_request_error", "Unknown response format")
+        text = json.dumps(answer)
+        return _response(body.get("model", "fake"), text, len(raw))
+
+    return app
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency-median", type=float, default=1.0, help="seconds")
+    parser.add_argument("--latency-sigma", type=float, default=0.4)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 500s")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="share of 429s")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    app = create_app(
+        latency_median=args.latency_median,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        seed=args.seed,
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
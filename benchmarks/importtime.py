@@ -0,0 +1,84 @@
+"""Import-time profile for the API process.
+
+    python -m benchmarks.importtime
+    python -m benchmarks.importtime --module app.main --top 30 --output imports.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Imported lazily by design; seeing them here means something regressed.
+LAZY_MODULES = ("openai", "httpx")
+
+
+def profile(module: str) -> list[dict]:
+    env = {**os.environ, "PYTHONPATH": str(ROOT), "OPENAI_API_KEY": "importtime"}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        rows.append(
+            {
+                "module": name.strip(),
+                "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+            }
+        )
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--output", type=Path, help="write the JSON report here")
+    args = parser.parse_args(argv)
+
+    rows = profile(args.module)
+    total_ms = sum(row["self_ms"] for row in rows)
+    top_level = {}
+    for row in rows:
+        package = row["module"].split(".")[0]
+        top_level[package] = top_level.get(package, 0.0) + row["self_ms"]
+    lazy_loaded = [name for name in LAZY_MODULES if name in top_level]
+
+    print(f"import {args.module}: {total_ms:.1f}ms across {len(rows)} modules")
+    print(f"\n{'package':<32}{'self_ms':>10}")
+    for package, ms in sorted(top_level.items(), key=lambda kv: -kv[1])[: args.top]:
+        print(f"{package:<32}{ms:>10.1f}")
+    print(f"\n{'module':<48}{'cumulative_ms':>14}")
+    for row in sorted(rows, key=lambda r: -r["cumulative_ms"])[: args.top]:
+        print(f"{row['module']:<48}{row['cumulative_ms']:>14.1f}")
+    if lazy_loaded:
+        print(f"\nWARNING eagerly imported: {', '.join(lazy_loaded)}", file=sys.stderr)
+
+    if args.output:
+        report = {
+            "module": args.module,
+            "total_ms": total_ms,
+            "packages": top_level,
+            "modules": rows,
+            "eager_lazy_modules": lazy_loaded,
+        }
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return 1 if lazy_loaded else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
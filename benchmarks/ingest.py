@@ -0,0 +1,135 @@
+"""Ingest benchmark for tailoring request bodies and profile assembly.
+
+    python -m benchmarks.ingest
+    python -m benchmarks.ingest --entries 100 --entries 500 --output ingest.json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from app.core.profile_builder import assemble_profile
+from app.models.tailored_profile import (
+    TailoredExperienceEducation,
+    TailoredProfile,
+    TailoredSkillProjectCertificate,
+    TailoredSummary,
+)
+from app.models.tailoring_request import TailoringRequest
+from benchmarks.common import load_job, load_resume
+
+
+def request_body(entries: int) -> bytes:
+    resume = load_resume("senior")
+    scaled = {
+        field: [items[i % len(items)] for i in range(entries)]
+        for field in ("experiences", "education", "skills", "projects", "certificates")
+        if (items := getattr(resume, field))
+    }
+    request = TailoringRequest(
+        job=load_job("devops"), resume=resume.model_copy(update=scaled)
+    )
+    return request.model_dump_json().encode()
+
+
+def _timed(fn, iterations: int) -> float:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def run_case(entries: int, iterations: int) -> dict:
+    body = request_body(entries)
+    request = TailoringRequest.model_validate_json(body)
+    resume = request.resume
+    parts = (
+        TailoredExperienceEducation(
+            experience=resume.experiences, education=resume.education
+        ),
+        TailoredSkillProjectCertificate(
+            skills=resume.skills,
+            projects=resume.projects,
+            certificates=resume.certificates,
+        ),
+        TailoredSummary(summary=resume.summary or ""),
+    )
+    exp_edu, skill_proj_cert, summary = parts
+
+    def validated_profile():
+        # What assemble_profile did before: a full re-validation.
+        return TailoredProfile(
+            **exp_edu.__dict__,
+            **skill_proj_cert.__dict__,
+            summary=summary.summary,
+            fullname=resume.fullname,
+            professional_title=resume.professional_title,
+            location=resume.location,
+            phone=resume.phone,
+            social_links=resume.social_links,
+            languages=resume.languages,
+        )
+
+    return {
+        "entries": entries,
+        "body_bytes": len(body),
+        # FastAPI's Body() path: json.loads, then validate the Python objects.
+        "loads_validate_p50_ms": _timed(
+            lambda: TailoringRequest.model_validate(json.loads(body)), iterations
+        ),
+        "validate_json_p50_ms": _timed(
+            lambda: TailoringRequest.model_validate_json(body), iterations
+        ),
+        "assemble_validated_p50_ms": _timed(validated_profile, iterations),
+        "assemble_construct_p50_ms": _timed(
+            lambda: assemble_profile(resume, *parts), iterations
+        ),
+    }
+
+
+def print_table(report: dict) -> None:
+    columns = [
+        "entries",
+        "body_bytes",
+        "loads_validate_p50_ms",
+        "validate_json_p50_ms",
+        "assemble_validated_p50_ms",
+        "assemble_construct_p50_ms",
+    ]
+    print("  ".join(f"{c:>26}" for c in columns))
+    for case in report["cases"]:
+        print(
+            "  ".join(
+                f"{case[c]:>26.3f}" if isinstance(case[c], float) else f"{case[c]:>26}"
+                for c in columns
+            )
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, action="append")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--output", type=Path, help="write the JSON report here")
+    args = parser.parse_args(argv)
+
+    report = {
+        "cases": [
+            run_case(entries, args.iterations)
+            for entries in args.entries or [10, 100, 500, 1000]
+        ]
+    }
+    print_table(report)
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+"""Render benchmark for generate_pdf_bytes.
+
+    python -m benchmarks.render --output bench.json
+    python -m benchmarks.render --baseline bench.json --threshold 0.15
+
+p50/p95 and the story/build split are cold: the paragraph cache is cleared
+before each timed render. warm_p50/warm_p95 repeat the same render right
+after, with every paragraph already parsed and wrapped.
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import reportlab
+
+from app.core.pdf_generator import generate_pdf, generate_pdf_bytes
+from app.templates import TEMPLATES
+from app.templates.helpers.paragraphs import get_paragraph_cache
+from benchmarks.common import page_count, payloads
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def run_case(template_key: str, payload_name: str, iterations: int) -> dict:
+    data = payloads()[payload_name]
+    pdf_bytes = generate_pdf_bytes(data, template_key)
+
+    # Cold renders start from an empty paragraph cache, as a new resume does;
+    # warm renders repeat the same one right after, as a re-download does.
+    samples, story, build, warm = [], [], [], []
+    for _ in range(iterations):
+        get_paragraph_cache().clear()
+        started = time.perf_counter()
+        _, stats = generate_pdf(data, template_key)
+        samples.append((time.perf_counter() - started) * 1000)
+        story.append(stats.story_seconds * 1000)
+        build.append(stats.build_seconds * 1000)
+
+        started = time.perf_counter()
+        generate_pdf(data, template_key)
+        warm.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    generate_pdf_bytes(data, template_key)
+    snapshot = tracemalloc.take_snapshot()
+    _, alloc_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    alloc_blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+
+    return {
+        "template": template_key,
+        "payload": payload_name,
+        "iterations": iterations,
+        "p50_ms": round(_percentile(samples, 0.5), 3),
+        "p95_ms": round(_percentile(samples, 0.95), 3),
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "warm_p50_ms": round(_percentile(warm, 0.5), 3),
+        "warm_p95_ms": round(_percentile(warm, 0.95), 3),
+        "story_p50_ms": round(_percentile(story, 0.5), 3),
+        "build_p50_ms": round(_percentile(build, 0.5), 3),
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "alloc_peak_kb": round(alloc_peak / 1024, 1),
+        "alloc_live_blocks": alloc_blocks,
+        "size_bytes": len(pdf_bytes),
+        "pages": page_count(pdf_bytes),
+    }
+
+
+def _run_isolated(args: tuple[str, str, int]) -> dict:
+    return run_case(*args)
+
+
+def run(
+    templates: list[str], payload_names: list[str], iterations: int, isolate: bool
+) -> dict:
+    cases = [(t, p, iterations) for t in templates for p in payload_names]
+    if isolate:
+        # One fresh process per case keeps peak RSS attributable to that case.
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(processes=1, maxtasksperchild=1) as pool:
+            results = pool.map(_run_isolated, cases, chunksize=1)
+    else:
+        results = [run_case(*case) for case in cases]
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "reportlab": reportlab.Version,
+            "platform": platform.platform(),
+            "isolated": isolate,
+        },
+        "cases": results,
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float) -> list[str]:
+    previous = {(c["template"], c["payload"]): c for c in baseline["cases"]}
+    regressions = []
+    for case in report["cases"]:
+        old = previous.get((case["template"], case["payload"]))
+        if old is None:
+            continue
+        for metric in (
+            "p50_ms",
+            "p95_ms",
+            "warm_p50_ms",
+            "story_p50_ms",
+            "size_bytes",
+        ):
+            if old.get(metric) and case[metric] > old[metric] * (1 + threshold):
+                regressions.append(
+                    f"{case['template']}/{case['payload']}: {metric} "
+                    f"{old[metric]} -> {case[metric]} "
+                    f"(+{(case[metric] / old[metric] - 1) * 100:.1f}%)"
+                )
+    return regressions
+
+
+def print_table(report: dict) -> None:
+    header = (
+        f"{'template':<10}{'payload':<20}{'p50 ms':>10}{'p95 ms':>10}"
+        f"{'warm ms':>10}{'story ms':>10}{'build ms':>10}"
+        f"{'rss kb':>10}{'alloc kb':>10}{'bytes':>10}{'pages':>7}"
+    )
+    print(header)
+    print("-" * len(header))
+    for c in report["cases"]:
+        print(
+            f"{c['template']:<10}{c['payload']:<20}"
+            f"{c['p50_ms']:>10.1f}{c['p95_ms']:>10.1f}{c['warm_p50_ms']:>10.1f}"
+            f"{c['story_p50_ms']:>10.2f}{c['build_p50_ms']:>10.1f}{c['peak_rss_kb']:>10}"
+            f"{c['alloc_peak_kb']:>10.0f}{c['size_bytes']:>10}{c['pages']:>7}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    available = list(payloads())
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--template", action="append", choices=list(TEMPLATES))
+    parser.add_argument("--payload", action="append", choices=available)
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--no-isolate", dest="isolate", action="store_false")
+    parser.add_argument("--output", type=Path, help="write the JSON report here")
+    parser.add_argument("--baseline", type=Path, help="compare against this report")
+    parser.add_argument("--threshold", type=float, default=0.15)
+    args = parser.parse_args(argv)
+
+    report = run(
+        templates=args.template or list(TEMPLATES),
+        payload_names=args.payload or available,
+        iterations=args.iterations,
+        isolate=args.isolate,
+    )
+    print_table(report)
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if args.baseline:
+        regressions = compare(
+            report, json.loads(args.baseline.read_text("utf-8")), args.threshold
+        )
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
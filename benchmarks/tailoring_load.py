@@ -0,0 +1,143 @@
+"""Open-loop load test for POST /tailored_profile.
+
+    python -m benchmarks.tailoring_load --url http://127.0.0.1:8000 --rps 5 --duration 30
+
+Requests are fired on a fixed schedule regardless of how fast earlier ones
+finish. End-to-end latency is split using the Server-Timing header the app
+sets (ingest, llm, assemble, render).
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+import httpx
+
+from benchmarks.common import load_job, load_resume
+
+LEVELS = ("junior", "mid", "senior")
+JOBS = ("data_engineer", "devops", "frontend")
+STYLES = ("simple", "vibrant", "elegant")
+
+
+def _parse_server_timing(header: str | None) -> dict[str, float]:
+    out = {}
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "dur" and name:
+                out[name] = float(value)
+    return out
+
+
+def _summary(samples: list[float]) -> dict[str, float]:
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+
+    def pct(q: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 1)
+
+    return {
+        "p50": pct(0.5),
+        "p95": pct(0.95),
+        "p99": pct(0.99),
+        "max": round(ordered[-1], 1),
+    }
+
+
+def _bodies(unique: bool):
+    for n, (level, job, style) in enumerate(
+        itertools.cycle(itertools.product(LEVELS, JOBS, STYLES))
+    ):
+        resume = json.loads(load_resume(level).model_dump_json())
+        if unique:
+            resume["summary"] = f"{resume.get('summary') or ''} #{n}"
+        yield style, {"job": json.loads(load_job(job).model_dump_json()), "resume": resume}
+
+
+async def run(
+    url: str, rps: float, duration: float, timeout: float, unique: bool
+) -> dict:
+    results: list[dict] = []
+    bodies = _bodies(unique)
+
+    async def fire(client: httpx.AsyncClient, style: str, body: dict) -> None:
+        started = time.perf_counter()
+        try:
+            resp = await client.post(
+                f"{url}/tailored_profile", params={"style": style}, json=body
+            )
+            status = resp.status_code
+            stages = _parse_server_timing(resp.headers.get("server-timing"))
+        except httpx.HTTPError as err:
+            status, stages = type(err).__name__, {}
+        results.append(
+            {
+                "status": status,
+                "e2e_ms": (time.perf_counter() - started) * 1000,
+                "stages": stages,
+            }
+        )
+
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=100)
+    async with httpx.AsyncClient(timeout=timeout, limits=limits) as client:
+        tasks = []
+        started = time.perf_counter()
+        total = int(rps * duration)
+        for i in range(total):
+            delay = started + i / rps - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            style, body = next(bodies)
+            tasks.append(asyncio.create_task(fire(client, style, body)))
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+
+    ok = [r for r in results if r["status"] == 200]
+    stage_names = sorted({name for r in ok for name in r["stages"]})
+    return {
+        "target_rps": rps,
+        "achieved_rps": round(len(results) / elapsed, 2),
+        "requests": len(results),
+        "status": dict(Counter(str(r["status"]) for r in results)),
+        "e2e_ms": _summary([r["e2e_ms"] for r in ok]),
+        "stages_ms": {
+            name: _summary([r["stages"][name] for r in ok if name in r["stages"]])
+            for name in stage_names
+        },
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--rps", type=float, default=2.0)
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument(
+        "--unique",
+        action="store_true",
+        help="make every payload distinct so the tailoring cache never hits",
+    )
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(
+        run(args.url.rstrip("/"), args.rps, args.duration, args.timeout, args.unique)
+    )
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text, encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.ai import dependencies as ai_dependencies
+from app.core import dependencies as core_dependencies
+from app.core.fixtures import load_fixtures
+from app.models.tailoring_request import TailoringRequest
+from benchmarks.fake_openai import create_app
+
+# Everything the app builds once per process; cleared around each test so
+# settings from the environment and state from other tests do not leak.
+CACHED_GETTERS = (
+    core_dependencies.get_render_settings,
+    core_dependencies.get_render_pool,
+    core_dependencies.get_pdf_cache,
+    core_dependencies.get_profile_store,
+    core_dependencies.get_batch_settings,
+    core_dependencies.get_job_queue,
+    ai_dependencies.get_openai_settings,
+    ai_dependencies.get_openai_caller,
+    ai_dependencies.get_tailoring_cache,
+)
+
+
+@pytest.fixture(scope="session")
+def fixtures():
+    return load_fixtures()
+
+
+@pytest.fixture
+def tailoring_request(fixtures) -> TailoringRequest:
+    return TailoringRequest(
+        job=fixtures.jobs["devops"], resume=fixtures.resumes["junior"]
+    )
+
+
+@pytest.fixture
+def make_openai_client():
+    from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+    def make(error_rate: float = 0.0) -> AsyncOpenAI:
+        fake = create_app(
+            latency_median=0,
+            latency_sigma=0,
+            error_rate=error_rate,
+            rate_limit_rate=0,
+            seed=0,
+        )
+        transport = httpx.ASGITransport(app=fake)
+        return AsyncOpenAI(
+            api_key="test",
+            base_url="http://fake-openai/v1",
+            max_retries=0,
+            http_client=DefaultAsyncHttpxClient(transport=transport),
+        )
+
+    return make
+
+
+@pytest.fixture
+def openai_client(make_openai_client):
+    return make_openai_client()
+
+
+@pytest.fixture
+def app_env(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setenv("RENDER_EXECUTOR", "thread")
+    monkeypatch.setenv("RENDER_WORKERS", "2")
+    monkeypatch.setenv("RENDER_WARMUP", "false")
+    monkeypatch.setenv("RENDER_WARM_EXAMPLES", "false")
+    monkeypatch.setenv("JOBS_BACKEND", "memory")
+    for name in (
+        "RENDER_CACHE_DIR",
+        "TAILORING_CACHE_DIR",
+        "PROFILE_STORE_DIR",
+        "APP_FONT_CACHE_DIR",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    for getter in CACHED_GETTERS:
+        getter.cache_clear()
+    yield
+    for getter in CACHED_GETTERS:
+        getter.cache_clear()
+
+
+@pytest.fixture
+def client(app_env, monkeypatch, openai_client):
+    from app import router
+    from app.main import app
+
+    # Routes get the client through the dependency, queued jobs directly.
+    app.dependency_overrides[ai_dependencies.get_openai_client] = lambda: openai_client
+    monkeypatch.setattr(router, "get_openai_client", lambda: openai_client)
+    try:
+        with TestClient(app) as test_client:
+            yield test_client
+    finally:
+        app.dependency_overrides.clear()
@@ -0,0 +1,72 @@
+import io
+import json
+import zipfile
+
+from app.router import BatchItem, BatchRequest
+
+
+def batch(fixtures, *items: tuple[str, str, str]) -> str:
+    return BatchRequest(
+        items=[
+            BatchItem(
+                job=fixtures.jobs[job], resume=fixtures.resumes[level], style=style
+            )
+            for job, level, style in items
+        ]
+    ).model_dump_json()
+
+
+def test_batch_streams_a_zip_with_a_manifest(client, fixtures):
+    response = client.post(
+        "/tailored_profile/batch",
+        content=batch(
+            fixtures, ("devops", "junior", "simple"), ("frontend", "mid", "vibrant")
+        ),
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        manifest = json.loads(archive.read("manifest.json"))["items"]
+        assert [item["status"] for item in manifest] == ["ok", "ok"]
+        assert [item["style"] for item in manifest] == ["simple", "vibrant"]
+        for item in manifest:
+            assert archive.read(item["file"]).startswith(b"%PDF-")
+        assert manifest[0]["file"].startswith("0000_")
+        assert manifest[1]["file"].startswith("0001_")
+
+
+def test_empty_batch_is_422(client):
+    response = client.post("/tailored_profile/batch", content=b'{"items": []}')
+    assert response.status_code == 422
+
+
+def test_oversized_batch_is_413(client, fixtures, monkeypatch):
+    monkeypatch.setenv("BATCH_MAX_ITEMS", "1")
+    response = client.post(
+        "/tailored_profile/batch",
+        content=batch(
+            fixtures, ("devops", "junior", "simple"), ("devops", "mid", "simple")
+        ),
+    )
+    assert response.status_code == 413
+
+
+def test_entry_names_are_a_single_safe_component(client, fixtures):
+    junior = fixtures.resumes["junior"]
+    items = [
+        BatchItem(job=fixtures.jobs["devops"], resume=junior, filename="../../etc/x"),
+        BatchItem(
+            job=fixtures.jobs["devops"],
+            resume=junior.model_copy(update={"fullname": "Ada / ../Lovelace"}),
+        ),
+    ]
+    response = client.post(
+        "/tailored_profile/batch",
+        content=BatchRequest(items=items).model_dump_json(),
+    )
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        names = archive.namelist()
+    assert "0000_etc_x_simple.pdf" in names
+    assert "0001_Ada_Lovelace_resume_simple.pdf" in names
+    assert all("/" not in name and ".." not in name for name in names)
@@ -0,0 +1,57 @@
+import re
+
+import pytest
+
+from app.core.fitting import _truncate, fit_to_pages, generate_fitted_pdf
+
+
+def page_count(pdf: bytes) -> int:
+    return len(re.findall(rb"/Type /Page\b(?!s)", pdf))
+
+
+def test_truncate_cuts_at_a_word_boundary():
+    assert _truncate(None, 10) is None
+    assert _truncate("short", 10) == "short"
+    assert _truncate("one two, three four", 12) == "one two…"
+
+
+def test_content_that_fits_is_left_alone(fixtures):
+    junior = fixtures.resumes["junior"]
+    fit = fit_to_pages(junior, "simple", max_pages=1)
+    assert (fit.scale, fit.pages, fit.passes) == (1.0, 1, 1)
+    assert fit.data is junior
+
+
+def test_smaller_type_is_tried_before_dropping_content(fixtures):
+    mid = fixtures.resumes["mid"]
+    fit = fit_to_pages(mid, "simple", max_pages=1)
+    assert fit.pages == 1
+    assert fit.scale < 1.0
+    assert fit.data is mid
+
+
+@pytest.mark.parametrize("template", ["simple", "vibrant", "elegant"])
+def test_senior_resume_fits_one_page(fixtures, template):
+    pdf, stats = generate_fitted_pdf(fixtures.resumes["senior"], template, 1)
+    assert stats.pages == page_count(pdf) == 1
+    assert stats.layout_passes > 1
+
+
+def test_unreachable_limit_returns_the_most_compact_candidate(fixtures):
+    senior = fixtures.resumes["senior"]
+    # The summary is never shortened, so no candidate fits one page.
+    senior = senior.model_copy(update={"summary": (senior.summary + " ") * 40})
+    fit = fit_to_pages(senior, "simple", max_pages=1)
+    assert fit.pages > 1
+    assert fit.data.projects == [] and fit.data.certificates == []
+
+
+def test_example_resume_max_pages(client):
+    full = client.get("/example-resume", params={"level": "senior"})
+    fitted = client.get("/example-resume", params={"level": "senior", "max_pages": 1})
+    assert fitted.status_code == 200
+    assert page_count(full.content) == 2
+    assert page_count(fitted.content) == 1
+    assert fitted.headers["etag"] != full.headers["etag"]
+
+    assert client.get("/example-resume", params={"max_pages": 0}).status_code == 422
@@ -0,0 +1,60 @@
+import os
+
+import pytest
+
+from app import fonts
+from app.core.config import private_dir
+
+
+@pytest.fixture
+def font_cache_env(monkeypatch):
+    fonts._font_cache_dir.cache_clear()
+    yield monkeypatch
+    fonts._font_cache_dir.cache_clear()
+
+
+def test_every_font_file_exists():
+    root = fonts._fonts_root()
+    for styles in fonts.FONTS.values():
+        for rel_path in styles.values():
+            assert os.path.isfile(os.path.join(root, rel_path)), rel_path
+
+
+def test_private_dir_is_created_owner_only(tmp_path):
+    path = private_dir(tmp_path / "a" / "b")
+    assert path.stat().st_mode & 0o777 == 0o700
+
+
+def test_private_dir_refuses_a_directory_others_can_write(tmp_path):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+    with pytest.raises(PermissionError):
+        private_dir(shared)
+
+
+def test_font_cache_is_off_by_default(font_cache_env):
+    font_cache_env.delenv("APP_FONT_CACHE_DIR", raising=False)
+    assert fonts._font_cache_dir() is None
+
+
+def test_font_cache_refuses_a_shared_directory(font_cache_env, tmp_path):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+    font_cache_env.setenv("APP_FONT_CACHE_DIR", str(shared))
+    assert fonts._font_cache_dir() is None
+
+
+def test_parsed_fonts_are_reused_from_the_cache(font_cache_env, tmp_path):
+    font_cache_env.setenv("APP_FONT_CACHE_DIR", str(tmp_path / "fonts"))
+    path = os.path.join(fonts._fonts_root(), fonts.FONTS["Roboto"]["bold"])
+
+    first = fonts._load_font("Roboto-Bold", path)
+    assert fonts.FONT_METRICS.loaded_from_cache["Roboto-Bold"] is False
+    assert len(list((tmp_path / "fonts").glob("*.pickle"))) == 1
+
+    second = fonts._load_font("Roboto-Bold", path)
+    assert fonts.FONT_METRICS.loaded_from_cache["Roboto-Bold"] is True
+    assert second.fontName == "Roboto-Bold"
+    assert second.face.charWidths == first.face.charWidths
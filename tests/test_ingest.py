@@ -0,0 +1,30 @@
+def stages(response) -> list[str]:
+    header = response.headers["server-timing"]
+    return [entry.split(";", 1)[0] for entry in header.split(", ")]
+
+
+def test_body_errors_are_reported_against_the_body(client):
+    response = client.post("/tailored_profile", content=b'{"job": {}, "resume": 1}')
+    assert response.status_code == 422
+    assert {tuple(error["loc"][:2]) for error in response.json()["detail"]} >= {
+        ("body", "job"),
+        ("body", "resume"),
+    }
+
+    malformed = client.post("/tailored_profile", content=b"{not json")
+    assert malformed.status_code == 422
+    assert malformed.json()["detail"][0]["loc"][0] == "body"
+
+
+def test_request_body_is_documented(client):
+    operation = client.get("/openapi.json").json()["paths"]["/tailored_profile"]
+    schema = operation["post"]["requestBody"]["content"]["application/json"]
+    assert set(schema["schema"]["properties"]) == {"job", "resume"}
+
+
+def test_server_timing_includes_validation(client, tailoring_request):
+    response = client.post(
+        "/tailored_profile", content=tailoring_request.model_dump_json()
+    )
+    assert response.status_code == 200
+    assert stages(response) == ["ingest", "llm", "assemble", "render"]
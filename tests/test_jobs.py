@@ -0,0 +1,353 @@
+import asyncio
+import time
+
+import pytest
+from pydantic import AnyHttpUrl
+
+from app.core.dependencies import get_job_queue
+from app.core.jobs import (
+    JobQueue,
+    JobQueueFull,
+    JobStatus,
+    MemoryJobBackend,
+    RenderJob,
+    SqliteJobBackend,
+    UnsafeWebhook,
+    resolve_webhook,
+)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryJobBackend()
+    else:
+        backend = SqliteJobBackend(tmp_path / "jobs.sqlite3", poll_interval=0.01)
+        yield backend
+        backend.close()
+
+
+def make_queue(backend, **options) -> JobQueue:
+    return JobQueue(
+        backend,
+        **{
+            "concurrency": 1,
+            "result_ttl_seconds": 60,
+            "max_queued": 100,
+            **options,
+        },
+    )
+
+
+async def wait_for(queue: JobQueue, job_id: str, timeout: float = 5.0) -> RenderJob:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = await queue.get(job_id)
+        if job.status in (JobStatus.succeeded, JobStatus.failed):
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+async def succeed(job, payload) -> dict:
+    return {"profile_id": "p", "etag": "e"}
+
+
+def test_max_queued_holds_under_concurrent_submits(backend, tailoring_request):
+    queue = make_queue(backend, max_queued=5)
+
+    async def scenario():
+        return await asyncio.gather(
+            *(
+                queue.submit(RenderJob(style="simple"), tailoring_request)
+                for _ in range(20)
+            ),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(scenario())
+    assert sum(isinstance(r, RenderJob) for r in results) == 5
+    assert sum(isinstance(r, JobQueueFull) for r in results) == 15
+    assert asyncio.run(backend.queued()) == 5
+
+
+def test_jobs_run_by_priority(backend, tailoring_request):
+    order = []
+
+    async def record(job, payload):
+        order.append(job.priority)
+        return {}
+
+    async def scenario():
+        queue = make_queue(backend)
+        jobs = [RenderJob(style="simple", priority=p) for p in (0, 5, 1)]
+        for job in jobs:
+            await queue.submit(job, tailoring_request)
+        await queue.start(record)
+        try:
+            for job in jobs:
+                await wait_for(queue, job.id)
+        finally:
+            await queue.stop()
+
+    asyncio.run(scenario())
+    assert order == [5, 1, 0]
+
+
+def test_failed_handler_marks_the_job_failed(backend, tailoring_request):
+    async def explode(job, payload):
+        raise RuntimeError("render exploded")
+
+    async def scenario():
+        queue = make_queue(backend)
+        job = await queue.submit(RenderJob(style="simple"), tailoring_request)
+        await queue.start(explode)
+        try:
+            return await wait_for(queue, job.id)
+        finally:
+            await queue.stop()
+
+    job = asyncio.run(scenario())
+    assert job.status == JobStatus.failed
+    assert job.error == "render exploded"
+    assert job.expires_at > job.finished_at
+
+
+class FlakyUpdates(MemoryJobBackend):
+    """Fails the first status update, as a locked or full database would."""
+
+    def __init__(self):
+        super().__init__()
+        self.failures = 1
+
+    async def update(self, job: RenderJob) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise OSError("disk I/O error")
+        await super().update(job)
+
+
+def test_worker_survives_a_backend_failure(tailoring_request):
+    async def scenario():
+        queue = make_queue(FlakyUpdates())
+        lost = await queue.submit(RenderJob(style="simple"), tailoring_request)
+        later = await queue.submit(RenderJob(style="simple"), tailoring_request)
+        await queue.start(succeed)
+        try:
+            later = await wait_for(queue, later.id)
+        finally:
+            await queue.stop()
+        return await queue.get(lost.id), later
+
+    lost, later = asyncio.run(scenario())
+    # The first result could not be stored, but the worker carried on.
+    assert lost.status == JobStatus.running
+    assert later.status == JobStatus.succeeded
+
+
+def test_finished_jobs_expire_and_are_purged(backend, tailoring_request):
+    async def scenario():
+        queue = make_queue(backend, result_ttl_seconds=0.05)
+        job = await queue.submit(RenderJob(style="simple"), tailoring_request)
+        await queue.start(succeed)
+        try:
+            await wait_for(queue, job.id)
+        finally:
+            await queue.stop()
+        await asyncio.sleep(0.1)
+        assert await queue.get(job.id) is None
+        assert await backend.purge(time.time()) == 1
+
+    asyncio.run(scenario())
+
+
+def test_sqlite_requeues_jobs_whose_lease_ran_out(tmp_path, tailoring_request):
+    path = tmp_path / "jobs.sqlite3"
+    first = SqliteJobBackend(path, lease_seconds=0.05)
+    second = SqliteJobBackend(path, lease_seconds=0.05)
+
+    async def scenario():
+        job = RenderJob(style="simple")
+        await first.put(job, tailoring_request, max_queued=10)
+        claimed, _ = await first.take()
+        assert claimed.id == job.id
+        # Claimed by the first process, so not available to the second.
+        assert second._claim() is None
+        await asyncio.sleep(0.1)
+        await second.recover()
+        reclaimed, payload = await second.take()
+        assert reclaimed.id == job.id
+        assert payload == tailoring_request
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        first.close()
+        second.close()
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "http://127.0.0.1/hook",
+        "http://10.1.2.3/hook",
+        "http://192.168.0.10:8080/hook",
+        "http://169.254.169.254/latest/meta-data",
+        "http://[::1]/hook",
+        "http://[::ffff:127.0.0.1]/hook",
+        "http://0.0.0.0/hook",
+        "http://localhost/hook",
+    ],
+)
+def test_webhooks_to_non_public_addresses_are_refused(url):
+    with pytest.raises(UnsafeWebhook):
+        asyncio.run(resolve_webhook(AnyHttpUrl(url)))
+
+
+def test_webhooks_to_public_addresses_are_allowed():
+    address = asyncio.run(resolve_webhook(AnyHttpUrl("https://93.184.215.14/hook")))
+    assert address == "93.184.215.14"
+
+
+def test_webhook_allowlist_is_exclusive():
+    allowed = frozenset({"127.0.0.1"})
+    assert asyncio.run(resolve_webhook(AnyHttpUrl("http://127.0.0.1/h"), allowed))
+    with pytest.raises(UnsafeWebhook):
+        asyncio.run(resolve_webhook(AnyHttpUrl("https://93.184.215.14/hook"), allowed))
+
+
+def test_webhook_is_delivered_and_failures_do_not_stop_the_queue(
+    tailoring_request,
+):
+    received = []
+
+    async def handle(reader, writer):
+        head = await reader.readuntil(b"\r\n\r\n")
+        length = next(
+            int(line.split(b":", 1)[1])
+            for line in head.split(b"\r\n")
+            if line.lower().startswith(b"content-length:")
+        )
+        received.append((head, await reader.readexactly(length)))
+        writer.write(b"HTTP/1.1 204 No Content\r\nContent-Length: 0\r\n\r\n")
+        await writer.drain()
+        writer.close()
+
+    async def scenario():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        queue = make_queue(
+            MemoryJobBackend(), webhook_allowed_hosts=frozenset({"127.0.0.1"})
+        )
+        await queue.start(succeed)
+        try:
+            # Nothing listens on port 9; the job still finishes.
+            unreachable = RenderJob(
+                style="simple", webhook_url=AnyHttpUrl("http://127.0.0.1:9/hook")
+            )
+            delivered = RenderJob(
+                style="simple",
+                webhook_url=AnyHttpUrl(f"http://127.0.0.1:{port}/hook"),
+            )
+            for job in (unreachable, delivered):
+                await queue.submit(job, tailoring_request)
+            for job in (unreachable, delivered):
+                assert (await wait_for(queue, job.id)).status == JobStatus.succeeded
+            for _ in range(100):
+                if received:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await queue.stop()
+            server.close()
+        return delivered
+
+    delivered = asyncio.run(scenario())
+    [(head, body)] = received
+    assert head.startswith(b"POST /hook HTTP/1.1")
+    assert RenderJob.model_validate_json(body).id == delivered.id
+
+
+def poll(client, url: str, timeout: float = 10.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = client.get(url).json()
+        if job["status"] in ("succeeded", "failed"):
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"{url} did not finish")
+
+
+def test_submit_poll_and_download(client, tailoring_request):
+    response = client.post(
+        "/jobs",
+        params={"style": "vibrant"},
+        content=tailoring_request.model_dump_json(),
+    )
+    assert response.status_code == 202
+    submitted = response.json()
+    assert response.headers["location"].endswith(f"/jobs/{submitted['id']}")
+
+    job = poll(client, response.headers["location"])
+    assert job["status"] == "succeeded"
+    pdf = client.get(submitted["result_url"])
+    assert pdf.status_code == 200
+    assert pdf.content.startswith(b"%PDF-")
+    cached = client.get(
+        submitted["result_url"], headers={"If-None-Match": pdf.headers["etag"]}
+    )
+    assert cached.status_code == 304
+
+
+def test_unsafe_webhook_is_422(client, tailoring_request):
+    response = client.post(
+        "/jobs",
+        params={"webhook_url": "http://169.254.169.254/latest/meta-data"},
+        content=tailoring_request.model_dump_json(),
+    )
+    assert response.status_code == 422
+
+
+def test_unknown_job_is_404(client):
+    assert client.get("/jobs/missing").status_code == 404
+    assert client.get("/jobs/missing/pdf").status_code == 404
+
+
+@pytest.fixture
+def idle_queue(client) -> JobQueue:
+    # No workers, so submitted jobs stay queued.
+    queue = make_queue(MemoryJobBackend(), max_queued=1)
+    client.app.dependency_overrides[get_job_queue] = lambda: queue
+    return queue
+
+
+def test_full_queue_is_503(client, idle_queue, tailoring_request):
+    body = tailoring_request.model_dump_json()
+    first = client.post("/jobs", content=body)
+    assert first.status_code == 202
+
+    response = client.post("/jobs", content=body)
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "5"
+
+    pending = client.get(first.json()["result_url"])
+    assert pending.status_code == 409
+    assert pending.headers["retry-after"] == "2"
+
+
+def test_download_of_failed_and_expired_jobs(client, idle_queue):
+    failed = RenderJob(style="simple", status=JobStatus.failed, error="boom")
+    expired = RenderJob(
+        style="simple",
+        status=JobStatus.succeeded,
+        profile_id="0" * 32,
+        etag="0" * 64,
+        expires_at=time.time() + 60,
+    )
+    for job in (failed, expired):
+        asyncio.run(idle_queue.backend.update(job))
+
+    response = client.get(f"/jobs/{failed.id}/pdf")
+    assert response.status_code == 409
+    assert response.json()["detail"] == "Job failed: boom"
+    assert client.get(f"/jobs/{expired.id}/pdf").status_code == 410
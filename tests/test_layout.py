@@ -0,0 +1,81 @@
+import pytest
+
+from app.core.layout import measure_layout
+from app.core.pdf_generator import TemplateNotFound, generate_pdf
+
+TEMPLATES = ("simple", "vibrant", "elegant")
+LEVELS = ("junior", "mid", "senior")
+
+
+@pytest.mark.parametrize("template", TEMPLATES)
+@pytest.mark.parametrize("level", LEVELS)
+def test_dry_run_matches_the_rendered_page_count(fixtures, template, level):
+    resume = fixtures.resumes[level]
+    report = measure_layout(resume, template)
+    _, stats = generate_pdf(resume, template)
+    assert report.pages == stats.pages
+
+
+@pytest.mark.parametrize("template", TEMPLATES)
+@pytest.mark.parametrize("level", LEVELS)
+def test_fixtures_do_not_overflow(fixtures, template, level):
+    report = measure_layout(fixtures.resumes[level], template)
+    assert report.overflows == []
+    assert report.frames[0].page == 1
+    assert all(0 <= f.used <= f.available + 1 for f in report.frames)
+
+
+def test_sidebar_running_into_the_next_column_is_an_overflow(fixtures):
+    senior = fixtures.resumes["senior"]
+    crowded = senior.model_copy(
+        update={"skills": senior.skills * 8, "languages": senior.languages * 8}
+    )
+    report = measure_layout(crowded, "elegant")
+    assert (1, "left") in {(f.page, f.frame) for f in report.overflows}
+
+
+@pytest.mark.parametrize("template", ["vibrant", "elegant"])
+@pytest.mark.parametrize("level", ["junior", "mid"])
+def test_header_taller_than_its_frame_does_not_skip_the_body(fixtures, template, level):
+    resume = fixtures.resumes[level]
+    wrapping = resume.model_copy(
+        update={"professional_title": "Platform and Reliability Engineering " * 4}
+    )
+    _, expected = generate_pdf(resume, template)
+    _, stats = generate_pdf(wrapping, template)
+    assert stats.pages == expected.pages
+
+    report = measure_layout(wrapping, template)
+    assert report.pages == stats.pages
+    # The spill is reported, and page 1 still carries the body.
+    assert [(f.page, f.frame) for f in report.overflows] == [(1, "header")]
+    body = [f for f in report.frames if f.page == 1 and f.frame != "header"]
+    assert max(f.used for f in body) > 0.5 * body[0].available
+
+
+def test_sections_are_measured(fixtures):
+    report = measure_layout(fixtures.resumes["senior"], "simple")
+    assert "header" in report.sections
+    assert all(height > 0 for height in report.sections.values())
+
+
+def test_unknown_template_is_refused(fixtures):
+    with pytest.raises(TemplateNotFound):
+        measure_layout(fixtures.resumes["junior"], "nope")
+
+
+def test_layout_endpoint(client, tailoring_request):
+    created = client.post(
+        "/tailored_profiles", content=tailoring_request.model_dump_json()
+    )
+    profile_id = created.json()["id"]
+
+    response = client.get(
+        f"/tailored_profiles/{profile_id}/layout", params={"style": "elegant"}
+    )
+    assert response.status_code == 200
+    report = response.json()
+    assert report["template"] == "elegant"
+    assert report["pages"] >= 1
+    assert {frame["frame"] for frame in report["frames"]} >= {"header", "left"}
+    assert not any(frame["overflowed"] for frame in report["frames"])
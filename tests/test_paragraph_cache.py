@@ -0,0 +1,103 @@
+import pytest
+from reportlab import rl_config
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.platypus import Paragraph
+
+from app.core.pdf_generator import generate_pdf
+from app.fonts import ensure_fonts
+from app.templates.helpers.paragraphs import (
+    CachedParagraph,
+    ParagraphCache,
+    get_paragraph_cache,
+    style_key,
+    track_paragraph_cache,
+)
+
+TEXT = (
+    "Built <b>streaming</b> pipelines in <i>Kafka</i> &amp; Spark, cutting "
+    "end-to-end latency from minutes to seconds across forty services."
+)
+
+
+def lines(paragraph) -> list[list[str]]:
+    return [[frag.text for frag in line.words] for line in paragraph.blPara.lines]
+
+
+@pytest.fixture
+def style():
+    ensure_fonts()
+    return ParagraphStyle("body", fontName="Roboto", fontSize=10, leading=13)
+
+
+@pytest.fixture(autouse=True)
+def cold_cache():
+    get_paragraph_cache().clear()
+    yield
+    get_paragraph_cache().clear()
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ParagraphCache(max_entries=2)
+    cache.put(("a",), 1)
+    cache.put(("b",), 2)
+    cache.get("parse", ("a",))
+    cache.put(("c",), 3)
+    assert cache.get("parse", ("b",)) is None
+    assert cache.get("parse", ("a",)) == 1
+
+    disabled = ParagraphCache(max_entries=0)
+    disabled.put(("a",), 1)
+    assert disabled.get("parse", ("a",)) is None
+
+
+def test_equal_styles_share_a_key(style):
+    same = ParagraphStyle("other", fontName="Roboto", fontSize=10, leading=13)
+    bigger = ParagraphStyle("body", fontName="Roboto", fontSize=11, leading=13)
+    assert style_key(style) == style_key(same)
+    assert style_key(style) != style_key(bigger)
+
+
+def test_cached_paragraph_wraps_like_a_paragraph(style):
+    plain = Paragraph(TEXT, style)
+    expected = plain.wrap(200, 1000)
+
+    with track_paragraph_cache() as counter:
+        first = CachedParagraph(TEXT, style)
+        assert first.wrap(200, 1000) == expected
+        second = CachedParagraph(TEXT, style)
+        assert second.wrap(200, 1000) == expected
+
+    assert counter == {
+        ("parse", "miss"): 1,
+        ("wrap", "miss"): 1,
+        ("parse", "hit"): 1,
+        ("wrap", "hit"): 1,
+    }
+    assert lines(second) == lines(plain)
+
+
+def test_cached_paragraph_splits_like_a_paragraph(style):
+    plain = Paragraph(TEXT, style)
+    plain.wrap(200, 1000)
+    cached = CachedParagraph(TEXT, style)
+    cached.wrap(200, 1000)
+
+    halves = cached.split(200, 30)
+    assert len(halves) == len(plain.split(200, 30)) == 2
+    assert [h.wrap(200, 1000) for h in halves] == [
+        h.wrap(200, 1000) for h in plain.split(200, 30)
+    ]
+
+
+@pytest.mark.parametrize("template", ["simple", "vibrant", "elegant"])
+def test_warm_cache_renders_the_same_pdf(fixtures, template, monkeypatch):
+    monkeypatch.setattr(rl_config, "invariant", 1)
+    senior = fixtures.resumes["senior"]
+
+    cold, cold_stats = generate_pdf(senior, template)
+    warm, warm_stats = generate_pdf(senior, template)
+
+    assert warm == cold
+    assert cold_stats.paragraph_cache.get(("parse", "hit"), 0) < (
+        warm_stats.paragraph_cache[("parse", "hit")]
+    )
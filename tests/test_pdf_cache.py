@@ -0,0 +1,121 @@
+import os
+
+from app.core.pdf_cache import PdfCache, pdf_cache_key
+from app.core.pdf_generator import DEFAULT_MARGINS, DEFAULT_PAGESIZE
+
+
+def key(n: int) -> str:
+    return f"{n:064x}"
+
+
+def age(cache: PdfCache, k: str, seconds: float, suffix: str = ".pdf") -> None:
+    path = cache._path(k, suffix)
+    st = path.stat()
+    os.utime(path, (st.st_atime - seconds, st.st_mtime - seconds))
+
+
+def test_key_depends_on_content_template_and_fit(fixtures):
+    junior, senior = fixtures.resumes["junior"], fixtures.resumes["senior"]
+    layout = (DEFAULT_PAGESIZE, DEFAULT_MARGINS)
+    assert pdf_cache_key(junior, "simple", *layout) == pdf_cache_key(
+        junior.model_copy(), "simple", *layout
+    )
+    keys = {
+        pdf_cache_key(junior, "simple", *layout),
+        pdf_cache_key(senior, "simple", *layout),
+        pdf_cache_key(junior, "vibrant", *layout),
+        pdf_cache_key(junior, "simple", *layout, max_pages=1),
+    }
+    assert len(keys) == 4
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = PdfCache(max_bytes=30)
+    for n in range(3):
+        cache.put(key(n), bytes(10))
+    cache.get(key(0))
+    cache.put(key(3), bytes(10))
+
+    assert cache.get(key(1)) is None
+    assert cache.get(key(0)) is not None
+    assert cache.size == 30
+
+
+def test_memory_tier_skips_entries_larger_than_the_budget():
+    cache = PdfCache(max_bytes=10)
+    cache.put(key(0), bytes(11))
+    assert cache.get(key(0)) is None
+    assert cache.size == 0
+
+
+def test_disk_tier_is_shared_and_keeps_suffixes_apart(tmp_path):
+    PdfCache(max_bytes=0, directory=tmp_path).put(key(0), b"pdf")
+    PdfCache(max_bytes=0, directory=tmp_path).put(key(0), b"png", ".240.png")
+
+    other = PdfCache(max_bytes=1024, directory=tmp_path)
+    assert other.get(key(0)) == b"pdf"
+    assert other.get(key(0), ".240.png") == b"png"
+    assert other.get(key(1)) is None
+
+
+def test_sweep_removes_oldest_files_down_to_the_budget(tmp_path):
+    cache = PdfCache(max_bytes=0, directory=tmp_path)
+    for n in range(5):
+        cache.put(key(n), bytes(100))
+        age(cache, key(n), 100 - n)
+    # Reading a file counts as using it.
+    assert cache.get(key(0)) is not None
+
+    cache.disk_max_bytes = 350
+    assert cache.sweep() == 200
+    assert [n for n in range(5) if cache._path(key(n), ".pdf").exists()] == [0, 3, 4]
+
+
+def test_sweep_is_a_no_op_within_budget_or_without_one(tmp_path):
+    cache = PdfCache(max_bytes=0, directory=tmp_path, disk_max_bytes=1000)
+    cache.put(key(0), bytes(100))
+    assert cache.sweep() == 0
+    cache.disk_max_bytes = None
+    assert cache.sweep() == 0
+
+
+def test_puts_trigger_a_sweep_once_a_tenth_of_the_budget_is_written(tmp_path):
+    cache = PdfCache(max_bytes=0, directory=tmp_path, disk_max_bytes=1000)
+    for n in range(20):
+        cache.put(key(n), bytes(100))
+        age(cache, key(n), 100 - n)
+
+    on_disk = sum(p.stat().st_size for p in tmp_path.glob("*/*"))
+    assert on_disk <= 1000
+    assert cache._path(key(19), ".pdf").exists()
+    assert not cache._path(key(0), ".pdf").exists()
+
+
+def test_existing_directory_is_swept_at_startup(tmp_path):
+    cache = PdfCache(max_bytes=0, directory=tmp_path)
+    for n in range(4):
+        cache.put(key(n), bytes(100))
+
+    PdfCache(max_bytes=0, directory=tmp_path, disk_max_bytes=200)
+    assert sum(p.stat().st_size for p in tmp_path.glob("*/*")) <= 200
+
+
+def test_example_resume_etag_and_if_none_match(client):
+    first = client.get("/example-resume", params={"level": "mid"})
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    again = client.get(
+        "/example-resume", params={"level": "mid"}, headers={"If-None-Match": etag}
+    )
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == etag
+
+    other = client.get(
+        "/example-resume",
+        params={"level": "mid", "style": "elegant"},
+        headers={"If-None-Match": etag},
+    )
+    assert other.status_code == 200
+    assert other.headers["etag"] != etag
@@ -0,0 +1,138 @@
+import struct
+import sys
+
+import pytest
+
+from app.core.document import Document, Section, TextBlock, TextRun, build_document
+from app.core.pdf_generator import TemplateNotFound
+from app.core.preview import render_html
+
+
+def png_size(png: bytes) -> tuple[int, int]:
+    assert png.startswith(b"\x89PNG\r\n\x1a\n")
+    return struct.unpack(">II", png[16:24])
+
+
+def block(*runs: TextRun) -> TextBlock:
+    return TextBlock(
+        role="body", runs=runs, font="Roboto", font_size=10, leading=13, color="#000000"
+    )
+
+
+@pytest.mark.parametrize("template", ["simple", "vibrant", "elegant"])
+def test_document_follows_the_template_story(fixtures, template):
+    document = build_document(fixtures.resumes["senior"], template)
+    assert document.title == fixtures.resumes["senior"].fullname
+    assert document.sections[0].key == "header"
+    keys = [section.key for section in document.sections]
+    assert len(keys) == len(set(keys))
+    text = " ".join(
+        run.text
+        for section in document.sections
+        for item in section.blocks
+        if isinstance(item, TextBlock)
+        for run in item.runs
+    )
+    assert fixtures.resumes["senior"].fullname in text
+
+
+def test_unknown_template_is_refused(fixtures):
+    with pytest.raises(TemplateNotFound):
+        build_document(fixtures.resumes["junior"], "nope")
+
+
+def test_html_escapes_text_and_drops_unsafe_links():
+    document = Document(
+        template="simple",
+        title="<Ada>",
+        sections=[
+            Section(
+                "header",
+                [
+                    block(TextRun("<script>alert(1)</script>")),
+                    block(
+                        TextRun("home", link="https://example.com/?a=1&b=2"),
+                        TextRun("evil", link="javascript:alert(1)"),
+                        TextRun("bold", bold=True, italic=True, color="#FF0000"),
+                    ),
+                ],
+            )
+        ],
+    )
+    html = render_html(document)
+    assert "<script>" not in html
+    assert "&lt;script&gt;" in html
+    assert "<title>&lt;Ada&gt;</title>" in html
+    assert '<a href="https://example.com/?a=1&amp;b=2">home</a>' in html
+    assert "javascript:" not in html
+    assert '<span style="color:#FF0000"><i><b>bold</b></i></span>' in html
+
+
+@pytest.mark.parametrize("style", ["simple", "vibrant", "elegant"])
+def test_example_preview(client, fixtures, style):
+    response = client.get(
+        "/example-resume/preview", params={"style": style, "level": "mid"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert f'<body class="{style}">' in response.text
+    assert fixtures.resumes["mid"].fullname in response.text
+
+
+def test_stored_profile_preview(client, tailoring_request):
+    created = client.post(
+        "/tailored_profiles", content=tailoring_request.model_dump_json()
+    )
+    profile_id = created.json()["id"]
+    response = client.get(f"/tailored_profiles/{profile_id}/preview")
+    assert response.status_code == 200
+    assert tailoring_request.resume.fullname in response.text
+
+
+def test_example_thumbnail(client):
+    pytest.importorskip("pypdfium2")
+    response = client.get("/example-resume/thumbnail", params={"width": 200})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+    width, height = png_size(response.content)
+    assert width == 200
+    assert height > width
+
+    etag = response.headers["etag"]
+    assert etag.endswith('.200"')
+    cached = client.get(
+        "/example-resume/thumbnail",
+        params={"width": 200},
+        headers={"If-None-Match": etag},
+    )
+    assert cached.status_code == 304
+    other = client.get("/example-resume/thumbnail", params={"width": 100})
+    assert png_size(other.content)[0] == 100
+    assert other.headers["etag"] != etag
+
+
+def test_stored_profile_thumbnail(client, tailoring_request):
+    pytest.importorskip("pypdfium2")
+    created = client.post(
+        "/tailored_profiles", content=tailoring_request.model_dump_json()
+    )
+    profile_id = created.json()["id"]
+    response = client.get(
+        f"/tailored_profiles/{profile_id}/thumbnail", params={"style": "elegant"}
+    )
+    assert response.status_code == 200
+    assert png_size(response.content)[0] == 240
+
+
+@pytest.mark.parametrize("width", [10, 5000])
+def test_thumbnail_width_is_bounded(client, width):
+    response = client.get("/example-resume/thumbnail", params={"width": width})
+    assert response.status_code == 422
+
+
+def test_thumbnail_without_the_extra_is_501(client, monkeypatch):
+    # What an install without the 'thumbnails' extra sees.
+    monkeypatch.setitem(sys.modules, "pypdfium2", None)
+    response = client.get("/example-resume/thumbnail")
+    assert response.status_code == 501
+    assert "thumbnails" in response.json()["detail"]
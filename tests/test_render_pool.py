@@ -0,0 +1,127 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.core.config import RenderSettings
+from app.core.dependencies import get_render_pool, get_render_settings
+from app.core.metrics import FONT_LOAD_SECONDS, FONT_SUBSET_REQUESTS, PDF_FONT_BYTES
+from app.core.pdf_generator import generate_pdf
+from app.core.render_pool import RenderPool, RenderPoolSaturated, RenderTimeout
+
+
+@pytest.fixture
+def pool():
+    pool = RenderPool(
+        RenderSettings(executor="thread", workers=1, max_queue=0, timeout_seconds=0.2)
+    )
+    yield pool
+    pool.shutdown(wait=False)
+
+
+def test_render_returns_a_pdf(pool, fixtures):
+    pdf = asyncio.run(pool.render(fixtures.resumes["junior"], "simple"))
+    assert pdf.startswith(b"%PDF-")
+    assert pool.in_flight == 0
+
+
+def test_font_figures_from_worker_processes_are_recorded_here(fixtures):
+    pool = RenderPool(
+        RenderSettings(executor="process", workers=1, max_queue=0, timeout_seconds=60)
+    )
+    loads = FONT_LOAD_SECONDS.count(font="Roboto", source="ttf")
+    embedded = PDF_FONT_BYTES.count(template="simple")
+    hits = FONT_SUBSET_REQUESTS.value(result="hit")
+
+    async def scenario():
+        font_seconds = await pool.warm(fixtures.resumes["junior"])
+        await pool.render(fixtures.resumes["junior"], "simple")
+        return font_seconds
+
+    try:
+        font_seconds = asyncio.run(scenario())
+    finally:
+        pool.shutdown()
+
+    # Only the worker process parsed the fonts.
+    assert font_seconds > 0
+    assert FONT_LOAD_SECONDS.count(font="Roboto", source="ttf") == loads + 1
+    assert PDF_FONT_BYTES.count(template="simple") == embedded + 1
+    # The warm-up already subset the same glyphs.
+    assert FONT_SUBSET_REQUESTS.value(result="hit") > hits
+
+
+def test_render_stats_carry_font_figures(fixtures):
+    _, stats = generate_pdf(fixtures.resumes["junior"], "vibrant")
+    assert stats.embedded_font_bytes > 0
+    assert sum(stats.font_subsets.values()) > 0
+    # Loads are reported once per process, by whichever render comes first.
+    _, again = generate_pdf(fixtures.resumes["junior"], "vibrant")
+    assert again.font_loads == []
+
+
+def test_rejects_work_beyond_capacity(pool):
+    release = threading.Event()
+
+    async def scenario():
+        first = asyncio.create_task(pool.run(release.wait, 5))
+        await asyncio.sleep(0)
+        with pytest.raises(RenderPoolSaturated):
+            await pool.run(release.wait, 5)
+        release.set()
+        assert await first is True
+
+    asyncio.run(scenario())
+
+
+def test_timed_out_render_keeps_its_slot_until_it_finishes(pool):
+    release = threading.Event()
+
+    async def scenario():
+        with pytest.raises(RenderTimeout):
+            await pool.run(release.wait, 5)
+        # The worker is still busy, so the pool is still full.
+        assert pool.in_flight == 1
+        with pytest.raises(RenderPoolSaturated):
+            await pool.run(lambda: None)
+        release.set()
+        for _ in range(100):
+            if pool.in_flight == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert pool.in_flight == 0
+        assert await pool.run(lambda: "done") == "done"
+
+    asyncio.run(scenario())
+
+
+def test_example_resume_renders_off_the_event_loop(client):
+    response = client.get("/example-resume", params={"style": "vibrant"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.content.startswith(b"%PDF-")
+    assert response.headers["content-length"] == str(len(response.content))
+
+
+def test_slow_render_is_504(client, monkeypatch):
+    monkeypatch.setenv("RENDER_TIMEOUT_SECONDS", "0.001")
+    get_render_settings.cache_clear()
+    get_render_pool.cache_clear()
+    response = client.get("/example-resume", params={"level": "senior"})
+    assert response.status_code == 504
+
+
+def test_saturated_pool_is_503(client, monkeypatch):
+    monkeypatch.setenv("RENDER_WORKERS", "1")
+    monkeypatch.setenv("RENDER_MAX_QUEUE", "0")
+    get_render_settings.cache_clear()
+    get_render_pool.cache_clear()
+    release = threading.Event()
+    busy = client.portal.start_task_soon(get_render_pool().run, release.wait, 5)
+    try:
+        response = client.get("/example-resume")
+    finally:
+        release.set()
+        busy.result()
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
@@ -0,0 +1,165 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.ai.config import OpenAISettings
+from app.ai.resilience import ResilientCaller, TokenBucket, _retry_after
+
+
+def settings(**overrides) -> OpenAISettings:
+    defaults = {
+        "openai_api_key": "test",
+        "openai_retry_base_delay": 0,
+        "openai_retry_max_delay": 0,
+    }
+    return OpenAISettings(**defaults | overrides)
+
+
+def flaky(failures: int, error: type[BaseException] = TimeoutError):
+    calls = []
+
+    async def factory():
+        calls.append(time.monotonic())
+        if len(calls) <= failures:
+            raise error()
+        return "ok"
+
+    return factory, calls
+
+
+def test_retries_retryable_errors_until_success():
+    factory, calls = flaky(2)
+    caller = ResilientCaller(settings(openai_max_retries=3))
+    assert asyncio.run(caller.call("summary", factory)) == "ok"
+    assert len(calls) == 3
+
+
+def test_gives_up_after_max_retries():
+    factory, calls = flaky(10)
+    caller = ResilientCaller(settings(openai_max_retries=2))
+    with pytest.raises(TimeoutError):
+        asyncio.run(caller.call("summary", factory))
+    assert len(calls) == 3
+
+
+def test_other_errors_are_not_retried():
+    factory, calls = flaky(1, ValueError)
+    caller = ResilientCaller(settings(openai_max_retries=3))
+    with pytest.raises(ValueError):
+        asyncio.run(caller.call("summary", factory))
+    assert len(calls) == 1
+
+
+def test_each_attempt_has_its_own_timeout():
+    calls = 0
+
+    async def slow_then_fast():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(1 if calls == 1 else 0)
+        return calls
+
+    caller = ResilientCaller(
+        settings(openai_timeout_seconds=0.05, openai_max_retries=1)
+    )
+    assert asyncio.run(caller.call("summary", slow_then_fast)) == 2
+
+
+def test_total_deadline_bounds_retries_and_backoff():
+    async def hang():
+        await asyncio.sleep(10)
+
+    caller = ResilientCaller(
+        settings(
+            openai_timeout_seconds=0.1,
+            openai_max_retries=50,
+            openai_total_deadline_seconds=0.35,
+        )
+    )
+    started = time.monotonic()
+    with pytest.raises(TimeoutError):
+        asyncio.run(caller.call("summary", hang))
+    assert time.monotonic() - started < 0.6
+
+
+def test_backoff_that_would_pass_the_deadline_is_not_slept():
+    class SlowDown(TimeoutError):
+        response = SimpleNamespace(headers={"retry-after": "5"})
+
+    factory, calls = flaky(10, SlowDown)
+    caller = ResilientCaller(
+        settings(
+            openai_max_retries=5,
+            openai_retry_max_delay=10,
+            openai_total_deadline_seconds=1,
+        )
+    )
+    started = time.monotonic()
+    with pytest.raises(SlowDown):
+        asyncio.run(caller.call("summary", factory))
+    assert len(calls) == 1
+    assert time.monotonic() - started < 0.5
+
+
+def test_retry_after_headers_are_honoured():
+    def err(**headers):
+        return SimpleNamespace(response=SimpleNamespace(headers=headers))
+
+    assert _retry_after(err(**{"retry-after-ms": "250"})) == 0.25
+    assert _retry_after(err(**{"retry-after": "2"})) == 2.0
+    assert _retry_after(err(**{"retry-after": "soon"})) is None
+    assert _retry_after(ValueError()) is None
+
+    caller = ResilientCaller(settings(openai_retry_max_delay=1))
+    assert caller._backoff(0, err(**{"retry-after": "0.5"})) == 0.5
+    assert caller._backoff(0, err(**{"retry-after": "30"})) == 1
+
+
+def test_slow_calls_are_hedged():
+    calls = 0
+
+    async def first_one_hangs():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(10 if calls == 1 else 0)
+        return calls
+
+    caller = ResilientCaller(
+        settings(openai_hedge_after_seconds=0.05, openai_hedge_calls={"exp_edu"})
+    )
+    started = time.monotonic()
+    assert asyncio.run(caller.call("exp_edu", first_one_hangs)) == 2
+    assert time.monotonic() - started < 1
+
+
+def test_concurrency_is_limited():
+    active = peak = 0
+
+    async def tracked():
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    caller = ResilientCaller(settings(openai_max_concurrency=2))
+
+    async def scenario():
+        await asyncio.gather(*(caller.call("summary", tracked) for _ in range(6)))
+
+    asyncio.run(scenario())
+    assert peak == 2
+
+
+def test_token_bucket_paces_requests():
+    bucket = TokenBucket(rate_per_second=20, capacity=1)
+
+    async def scenario():
+        for _ in range(3):
+            await bucket.acquire()
+
+    started = time.monotonic()
+    asyncio.run(scenario())
+    assert time.monotonic() - started >= 0.09
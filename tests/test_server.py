@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+from app.core.config import ServerSettings
+from app.server import configure_environment
+
+SHARED = (
+    "RENDER_CACHE_DIR",
+    "TAILORING_CACHE_DIR",
+    "PROFILE_STORE_DIR",
+    "JOBS_BACKEND",
+    "JOBS_SQLITE_PATH",
+    "APP_FONT_CACHE_DIR",
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for name in (*SHARED, "RENDER_WORKERS", "JOBS_DRAIN_SECONDS"):
+        monkeypatch.delenv(name, raising=False)
+
+
+def test_single_worker_without_a_data_dir_keeps_state_in_memory():
+    configure_environment(ServerSettings(data_dir=None), workers=1)
+    assert not any(name in os.environ for name in SHARED)
+    assert int(os.environ["RENDER_WORKERS"]) >= 1
+
+
+def test_several_workers_need_a_data_dir():
+    with pytest.raises(SystemExit):
+        configure_environment(ServerSettings(data_dir=None), workers=2)
+
+
+def test_data_dir_is_private_and_holds_shared_state(tmp_path):
+    data_dir = tmp_path / "data"
+    configure_environment(ServerSettings(data_dir=data_dir), workers=2)
+    assert data_dir.stat().st_mode & 0o777 == 0o700
+    assert os.environ["JOBS_BACKEND"] == "sqlite"
+    for name in SHARED:
+        if name != "JOBS_BACKEND":
+            assert os.environ[name].startswith(str(data_dir))
+
+
+def test_shared_data_dir_is_refused(tmp_path):
+    tmp_path.chmod(0o777)
+    with pytest.raises(PermissionError):
+        configure_environment(ServerSettings(data_dir=tmp_path), workers=2)
+
+
+def test_explicit_settings_win(tmp_path, monkeypatch):
+    monkeypatch.setenv("JOBS_BACKEND", "memory")
+    configure_environment(ServerSettings(data_dir=tmp_path / "data"), workers=1)
+    assert os.environ["JOBS_BACKEND"] == "memory"
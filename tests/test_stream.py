@@ -0,0 +1,62 @@
+import json
+
+from app.ai.dependencies import get_openai_client
+from app.router import sse_event
+
+
+def parse_events(body: str) -> list[tuple[str, str]]:
+    events = []
+    for chunk in body.strip().split("\n\n"):
+        lines = chunk.splitlines()
+        event = lines[0].removeprefix("event: ")
+        data = "\n".join(line.removeprefix("data: ") for line in lines[1:])
+        events.append((event, data))
+    return events
+
+
+def test_sse_event_splits_multiline_data():
+    assert sse_event("part", "a\nb") == b"event: part\ndata: a\ndata: b\n\n"
+    assert sse_event("part", "") == b"event: part\ndata: \n\n"
+
+
+def test_stream_sends_each_part_then_done(client, tailoring_request):
+    response = client.post(
+        "/tailored_profile/stream",
+        params={"style": "vibrant"},
+        content=tailoring_request.model_dump_json(),
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = parse_events(response.text)
+    names = [name for name, _ in events]
+    assert sorted(names[:-1]) == [
+        "experience_education",
+        "skills_projects_certificates",
+        "summary",
+    ]
+    assert names[-1] == "done"
+
+    done = json.loads(events[-1][1])
+    assert done["pdf_url"].endswith(
+        f"/tailored_profiles/{done['id']}/pdf?style=vibrant"
+    )
+    pdf = client.get(done["pdf_url"])
+    assert pdf.status_code == 200
+    assert pdf.content.startswith(b"%PDF-")
+
+
+def test_stream_reports_failures_as_an_error_event(
+    client, tailoring_request, make_openai_client, monkeypatch
+):
+    monkeypatch.setenv("OPENAI_MAX_RETRIES", "0")
+    failing = make_openai_client(error_rate=1.0)
+    client.app.dependency_overrides[get_openai_client] = lambda: failing
+
+    response = client.post(
+        "/tailored_profile/stream", content=tailoring_request.model_dump_json()
+    )
+    assert response.status_code == 200
+    event, data = parse_events(response.text)[-1]
+    assert event == "error"
+    assert "Injected failure" in json.loads(data)["detail"]
@@ -0,0 +1,138 @@
+import io
+import os
+import time
+import zipfile
+
+import pytest
+
+from app.core.profile_store import ProfileStore
+from app.models.tailored_profile import TailoredProfile
+
+
+@pytest.fixture
+def profile_id(client, tailoring_request) -> str:
+    response = client.post(
+        "/tailored_profiles", content=tailoring_request.model_dump_json()
+    )
+    assert response.status_code == 200
+    return response.json()["id"]
+
+
+def test_store_round_trips_through_disk(tmp_path, fixtures):
+    profile = TailoredProfile.model_validate(fixtures.resumes["junior"].model_dump())
+    profile_id = ProfileStore(60, 8, directory=tmp_path).save(profile)
+    assert ProfileStore(60, 8, directory=tmp_path).get(profile_id) == profile
+    assert ProfileStore(60, 8, directory=tmp_path).get("../etc/passwd") is None
+
+
+def test_store_forgets_expired_and_evicted_profiles(fixtures):
+    profile = TailoredProfile.model_validate(fixtures.resumes["junior"].model_dump())
+    store = ProfileStore(ttl_seconds=60, max_entries=1)
+    first, second = store.save(profile), store.save(profile)
+    assert store.get(first) is None
+    assert store.get(second) == profile
+
+    short = ProfileStore(ttl_seconds=0.05, max_entries=8)
+    profile_id = short.save(profile)
+    time.sleep(0.1)
+    assert short.get(profile_id) is None
+
+
+def test_store_writes_atomically_and_skips_unreadable_files(tmp_path, fixtures):
+    profile = TailoredProfile.model_validate(fixtures.resumes["junior"].model_dump())
+    store = ProfileStore(60, 8, directory=tmp_path)
+    profile_id = store.save(profile)
+    assert [p.name for p in tmp_path.iterdir()] == [f"{profile_id}.json"]
+
+    (tmp_path / "0badc0de.json").write_text('{"fullname": "trunc')
+    assert store.get("0badc0de") is None
+
+
+def test_store_sweeps_expired_profiles_and_keeps_to_its_budget(tmp_path, fixtures):
+    profile = TailoredProfile.model_validate(fixtures.resumes["junior"].model_dump())
+    store = ProfileStore(60, 8, directory=tmp_path)
+    ids = [store.save(profile) for _ in range(4)]
+    for n, profile_id in enumerate(ids):
+        stale = time.time() - 100 + n
+        os.utime(tmp_path / f"{profile_id}.json", (stale, stale))
+
+    size = (tmp_path / f"{ids[0]}.json").stat().st_size
+    # Startup sweep: everything is past its TTL.
+    ProfileStore(10, 8, directory=tmp_path)
+    assert list(tmp_path.iterdir()) == []
+
+    budget = ProfileStore(60, 8, directory=tmp_path, disk_max_bytes=size * 10)
+    for _ in range(30):
+        budget.save(profile)
+    assert sum(p.stat().st_size for p in tmp_path.iterdir()) <= size * 10
+
+
+def test_create_and_read_profile(client, profile_id, tailoring_request):
+    response = client.get(f"/tailored_profiles/{profile_id}")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["id"] == profile_id
+    assert body["profile"]["fullname"] == tailoring_request.resume.fullname
+
+
+def test_render_one_style_as_pdf(client, profile_id):
+    response = client.get(
+        f"/tailored_profiles/{profile_id}/pdf", params={"style": "elegant"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.content.startswith(b"%PDF-")
+
+    cached = client.get(
+        f"/tailored_profiles/{profile_id}/pdf",
+        params={"style": "elegant"},
+        headers={"If-None-Match": response.headers["etag"]},
+    )
+    assert cached.status_code == 304
+
+
+def test_render_several_styles_as_zip(client, profile_id):
+    response = client.get(
+        f"/tailored_profiles/{profile_id}/pdf",
+        params=[("style", "simple"), ("style", "vibrant"), ("style", "simple")],
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        names = archive.namelist()
+        assert len(names) == 2
+        assert names[0].endswith("_simple.pdf")
+        assert names[1].endswith("_vibrant.pdf")
+        assert all(archive.read(name).startswith(b"%PDF-") for name in names)
+
+
+def test_download_names_come_from_a_sanitised_fullname(client, tailoring_request):
+    resume = tailoring_request.resume.model_copy(update={"fullname": "../../Ada/x"})
+    created = client.post(
+        "/tailored_profiles",
+        content=tailoring_request.model_copy(
+            update={"resume": resume}
+        ).model_dump_json(),
+    )
+    profile_id = created.json()["id"]
+
+    pdf = client.get(f"/tailored_profiles/{profile_id}/pdf")
+    assert 'filename="Ada_x_resume.pdf"' in pdf.headers["content-disposition"]
+    archive = client.get(
+        f"/tailored_profiles/{profile_id}/pdf",
+        params=[("style", "simple"), ("style", "elegant")],
+    )
+    with zipfile.ZipFile(io.BytesIO(archive.content)) as zf:
+        assert zf.namelist() == ["Ada_x_resume_simple.pdf", "Ada_x_resume_elegant.pdf"]
+
+
+@pytest.mark.parametrize("path", ["", "/pdf", "/layout", "/preview", "/thumbnail"])
+def test_unknown_profile_is_404(client, path):
+    response = client.get(f"/tailored_profiles/{'0' * 32}{path}")
+    assert response.status_code == 404
+
+
+def test_invalid_body_is_422(client):
+    response = client.post("/tailored_profiles", content=b'{"job": {}}')
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"][0] == "body"
@@ -0,0 +1,153 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from app.ai.cache import TailoringCache, tailoring_key
+from app.ai.dependencies import get_tailoring_cache
+from app.models.tailored_profile import TailoredSummary
+
+
+def summary(text: str) -> TailoredSummary:
+    return TailoredSummary(summary=text)
+
+
+def test_key_covers_every_input():
+    base = ("generate_tailored_summary", "gpt-5-mini", 1, "job", "profile")
+    variants = [
+        ("generate_tailored_exp_edu", "gpt-5-mini", 1, "job", "profile"),
+        ("generate_tailored_summary", "gpt-5", 1, "job", "profile"),
+        ("generate_tailored_summary", "gpt-5-mini", 2, "job", "profile"),
+        ("generate_tailored_summary", "gpt-5-mini", 1, "other", "profile"),
+        ("generate_tailored_summary", "gpt-5-mini", 1, "job", "other"),
+    ]
+    keys = {tailoring_key(*base)} | {tailoring_key(*v) for v in variants}
+    assert len(keys) == 6
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = TailoringCache(ttl_seconds=60, max_entries=2)
+    cache.put("a", summary("a"))
+    cache.put("b", summary("b"))
+    cache.get("a", TailoredSummary)
+    cache.put("c", summary("c"))
+
+    assert cache.get("b", TailoredSummary) is None
+    assert cache.get("a", TailoredSummary) == summary("a")
+    assert cache.get("c", TailoredSummary) == summary("c")
+
+
+def test_memory_entries_expire():
+    cache = TailoringCache(ttl_seconds=0.05, max_entries=8)
+    cache.put("a", summary("a"))
+    time.sleep(0.1)
+    assert cache.get("a", TailoredSummary) is None
+
+
+def test_disk_tier_stores_json_and_is_shared(tmp_path):
+    TailoringCache(ttl_seconds=60, max_entries=8, directory=tmp_path).put(
+        "ab12", summary("from disk")
+    )
+    assert (tmp_path / "ab" / "ab12.json").read_text() == (
+        summary("from disk").model_dump_json()
+    )
+
+    other = TailoringCache(ttl_seconds=60, max_entries=8, directory=tmp_path)
+    assert other.get("ab12", TailoredSummary) == summary("from disk")
+
+
+def test_disk_entries_expire_by_mtime(tmp_path):
+    cache = TailoringCache(ttl_seconds=60, max_entries=8, directory=tmp_path)
+    cache.put("ab12", summary("old"))
+    path = tmp_path / "ab" / "ab12.json"
+    stale = time.time() - 120
+    os.utime(path, (stale, stale))
+
+    other = TailoringCache(ttl_seconds=60, max_entries=8, directory=tmp_path)
+    assert other.get("ab12", TailoredSummary) is None
+    assert not path.exists()
+
+
+def test_sweep_removes_expired_files_then_the_oldest(tmp_path):
+    cache = TailoringCache(ttl_seconds=60, max_entries=8, directory=tmp_path)
+    for n in range(5):
+        key = f"ab{n}"
+        cache.put(key, summary("x" * 100))
+        stale = time.time() - (100 if n == 0 else 50 - n * 10)
+        os.utime(tmp_path / "ab" / f"{key}.json", (stale, stale))
+    size = (tmp_path / "ab" / "ab4.json").stat().st_size
+
+    # ab0 is past the TTL; of the rest, the oldest go until 90% of the budget.
+    cache.disk_max_bytes = size * 2.5
+    assert cache.sweep() == size * 3
+    assert sorted(p.name for p in tmp_path.glob("*/*")) == ["ab3.json", "ab4.json"]
+
+
+def test_puts_keep_the_disk_tier_within_its_budget(tmp_path):
+    cache = TailoringCache(
+        ttl_seconds=60, max_entries=8, directory=tmp_path, disk_max_bytes=2000
+    )
+    for n in range(100):
+        cache.put(f"{n:04x}", summary("x" * 100))
+    assert sum(p.stat().st_size for p in tmp_path.glob("*/*")) <= 2000
+
+
+def test_unreadable_disk_entries_are_misses(tmp_path):
+    (tmp_path / "ab").mkdir()
+    (tmp_path / "ab" / "ab12.json").write_text('{"not": "a summary"}')
+    (tmp_path / "ab" / "ab34.json").write_bytes(b"\x80\x04not json")
+
+    cache = TailoringCache(ttl_seconds=60, max_entries=8, directory=tmp_path)
+    assert cache.get("ab12", TailoredSummary) is None
+    assert cache.get("ab34", TailoredSummary) is None
+
+
+def test_concurrent_misses_share_one_upstream_call():
+    cache = TailoringCache(ttl_seconds=60, max_entries=8)
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return summary("shared")
+
+    async def scenario():
+        return await asyncio.gather(
+            *(cache.get_or_create("k", TailoredSummary, factory) for _ in range(5))
+        )
+
+    assert asyncio.run(scenario()) == [summary("shared")] * 5
+    assert calls == 1
+    assert (cache.misses, cache.hits) == (1, 4)
+
+
+def test_failures_are_not_cached():
+    cache = TailoringCache(ttl_seconds=60, max_entries=8)
+
+    async def failing():
+        raise RuntimeError("upstream down")
+
+    async def working():
+        return summary("ok")
+
+    async def scenario():
+        with pytest.raises(RuntimeError):
+            await cache.get_or_create("k", TailoredSummary, failing)
+        return await cache.get_or_create("k", TailoredSummary, working)
+
+    assert asyncio.run(scenario()) == summary("ok")
+
+
+def test_repeated_tailoring_is_served_from_the_cache(client, tailoring_request):
+    body = tailoring_request.model_dump_json()
+    first = client.post("/tailored_profile", content=body)
+    assert first.status_code == 200
+    cache = get_tailoring_cache()
+    assert (cache.misses, cache.hits) == (3, 0)
+
+    second = client.post("/tailored_profile", content=body)
+    assert second.status_code == 200
+    assert (cache.misses, cache.hits) == (3, 3)
+    assert second.headers["etag"] == first.headers["etag"]